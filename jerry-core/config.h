@@ -235,6 +235,19 @@
 # define JERRY_LCACHE 1
 #endif /* !defined (JERRY_LCACHE) */
 
+/**
+ * Enable/Disable the perfect hash based lookup of magic strings.
+ *
+ * Allowed values:
+ *  0: Look up magic strings with binary search.
+ *  1: Look up magic strings with a perfect hash (requires about 1.3KB constant data).
+ *
+ * Default value: 0
+ */
+#ifndef JERRY_LIT_MAGIC_STRING_HASH
+# define JERRY_LIT_MAGIC_STRING_HASH 0
+#endif /* !defined (JERRY_LIT_MAGIC_STRING_HASH) */
+
 /**
  * Enable/Disable line-info management inside the engine.
  *
@@ -626,6 +639,10 @@
 || ((JERRY_LCACHE != 0) && (JERRY_LCACHE != 1))
 # error "Invalid value for 'JERRY_LCACHE' macro."
 #endif
+#if !defined (JERRY_LIT_MAGIC_STRING_HASH) \
+|| ((JERRY_LIT_MAGIC_STRING_HASH != 0) && (JERRY_LIT_MAGIC_STRING_HASH != 1))
+# error "Invalid value for 'JERRY_LIT_MAGIC_STRING_HASH' macro."
+#endif
 #if !defined (JERRY_LINE_INFO) \
 || ((JERRY_LINE_INFO != 0) && (JERRY_LINE_INFO != 1))
 # error "Invalid value for 'JERRY_LINE_INFO' macro."
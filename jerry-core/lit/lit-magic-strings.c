@@ -45,12 +45,16 @@ lit_get_magic_string_utf8 (uint32_t id) /**< magic string id */
   static const lit_utf8_byte_t * const lit_magic_strings[] JERRY_ATTR_CONST_DATA =
   {
 /** @cond doxygen_suppress */
+#define LIT_MAGIC_STRING_HASH_DISPLACEMENT(displacement)
+#define LIT_MAGIC_STRING_HASH_SLOT(id)
 #define LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE(size, id)
 #define LIT_MAGIC_STRING_DEF(id, utf8_string) \
     (const lit_utf8_byte_t *) utf8_string,
 #include "lit-magic-strings.inc.h"
 #undef LIT_MAGIC_STRING_DEF
 #undef LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE
+#undef LIT_MAGIC_STRING_HASH_DISPLACEMENT
+#undef LIT_MAGIC_STRING_HASH_SLOT
 /** @endcond */
   };
 
@@ -70,12 +74,16 @@ lit_get_magic_string_size (uint32_t id) /**< magic string id */
   static const lit_magic_size_t lit_magic_string_sizes[] JERRY_ATTR_CONST_DATA =
   {
 /** @cond doxygen_suppress */
+#define LIT_MAGIC_STRING_HASH_DISPLACEMENT(displacement)
+#define LIT_MAGIC_STRING_HASH_SLOT(id)
 #define LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE(size, id)
 #define LIT_MAGIC_STRING_DEF(id, utf8_string) \
     sizeof(utf8_string) - 1,
 #include "lit-magic-strings.inc.h"
 #undef LIT_MAGIC_STRING_DEF
 #undef LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE
+#undef LIT_MAGIC_STRING_HASH_DISPLACEMENT
+#undef LIT_MAGIC_STRING_HASH_SLOT
 /** @endcond */
   };
 
@@ -84,6 +92,8 @@ lit_get_magic_string_size (uint32_t id) /**< magic string id */
   return lit_magic_string_sizes[id];
 } /* lit_get_magic_string_size */
 
+#if !ENABLED (JERRY_LIT_MAGIC_STRING_HASH)
+
 /**
  * Get the block start element with the given size from
  * the list of ECMA and implementation-defined magic string constants
@@ -96,6 +106,8 @@ lit_get_magic_string_size_block_start (lit_utf8_size_t size) /**< magic string s
   static const lit_magic_string_id_t lit_magic_string_size_block_starts[] JERRY_ATTR_CONST_DATA =
   {
 /** @cond doxygen_suppress */
+#define LIT_MAGIC_STRING_HASH_DISPLACEMENT(displacement)
+#define LIT_MAGIC_STRING_HASH_SLOT(id)
 #define LIT_MAGIC_STRING_DEF(id, utf8_string)
 #define LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE(size, id) \
     id,
@@ -103,6 +115,8 @@ lit_get_magic_string_size_block_start (lit_utf8_size_t size) /**< magic string s
     LIT_NON_INTERNAL_MAGIC_STRING__COUNT
 #undef LIT_MAGIC_STRING_DEF
 #undef LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE
+#undef LIT_MAGIC_STRING_HASH_DISPLACEMENT
+#undef LIT_MAGIC_STRING_HASH_SLOT
 /** @endcond */
   };
 
@@ -111,6 +125,111 @@ lit_get_magic_string_size_block_start (lit_utf8_size_t size) /**< magic string s
   return lit_magic_string_size_block_starts[size];
 } /* lit_get_magic_string_size_block_start */
 
+#else /* ENABLED (JERRY_LIT_MAGIC_STRING_HASH) */
+
+/**
+ * Displacements of the buckets of the magic string hash table
+ */
+static const uint16_t lit_magic_string_hash_displacements[] JERRY_ATTR_CONST_DATA =
+{
+/** @cond doxygen_suppress */
+#define LIT_MAGIC_STRING_DEF(id, utf8_string)
+#define LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE(size, id)
+#define LIT_MAGIC_STRING_HASH_SLOT(id)
+#define LIT_MAGIC_STRING_HASH_DISPLACEMENT(displacement) \
+  displacement,
+#include "lit-magic-strings.inc.h"
+#undef LIT_MAGIC_STRING_DEF
+#undef LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE
+#undef LIT_MAGIC_STRING_HASH_DISPLACEMENT
+#undef LIT_MAGIC_STRING_HASH_SLOT
+/** @endcond */
+};
+
+/**
+ * Slots of the magic string hash table
+ *
+ * Note:
+ *      the hash is perfect, so every magic string has its own slot, the unused
+ *      slots contain LIT_MAGIC_STRING__COUNT
+ */
+static const uint16_t lit_magic_string_hash_slots[] JERRY_ATTR_CONST_DATA =
+{
+/** @cond doxygen_suppress */
+#define LIT_MAGIC_STRING_DEF(id, utf8_string)
+#define LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE(size, id)
+#define LIT_MAGIC_STRING_HASH_DISPLACEMENT(displacement)
+#define LIT_MAGIC_STRING_HASH_SLOT(id) \
+  id,
+#include "lit-magic-strings.inc.h"
+#undef LIT_MAGIC_STRING_DEF
+#undef LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE
+#undef LIT_MAGIC_STRING_HASH_DISPLACEMENT
+#undef LIT_MAGIC_STRING_HASH_SLOT
+/** @endcond */
+};
+
+/**
+ * Number of the buckets of the magic string hash table
+ */
+#define LIT_MAGIC_STRING_HASH_BUCKET_COUNT \
+  (sizeof (lit_magic_string_hash_displacements) / sizeof (lit_magic_string_hash_displacements[0]))
+
+/**
+ * Number of the slots of the magic string hash table
+ */
+#define LIT_MAGIC_STRING_HASH_SLOT_COUNT \
+  (sizeof (lit_magic_string_hash_slots) / sizeof (lit_magic_string_hash_slots[0]))
+
+JERRY_STATIC_ASSERT ((LIT_MAGIC_STRING_HASH_BUCKET_COUNT & (LIT_MAGIC_STRING_HASH_BUCKET_COUNT - 1)) == 0,
+                     lit_magic_string_hash_bucket_count_must_be_a_power_of_2);
+JERRY_STATIC_ASSERT ((LIT_MAGIC_STRING_HASH_SLOT_COUNT & (LIT_MAGIC_STRING_HASH_SLOT_COUNT - 1)) == 0,
+                     lit_magic_string_hash_slot_count_must_be_a_power_of_2);
+JERRY_STATIC_ASSERT (LIT_MAGIC_STRING__COUNT <= UINT16_MAX,
+                     lit_magic_string_ids_must_fit_into_the_hash_slots);
+
+/**
+ * Continue the calculation of the hash of a magic string candidate
+ *
+ * Note:
+ *      the hash function must be the same as the one used by tools/gen-magic-strings.py
+ *
+ * @return updated hash value
+ */
+static inline uint32_t JERRY_ATTR_ALWAYS_INLINE
+lit_magic_string_hash_update (uint32_t hash, /**< hash of the preceding bytes */
+                              const lit_utf8_byte_t *string_p, /**< utf-8 string */
+                              lit_utf8_size_t string_size) /**< string size in bytes */
+{
+  const lit_utf8_byte_t *string_end_p = string_p + string_size;
+
+  while (string_p < string_end_p)
+  {
+    hash = (hash ^ *string_p++) * 16777619u;
+  }
+
+  return hash;
+} /* lit_magic_string_hash_update */
+
+/**
+ * Find the only magic string which may have the given hash
+ *
+ * @return id - of the magic string which must be compared to the candidate,
+ *         LIT_MAGIC_STRING__COUNT - if no magic string has this hash
+ */
+static inline lit_magic_string_id_t JERRY_ATTR_ALWAYS_INLINE
+lit_magic_string_hash_lookup (uint32_t hash) /**< hash of the candidate string */
+{
+  hash ^= hash >> 15;
+
+  uint32_t displacement = lit_magic_string_hash_displacements[hash & (LIT_MAGIC_STRING_HASH_BUCKET_COUNT - 1)];
+
+  return (lit_magic_string_id_t) lit_magic_string_hash_slots[((hash >> 16) ^ displacement)
+                                                             & (LIT_MAGIC_STRING_HASH_SLOT_COUNT - 1)];
+} /* lit_magic_string_hash_lookup */
+
+#endif /* !ENABLED (JERRY_LIT_MAGIC_STRING_HASH) */
+
 /**
  * Get specified magic string as zero-terminated string from external table
  *
@@ -208,6 +327,17 @@ lit_is_utf8_string_magic (const lit_utf8_byte_t *string_p, /**< utf-8 string */
     return LIT_MAGIC_STRING__COUNT;
   }
 
+#if ENABLED (JERRY_LIT_MAGIC_STRING_HASH)
+  uint32_t hash = lit_magic_string_hash_update (LIT_MAGIC_STRING_HASH_SEED, string_p, string_size);
+  lit_magic_string_id_t id = lit_magic_string_hash_lookup (hash);
+
+  if (id != LIT_MAGIC_STRING__COUNT
+      && lit_get_magic_string_size (id) == string_size
+      && memcmp (lit_get_magic_string_utf8 (id), string_p, string_size) == 0)
+  {
+    return id;
+  }
+#else /* !ENABLED (JERRY_LIT_MAGIC_STRING_HASH) */
   /**< The string must be in this id range. */
   lit_utf8_size_t first = lit_get_magic_string_size_block_start (string_size);
   lit_utf8_size_t last = lit_get_magic_string_size_block_start (string_size + 1);
@@ -230,6 +360,7 @@ lit_is_utf8_string_magic (const lit_utf8_byte_t *string_p, /**< utf-8 string */
       first = middle + 1;
     }
   }
+#endif /* ENABLED (JERRY_LIT_MAGIC_STRING_HASH) */
 
   return LIT_MAGIC_STRING__COUNT;
 } /* lit_is_utf8_string_magic */
@@ -253,6 +384,22 @@ lit_is_utf8_string_pair_magic (const lit_utf8_byte_t *string1_p, /**< first utf-
     return LIT_MAGIC_STRING__COUNT;
   }
 
+#if ENABLED (JERRY_LIT_MAGIC_STRING_HASH)
+  uint32_t hash = lit_magic_string_hash_update (LIT_MAGIC_STRING_HASH_SEED, string1_p, string1_size);
+  hash = lit_magic_string_hash_update (hash, string2_p, string2_size);
+  lit_magic_string_id_t id = lit_magic_string_hash_lookup (hash);
+
+  if (id != LIT_MAGIC_STRING__COUNT && lit_get_magic_string_size (id) == total_string_size)
+  {
+    const lit_utf8_byte_t *magic_string_p = lit_get_magic_string_utf8 (id);
+
+    if (memcmp (magic_string_p, string1_p, string1_size) == 0
+        && memcmp (magic_string_p + string1_size, string2_p, string2_size) == 0)
+    {
+      return id;
+    }
+  }
+#else /* !ENABLED (JERRY_LIT_MAGIC_STRING_HASH) */
   /**< The string must be in this id range. */
   lit_utf8_size_t first = lit_get_magic_string_size_block_start (total_string_size);
   lit_utf8_size_t last = lit_get_magic_string_size_block_start (total_string_size + 1);
@@ -282,6 +429,7 @@ lit_is_utf8_string_pair_magic (const lit_utf8_byte_t *string1_p, /**< first utf-
       first = middle + 1;
     }
   }
+#endif /* ENABLED (JERRY_LIT_MAGIC_STRING_HASH) */
 
   return LIT_MAGIC_STRING__COUNT;
 } /* lit_is_utf8_string_pair_magic */
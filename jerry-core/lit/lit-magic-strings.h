@@ -25,11 +25,15 @@ typedef enum
 {
 /** @cond doxygen_suppress */
 #define LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE(size, id)
+#define LIT_MAGIC_STRING_HASH_DISPLACEMENT(displacement)
+#define LIT_MAGIC_STRING_HASH_SLOT(id)
 #define LIT_MAGIC_STRING_DEF(id, ascii_zt_string) \
      id,
 #include "lit-magic-strings.inc.h"
 #undef LIT_MAGIC_STRING_DEF
 #undef LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE
+#undef LIT_MAGIC_STRING_HASH_DISPLACEMENT
+#undef LIT_MAGIC_STRING_HASH_SLOT
 /** @endcond */
   LIT_NON_INTERNAL_MAGIC_STRING__COUNT, /**< number of non-internal magic strings */
   LIT_INTERNAL_MAGIC_API_INTERNAL = LIT_NON_INTERNAL_MAGIC_STRING__COUNT, /**< Used to add non-visible JS properties
@@ -1173,3 +1173,1898 @@ LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE (25, LIT_MAGIC_STRING__FUNCTION_TO_STRIN
 LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE (26, LIT_MAGIC_STRING__FUNCTION_TO_STRING)
 LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE (27, LIT_MAGIC_STRING__FUNCTION_TO_STRING)
 LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE (28, LIT_MAGIC_STRING__FUNCTION_TO_STRING)
+
+#define LIT_MAGIC_STRING_HASH_SEED 0x811c9dc5u
+
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (9)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (6)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (8)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (10)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (3)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (15)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (5)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (12)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (3)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (9)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (6)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (5)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (3)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (10)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (9)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (16)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (29)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (5)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (16)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (3)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (7)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (12)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (16)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (5)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (7)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (3)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (12)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (17)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (6)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (6)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (5)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (15)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (25)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (6)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (9)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (13)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (43)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (19)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (6)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (4)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (28)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (1)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (3)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (8)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (0)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (7)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (10)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (2)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (5)
+LIT_MAGIC_STRING_HASH_DISPLACEMENT (29)
+
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ACOS)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ERRORS)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_EVAL_ERROR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_INT16_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_INT32_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SHIFT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOG2)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROXY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REVOKE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROXY) \
+|| ENABLED (JERRY_BUILTIN_REFLECT) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_PROTOTYPE_OF_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_E_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RIGHT_SQUARE_CHAR)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LEFT_SQUARE_CHAR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IMUL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROMISE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FINALLY)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SYMBOL_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATAVIEW) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BYTE_OFFSET_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_PROTOTYPE_OF_UL)
+#if ENABLED (JERRY_BUILTIN_NUMBER)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_PRECISION_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if !ENABLED (JERRY_ESNEXT) && ENABLED (JERRY_BUILTIN_REGEXP) \
+|| ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_ESNEXT) \
+|| ENABLED (JERRY_BUILTIN_REGEXP) && !(ENABLED (JERRY_ESNEXT))
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MULTILINE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NAN)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_HOURS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_STRING) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INDEX_OF_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_TIME_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ERRORS)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REFERENCE_ERROR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_BUILTIN_STRING) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MATCH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UNICODE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_ANNEXB)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ESCAPE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UINT32_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_FINITE)
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SORT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__FUNCTION_TO_STRING)
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_HYPOT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SIN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SPECIES)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_POW)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_JSON)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_STRINGIFY)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATE) \
+|| ENABLED (JERRY_BUILTIN_JSON)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PARSE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_BUILTIN_STRING) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SEARCH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_NAN)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INT16_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ABS)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UINT32_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UINT16_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RANDOM)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PROTOTYPE)
+#if ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_VALUES)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_HAS_INSTANCE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_EMPTY_NON_CAPTURE_GROUP)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_EXPM1)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_STARTS_WITH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_STRING_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SEAL)
+#if ENABLED (JERRY_LINE_INFO)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_STACK)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROXY) \
+|| ENABLED (JERRY_BUILTIN_REFLECT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_OWN_KEYS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BIGINT64_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_VALUE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_COSH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TRIM_RIGHT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INT32_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UTC_MONTH_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CONSTRUCTOR)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MAP_ITERATOR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CBRT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_NUMBER)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MAX_VALUE_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PAD_END)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_LOCALE_DATE_STRING_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FLAGS)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_BIGINT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BIGINT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_BIGINT) && ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_BIGUINT64)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CONFIGURABLE)
+#if ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_BUILTIN_SET)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CLEAR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DESCRIPTION)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_LOCALE_TIME_STRING_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UTC_U)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_MONTH_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_BIGINT) && ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_BIGINT64)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_CONCAT_SPREADABLE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SQRT1_2_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_MILLISECONDS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ENCODE_URI_COMPONENT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_ERRORS)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SYNTAX_ERROR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ATAN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DEFINE_PROPERTIES_UL)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_THROW)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_FROZEN_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_MINUTES_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_CONTAINER) \
+|| ENABLED (JERRY_BUILTIN_WEAKMAP)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_WEAKMAP_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ARRAY_ITERATOR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROMISE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CATCH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_LOCALE_STRING_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_LOWER_CASE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TRIM_START)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT) && ENABLED (JERRY_BUILTIN_ANNEXB)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DEFINE_SETTER)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BOOLEAN_UL)
+#if ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_ITERATOR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ASYNC_GENERATOR_FUNCTION_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_OWN_PROPERTY_DESCRIPTOR_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_HAS_OWN_PROPERTY_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_STRING) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LAST_INDEX_OF_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UTC_SECONDS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DECODE_URI)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PROPERTY_IS_ENUMERABLE_UL)
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FROM_CHAR_CODE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TRIM_LEFT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UTC_MILLISECONDS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FUNCTION_UL)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOG10E_U)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_EXP)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_CONTAINER) \
+|| ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MAP_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ASIN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_INT8_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DOTALL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_ISO_STRING_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_CONTAINER) \
+|| ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ERRORS)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_URI_ERROR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UTC_MINUTES_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROXY) \
+|| ENABLED (JERRY_BUILTIN_REFLECT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DELETE_PROPERTY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ASINH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NOW)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CREATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_MINUTES_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_HOURS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOG2E_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NEXT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_OBJECT_TO_STRING_UL)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FLOAT32_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_VALUE_OF_UL)
+#if ENABLED (JERRY_BUILTIN_PROMISE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RACE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SIGN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_NUMBER)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NEGATIVE_INFINITY_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_APPLY)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_TIMEZONE_OFFSET_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_STRING_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SYMBOL_DOT_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_OBJECT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FREEZE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ARRAY_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_ARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SPLICE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FIND_INDEX)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SQRT2_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_NUMBER) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MAX_SAFE_INTEGER_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_FULL_YEAR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE) \
+|| ENABLED (JERRY_BUILTIN_JSON)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_JSON_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FUNCTION)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ANONYMOUS)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UTC_FULL_YEAR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_EVAL)
+#if ENABLED (JERRY_BUILTIN_PROXY) \
+|| ENABLED (JERRY_BUILTIN_REFLECT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CONSTRUCT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SINH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_ANNEXB)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UNESCAPE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CHAR_CODE_AT_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FLOOR)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CEIL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FLAT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_LOCALE_UPPER_CASE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UTC_HOURS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GLOBAL_THIS_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DONE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MESSAGE)
+#if ENABLED (JERRY_BUILTIN_PROMISE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RESOLVE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT) && ENABLED (JERRY_BUILTIN_ANNEXB)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DEFINE_GETTER)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TAN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GENERATOR_FUNCTION_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT) && ENABLED (JERRY_BUILTIN_ANNEXB)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOOKUP_GETTER)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CALLER)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FOR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_ERRORS)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RANGE_ERROR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_COPY_WITHIN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TRIM_END)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOCALE_COMPARE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FALSE)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_TIME_STRING_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DATAVIEW_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NULL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ENUMERABLE)
+#if ENABLED (JERRY_BUILTIN_BIGINT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BIGINT_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LN10_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_MODULE_SYSTEM)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ASTERIX_CHAR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TYPED_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_EXEC)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ROUND)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SPACE_CHAR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_PROTOTYPE_OF_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REGEXP_UL)
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UINT8_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_SAFE_INTEGER)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__EMPTY)
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_FLOAT_32_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_REGEXP)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INDEX)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_COMMA_CHAR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DEFINE_PROPERTY_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_WRITABLE)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_OWN_PROPERTY_DESCRIPTORS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LN2_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_INTEGER)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW) && ENABLED (JERRY_NUMBER_TYPE_FLOAT64)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_FLOAT_64_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ATANH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROMISE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_THEN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ATAN2)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TANH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_JOIN)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UTC_SECONDS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_INT8_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ERRORS)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TYPE_ERROR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ARGUMENTS_UL)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ASYNC_ITERATOR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROMISE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ALL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NULL_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RESOURCE_ANON)
+#if ENABLED (JERRY_BUILTIN_ARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_POP)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INT8_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) && ENABLED (JERRY_ESNEXT) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_OF)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROMISE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REJECT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT) \
+|| ENABLED (JERRY_MODULE_SYSTEM)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DEFAULT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MATCH_ALL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UNDEFINED_UL)
+#if ENABLED (JERRY_BUILTIN_CONTAINER) && ENABLED (JERRY_ESNEXT) \
+|| ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_BUILTIN_WEAKSET)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ADD)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_OWN_PROPERTY_SYMBOLS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_SECONDS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NAME)
+#if ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_BUILTIN_STRING) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REPLACE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE) && !(ENABLED (JERRY_ESNEXT)) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_UTC_STRING_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INFINITY_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_VIEW_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UTC_DATE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_NUMBER)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_POSITIVE_INFINITY_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_DATE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CLZ32)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ENDS_WITH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_EVERY)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_KEYS)
+#if ENABLED (JERRY_BUILTIN_NUMBER)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_FIXED_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOG)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UNSCOPABLES)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REGEXP_STRING_ITERATOR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REDUCE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_MODULE_SYSTEM)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RUNNABLE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DATE_UL)
+#if ENABLED (JERRY_BUILTIN_PROXY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REVOCABLE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REVERSE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BIND)
+#if ENABLED (JERRY_BUILTIN_DATAVIEW) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BYTE_LENGTH_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ENTRIES)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UNSHIFT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REPLACE_ALL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ARGUMENTS)
+#if ENABLED (JERRY_BUILTIN_DATAVIEW) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BUFFER)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_OWN_PROPERTY_NAMES_UL)
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CODE_POINT_AT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TRUNC)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UNDEFINED)
+#if ENABLED (JERRY_ESNEXT) \
+|| !(ENABLED (JERRY_ESNEXT))
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PARSE_INT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MATH_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_TIME_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SOME)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UINT8_CLAMPED_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UTC_MILLISECONDS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UINT32_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UINT8_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UINT16_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_FULL_YEAR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_UPPER_CASE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PUSH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_PRIMITIVE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_BIGINT) && ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_BIGINT64)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_LOCALE_LOWER_CASE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REFLECT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REFLECT_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ENCODE_URI)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATAVIEW) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ARRAY_BUFFER_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__PROTO__)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_OBJECT_FROM_ENTRIES)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_DATE_STRING_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW) && ENABLED (JERRY_NUMBER_TYPE_FLOAT64)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_FLOAT_64_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INVALID_DATE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GENERATOR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT) && ENABLED (JERRY_BUILTIN_ANNEXB)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOOKUP_SETTER)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CHAR_AT_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UTC_FULL_YEAR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_INT16_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UTC_DATE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ANNEXB) && ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SUBSTR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_INT32_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_NUMBER) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MIN_SAFE_INTEGER_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_FLOAT_32_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_STRING_TAG)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ERROR_UL)
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_STRING) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SLICE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_NUMBER)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_EXPONENTIAL_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UTC_DAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_COS)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MIN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROXY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PROXY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_OBJECT_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ASYNC_GENERATOR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BYTES_PER_ELEMENT_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_UTC_MINUTES_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UTC_MONTH_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_DATE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FOR_EACH_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LASTINDEX_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REPEAT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TRIM)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ANNEXB) && ENABLED (JERRY_BUILTIN_REGEXP)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_COMPILE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_MONTH_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_UTC_HOURS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_BUILTIN_SET)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SIZE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_STRING_ITERATOR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MAP)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_PROXY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PROXY)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if !ENABLED (JERRY_ESNEXT) && ENABLED (JERRY_BUILTIN_REGEXP) \
+|| ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_ESNEXT) \
+|| ENABLED (JERRY_BUILTIN_REGEXP) && !(ENABLED (JERRY_ESNEXT))
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IGNORECASE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MAX)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_DAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_BIGINT) && ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BIGUINT64_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ANNEXB) && ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_YEAR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SUBSTRING)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY) && ENABLED (JERRY_NUMBER_TYPE_FLOAT64)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FLOAT64_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PREVENT_EXTENSIONS_UL)
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_MILLISECONDS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UINT16_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_CONTAINER) \
+|| ENABLED (JERRY_BUILTIN_WEAKSET)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_WEAKSET_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TRUE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_BIGINT) && ENABLED (JERRY_BUILTIN_DATAVIEW)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_BIGUINT64)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SPLIT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_JSON)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_JSON_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_BUILTIN_PROXY) \
+|| ENABLED (JERRY_BUILTIN_REFLECT) \
+|| ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_BUILTIN_WEAKMAP) \
+|| ENABLED (JERRY_BUILTIN_WEAKSET)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_HAS)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SUBARRAY)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_NUMBER)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_MIN_VALUE_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PAD_START)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MAP) \
+|| ENABLED (JERRY_BUILTIN_SET) \
+|| ENABLED (JERRY_BUILTIN_WEAKMAP) \
+|| ENABLED (JERRY_BUILTIN_WEAKSET)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DELETE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ITERATOR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_NUMBER) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_EPSILON_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_DECODE_URI_COMPONENT)
+#if ENABLED (JERRY_BUILTIN_ANNEXB) && ENABLED (JERRY_BUILTIN_DATE) && ENABLED (JERRY_ESNEXT) \
+|| ENABLED (JERRY_BUILTIN_ANNEXB) && ENABLED (JERRY_BUILTIN_DATE) && !(ENABLED (JERRY_ESNEXT))
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TO_GMT_STRING_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FROUND)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_STRING)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CONCAT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if !ENABLED (JERRY_ESNEXT) && ENABLED (JERRY_BUILTIN_REGEXP) \
+|| ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_ESNEXT) \
+|| ENABLED (JERRY_BUILTIN_REGEXP) && !(ENABLED (JERRY_ESNEXT))
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SOURCE)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_PARSER)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RESOURCE_EVAL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LENGTH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_REGEXP)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_TEST)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ASSIGN)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ASYNC_FUNCTION_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_STRING) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FROM_CODE_POINT_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_REGEXP)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INPUT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_INCLUDES)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NUMBER)
+#if ENABLED (JERRY_BUILTIN_ARRAY) && ENABLED (JERRY_ESNEXT) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FROM)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FILTER)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOG1P)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_LOG10)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NEGATIVE_INFINITY_UL)
+#if ENABLED (JERRY_ESNEXT) \
+|| !(ENABLED (JERRY_ESNEXT))
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PARSE_FLOAT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_PROMISE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PROMISE_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_KEY_FOR)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_NUMBER_UL)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FILL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_UINT8_ARRAY_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FLATMAP)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ANNEXB) && ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SET_YEAR_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SQRT)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_SEALED_UL)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CALL)
+#if ENABLED (JERRY_BUILTIN_MATH) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_ACOSH)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_BUILTIN_TYPEDARRAY) \
+|| ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_FIND)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_CALLEE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RETURN)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_BOOLEAN)
+#if ENABLED (JERRY_BUILTIN_MATH)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_PI_U)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP) && ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_STICKY)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_IS_EXTENSIBLE)
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_SYMBOL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_ARRAY) \
+|| ENABLED (JERRY_BUILTIN_TYPEDARRAY)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_REDUCE_RIGHT_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_DATE)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GET_SECONDS_UL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_BUILTIN_REGEXP)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_GLOBAL)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
+#if ENABLED (JERRY_ESNEXT)
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING_RAW)
+#else
+LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)
+#endif
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Measure how fast the debugger client resolves the byte code offsets of
+breakpoint and exception hits to breakpoints.
+
+The hits are replayed on a function with the given number of breakpoint
+locations. Most of the offsets are not exact breakpoint offsets, like the
+offsets reported by exception hits.
+"""
+
+from __future__ import print_function
+import argparse
+import os
+import random
+import sys
+import timeit
+
+# Appended (instead of prepended), so the client modules can be overridden with
+# PYTHONPATH, e.g. to compare the speed with an older version of the client.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jerry_client_main import JerryDebugger, JerryFunction, JerrySource
+
+BYTE_CODE_CP = 0x100
+OFFSET_STEP = 8
+
+def create_debugger(breakpoints):
+    """ Create a debugger, which is not connected to an engine, with one function. """
+    lines = list(range(1, breakpoints + 1))
+    offsets = [line * OFFSET_STEP for line in lines]
+    source = JerrySource("\n".join("x%d();" % line for line in lines))
+    function = JerryFunction(True, BYTE_CODE_CP, source, "bench.js", 1, 1, "f", lines, offsets)
+
+    debugger = JerryDebugger.__new__(JerryDebugger)
+    debugger.channel = None
+    debugger.function_list = {BYTE_CODE_CP: function}
+    return debugger
+
+
+def run(debugger, hits):
+    # pylint: disable=protected-access
+    start = timeit.default_timer()
+    for hit in hits:
+        debugger._get_breakpoint(hit)
+    return timeit.default_timer() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Debugger breakpoint hit resolution benchmark')
+    parser.add_argument('--breakpoints', metavar='N', type=int, default=2000,
+                        help='number of breakpoint locations in the function (default: %(default)s)')
+    parser.add_argument('--hits', metavar='N', type=int, default=5000,
+                        help='number of replayed hits (default: %(default)s)')
+    parser.add_argument('--repeat', metavar='N', type=int, default=3,
+                        help='number of measurements, the best one is reported (default: %(default)s)')
+    args = parser.parse_args()
+
+    debugger = create_debugger(args.breakpoints)
+
+    rand = random.Random(0)
+    max_offset = (args.breakpoints + 1) * OFFSET_STEP
+    hits = [(BYTE_CODE_CP, rand.randrange(max_offset)) for _ in range(args.hits)]
+
+    elapsed = min(run(debugger, hits) for _ in range(args.repeat))
+    print('%d hits: %.3f s (%.1f us/hit)' % (args.hits, elapsed, elapsed * 1000000 / args.hits))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Measure the throughput of the transmission layers of the debugger client.
+
+Source code messages in the format the engine sends them are fed to the
+WebSocket or RawPacket channel from memory, in chunks of the size a socket
+typically returns, so only the client side processing is measured.
+"""
+
+from __future__ import print_function
+import argparse
+import os
+import struct
+import sys
+import timeit
+
+# Appended (instead of prepended), so the client modules can be overridden with
+# PYTHONPATH, e.g. to compare the throughput with an older version of the client.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jerry_client_main import JERRY_DEBUGGER_SOURCE_CODE, JERRY_DEBUGGER_SOURCE_CODE_END
+from jerry_client_rawpacket import RawPacket
+from jerry_client_websocket import WebSocket, WEBSOCKET_BINARY_FRAME, WEBSOCKET_FIN_BIT
+
+CHANNELS = {
+    'websocket': WebSocket,
+    'rawpacket': RawPacket,
+}
+
+class MemoryProtocol(object):
+    """ Protocol which receives a prebuilt byte stream in chunks of at most the given size. """
+    def __init__(self, stream, chunk_size):
+        self.stream = memoryview(stream)
+        self.chunk_size = chunk_size
+        self.position = 0
+
+    def _next_chunk(self, max_size):
+        size = min(max_size, self.chunk_size, len(self.stream) - self.position)
+        chunk = self.stream[self.position:self.position + size]
+        self.position += size
+        return chunk
+
+    def receive_data(self, max_size=1024):
+        return self._next_chunk(max_size).tobytes()
+
+    def receive_data_into(self, view):
+        chunk = self._next_chunk(len(view))
+        view[:len(chunk)] = chunk
+        return len(chunk)
+
+    def ready(self):
+        return self.position < len(self.stream)
+
+
+def build_stream(channel_name, source_size, message_size):
+    """ Build the frames of a source code transfer of the given size. """
+    payload_size = message_size - 1
+    frames = []
+    sent = 0
+
+    while sent < source_size:
+        size = min(payload_size, source_size - sent)
+        sent += size
+        message_type = JERRY_DEBUGGER_SOURCE_CODE if sent < source_size else JERRY_DEBUGGER_SOURCE_CODE_END
+        message = struct.pack('B', message_type) + b'x' * size
+
+        if channel_name == 'websocket':
+            frames.append(struct.pack('BB', WEBSOCKET_BINARY_FRAME | WEBSOCKET_FIN_BIT, len(message)))
+        else:
+            frames.append(struct.pack('B', len(message)))
+        frames.append(message)
+
+    return b''.join(frames)
+
+
+def run(channel_name, source_size, message_size, chunk_size):
+    """ Transfer the source through the channel, returns the elapsed time in seconds. """
+    stream = build_stream(channel_name, source_size, message_size)
+    channel = CHANNELS[channel_name](MemoryProtocol(stream, chunk_size))
+
+    start = timeit.default_timer()
+    received = 0
+    while True:
+        data = channel.get_message(True)
+        received += len(data) - 1
+        if struct.unpack('B', data[0:1])[0] == JERRY_DEBUGGER_SOURCE_CODE_END:
+            break
+
+    elapsed = timeit.default_timer() - start
+
+    assert received == source_size
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Debugger channel throughput benchmark')
+    parser.add_argument('--channel', choices=sorted(CHANNELS), action='append',
+                        help='channel to measure (default: all)')
+    parser.add_argument('--size', metavar='MB', type=float, default=32,
+                        help='size of the transferred source code (default: %(default)s)')
+    parser.add_argument('--message-size', metavar='BYTES', type=int, default=125,
+                        help='maximum size of a debugger message (default: %(default)s)')
+    parser.add_argument('--chunk-size', metavar='BYTES', type=int, default=16384,
+                        help='maximum amount of data returned by one receive call (default: %(default)s)')
+    parser.add_argument('--repeat', metavar='N', type=int, default=3,
+                        help='number of measurements, the best one is reported (default: %(default)s)')
+    args = parser.parse_args()
+
+    source_size = int(args.size * 1024 * 1024)
+    for channel_name in args.channel or sorted(CHANNELS):
+        elapsed = min(run(channel_name, source_size, args.message_size, args.chunk_size) for _ in range(args.repeat))
+        print('%s: %.2f MB/s' % (channel_name, source_size / elapsed / (1024 * 1024)))
+
+
+if __name__ == '__main__':
+    main()
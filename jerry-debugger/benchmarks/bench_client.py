@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Measure the throughput and latency of the debugger client connected to an
+engine: the stand-in server (running in this process) or a jerry binary
+built with the debugger (--jerry).
+
+Every scenario connects a new client to a new engine:
+  parse    source ingest throughput of _parse_source
+  pending  time spent resolving pending breakpoints when the scripts are parsed
+  stop     latency of stepping: from sending the command to the prompt, and
+           from receiving the breakpoint hit to the prompt
+  eval     round trip latency of eval
+  print    output throughput of _process_incoming_text
+
+The stand-in server runs in a separate process. The time spent in the methods
+includes waiting for the data of the engine, so the throughputs are computed
+from the processor time used by the client.
+
+The results are written as JSON, so they can be compared across commits.
+"""
+
+from __future__ import print_function
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+# Appended (instead of prepended), so the client modules can be overridden with
+# PYTHONPATH, e.g. to compare the speed with an older version of the client.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import jerry_client_main
+from jerry_client_main import DebuggerAction, JerryDebugger
+import jerry_standin_server
+from jerry_client_rawpacket import RawPacket
+from jerry_client_tcp import Socket
+from jerry_client_websocket import WebSocket
+
+SCENARIOS = ["parse", "pending", "stop", "eval", "print"]
+
+CONNECT_TIMEOUT = 10.0
+
+# Processor time of the current process.
+cpu_timer = getattr(time, "process_time", None) or time.clock # pylint: disable=invalid-name
+
+class MethodTimer(object):
+    """
+    Accumulates the elapsed and the processor time spent in a method of an object,
+    the method is replaced by a timed wrapper.
+    """
+    def __init__(self, obj, name):
+        self.seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.calls = 0
+        method = getattr(obj, name)
+
+        def timed(*args):
+            start = timeit.default_timer()
+            cpu_start = cpu_timer()
+            try:
+                return method(*args)
+            finally:
+                self.cpu_seconds += cpu_timer() - cpu_start
+                self.seconds += timeit.default_timer() - start
+                self.calls += 1
+
+        setattr(obj, name, timed)
+
+
+def _throughput(size, seconds):
+    return size / seconds / (1024 * 1024) if seconds else None
+
+
+def latency_summary(latencies):
+    """ Summarize latencies (in seconds) in milliseconds. """
+    if not latencies:
+        return None
+
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        "count": count,
+        "mean_ms": sum(latencies) * 1000 / count,
+        "median_ms": latencies[count // 2] * 1000,
+        "p99_ms": latencies[min(count - 1, count * 99 // 100)] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def functions_source(index, functions, lines):
+    """ JavaScript source of generated functions, which have the same shape as the functions of the stand-in. """
+    source = ""
+    for function_index in range(functions):
+        source += "function f%d_%d(x) {\n" % (index, function_index)
+        source += "".join("  x = x + %d;\n" % line_index for line_index in range(lines))
+        source += "}\n"
+    return source
+
+
+def pending_breakpoints(first_script, scripts, functions, count):
+    """ Names of the functions of the scripts parsed after the pending breakpoints are set. """
+    names = ["f%d_%d" % (index, function_index)
+             for function_index in range(functions)
+             for index in range(first_script, first_script + scripts)]
+    return names[:count]
+
+
+class Scenario(object):
+    """ Workload of a scenario, both for the stand-in server and as JavaScript code. """
+    # pylint: disable=too-few-public-methods
+    def __init__(self, workload, source):
+        self.workload = workload
+        self.source = source
+
+
+def create_scenario(name, args):
+    if name == "parse":
+        return Scenario(jerry_standin_server.Workload(scripts=args.scripts, functions=args.functions,
+                                                      lines=args.lines, hits=1),
+                        "".join(functions_source(index, args.functions, args.lines)
+                                for index in range(args.scripts)) + "var done = 1;\n")
+
+    if name == "pending":
+        return Scenario(jerry_standin_server.Workload(scripts=1, functions=args.functions, lines=args.lines,
+                                                      hits=1, late_scripts=args.scripts),
+                        "var done = 0;\n" +
+                        "".join("eval(%s);\n" % json.dumps(functions_source(index, args.functions, args.lines))
+                                for index in range(1, args.scripts + 1)))
+
+    if name == "stop":
+        return Scenario(jerry_standin_server.Workload(functions=args.functions, lines=args.lines,
+                                                      hits=args.steps + 1),
+                        "var x = 0;\nfor (var i = 0; i < %d; i++) {\n  x = x + i;\n}\n" % (args.steps + 1))
+
+    if name == "eval":
+        return Scenario(jerry_standin_server.Workload(hits=1),
+                        "var x = 1;\nvar done = 1;\n")
+
+    text = "x" * (args.print_size - 1)
+    return Scenario(jerry_standin_server.Workload(hits=1, prints=args.prints, print_size=args.print_size),
+                    "for (var i = 0; i < %d; i++) {\n  print(%s);\n}\n" % (args.prints, json.dumps(text)))
+
+
+class StandInTarget(object):
+    """ Runs the stand-in server of a scenario in a child process. """
+    def __init__(self, scenario, channel_name):
+        server_socket = jerry_standin_server.create_server(0)
+        self.port = server_socket.getsockname()[1]
+        self.process = multiprocessing.Process(target=jerry_standin_server.serve,
+                                               args=(server_socket, channel_name, scenario.workload))
+        self.process.start()
+        server_socket.close()
+
+    def finish(self):
+        self.process.join()
+
+
+class JerryTarget(object):
+    """ Runs the source of a scenario with a jerry binary. """
+    def __init__(self, scenario, channel_name, jerry):
+        # Select a free port for the engine.
+        port_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        port_socket.bind(("", 0))
+        self.port = port_socket.getsockname()[1]
+        port_socket.close()
+
+        source_file, self.path = tempfile.mkstemp(suffix=".js")
+        os.write(source_file, scenario.source.encode("ascii"))
+        os.close(source_file)
+
+        with open(os.devnull, "w") as devnull:
+            self.process = subprocess.Popen([jerry, self.path, "--start-debug-server",
+                                             "--debug-port", str(self.port), "--debug-channel", channel_name],
+                                            stdout=devnull, stderr=devnull)
+
+    def finish(self):
+        self.process.wait()
+        os.remove(self.path)
+
+
+def connect(port, channel_name):
+    """ Connect a client to the engine listening on the port, retries until the engine is ready. """
+    deadline = time.time() + CONNECT_TIMEOUT
+
+    # The connection message is not part of the results.
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        while True:
+            protocol = Socket(("localhost", port))
+            if channel_name == "websocket":
+                channel = WebSocket(protocol=protocol)
+            else:
+                channel = RawPacket(protocol=protocol)
+
+            try:
+                debugger = JerryDebugger(channel)
+                break
+            except socket.error:
+                protocol.close()
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.05)
+    finally:
+        sys.stdout = stdout
+
+    debugger.non_interactive = True
+    return debugger
+
+
+def wait_prompt(debugger):
+    """ Process the messages until the engine waits for a command, returns False if the session ended. """
+    while True:
+        action = debugger.process_messages()
+        if action.get_type() == DebuggerAction.PROMPT:
+            return True
+        if action.get_type() == DebuggerAction.END:
+            return False
+
+
+def run_to_end(debugger):
+    debugger.do_continue()
+    while debugger.process_messages().get_type() != DebuggerAction.END:
+        pass
+
+
+# pylint: disable=protected-access
+def measure_parse(debugger, _args):
+    timer = MethodTimer(debugger, "_parse_source")
+    wait_prompt(debugger)
+
+    sources = set(function.source for function in debugger.function_list.values())
+    size = sum(len(line) + 1 for source in sources for line in source.lines)
+    functions = len(debugger.function_list)
+    run_to_end(debugger)
+
+    return {
+        "scripts": timer.calls,
+        "functions": functions,
+        "source_bytes": size,
+        "seconds": timer.seconds,
+        "cpu_seconds": timer.cpu_seconds,
+        "mb_per_s": _throughput(size, timer.cpu_seconds),
+    }
+
+
+def measure_pending(debugger, args):
+    timer = MethodTimer(debugger, "_resolve_pending_breakpoints")
+    wait_prompt(debugger)
+
+    # The first script is parsed before the first stop, the others afterwards.
+    for name in pending_breakpoints(1, args.scripts, args.functions, args.breakpoints):
+        debugger.set_break(name, add_pending=True)
+
+    pending = len(debugger.pending_breakpoint_list)
+    run_to_end(debugger)
+
+    resolved = pending - len(debugger.pending_breakpoint_list)
+    return {
+        "breakpoints": pending,
+        "resolved": resolved,
+        "parsed_scripts": timer.calls,
+        "seconds": timer.seconds,
+        "cpu_seconds": timer.cpu_seconds,
+        "us_per_breakpoint": timer.cpu_seconds * 1000000 / resolved if resolved else None,
+    }
+
+
+def measure_stop(debugger, args):
+    hit_times = []
+    process_message = debugger.process_message
+
+    def timed_process_message(data):
+        if ord(data[0]) == jerry_client_main.JERRY_DEBUGGER_BREAKPOINT_HIT:
+            hit_times.append(timeit.default_timer())
+        return process_message(data)
+
+    debugger.process_message = timed_process_message
+
+    round_trips = []
+    hit_to_prompt = []
+    wait_prompt(debugger)
+
+    for _ in range(args.steps):
+        del hit_times[:]
+        start = timeit.default_timer()
+        debugger.next()
+        if not wait_prompt(debugger):
+            break
+
+        end = timeit.default_timer()
+        round_trips.append(end - start)
+        if hit_times:
+            hit_to_prompt.append(end - hit_times[0])
+
+    run_to_end(debugger)
+
+    return {
+        "round_trip": latency_summary(round_trips),
+        "hit_to_prompt": latency_summary(hit_to_prompt),
+    }
+
+
+def measure_eval(debugger, args):
+    round_trips = []
+    wait_prompt(debugger)
+
+    # The same expression is evaluated in every round trip.
+    debugger.stop_cache_enabled = False
+
+    for _ in range(args.evals):
+        start = timeit.default_timer()
+        debugger.eval("x")
+        if not wait_prompt(debugger):
+            break
+        round_trips.append(timeit.default_timer() - start)
+
+    run_to_end(debugger)
+
+    return {
+        "round_trip": latency_summary(round_trips),
+    }
+
+
+def measure_print(debugger, args):
+    timer = MethodTimer(debugger, "_process_incoming_text")
+    wait_prompt(debugger)
+    run_to_end(debugger)
+
+    size = args.prints * args.print_size
+    return {
+        "lines": args.prints,
+        "bytes": size,
+        "messages": timer.calls,
+        "seconds": timer.seconds,
+        "cpu_seconds": timer.cpu_seconds,
+        "mb_per_s": _throughput(size, timer.cpu_seconds),
+    }
+
+
+MEASUREMENTS = {
+    "parse": measure_parse,
+    "pending": measure_pending,
+    "stop": measure_stop,
+    "eval": measure_eval,
+    "print": measure_print,
+}
+
+
+def run_scenario(name, args):
+    scenario = create_scenario(name, args)
+
+    if args.jerry:
+        target = JerryTarget(scenario, args.channel, args.jerry)
+    else:
+        target = StandInTarget(scenario, args.channel)
+
+    debugger = connect(target.port, args.channel)
+    try:
+        return MEASUREMENTS[name](debugger, args)
+    finally:
+        debugger.channel.close()
+        debugger.channel = None
+        target.finish()
+
+
+def git_revision():
+    try:
+        with open(os.devnull, "w") as devnull:
+            revision = subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=devnull,
+                                               cwd=os.path.dirname(os.path.abspath(__file__)))
+        return revision.decode("ascii").strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Debugger client throughput and latency benchmark')
+    parser.add_argument('--jerry', metavar='PATH',
+                        help='run the scenarios with a jerry binary built with the debugger '
+                        '(default: stand-in server)')
+    parser.add_argument('--channel', choices=['websocket', 'rawpacket'], default='websocket',
+                        help='communication channel (default: %(default)s)')
+    parser.add_argument('--scenario', dest='scenarios', choices=SCENARIOS, action='append',
+                        help='run only the given scenario (can be specified multiple times)')
+    parser.add_argument('--scripts', metavar='N', type=int, default=10,
+                        help='number of parsed scripts (default: %(default)s)')
+    parser.add_argument('--functions', metavar='N', type=int, default=200,
+                        help='number of functions in each script (default: %(default)s)')
+    parser.add_argument('--lines', metavar='N', type=int, default=10,
+                        help='number of statements in each function (default: %(default)s)')
+    parser.add_argument('--breakpoints', metavar='N', type=int, default=500,
+                        help='number of pending breakpoints (default: %(default)s)')
+    parser.add_argument('--steps', metavar='N', type=int, default=1000,
+                        help='number of measured steps (default: %(default)s)')
+    parser.add_argument('--evals', metavar='N', type=int, default=1000,
+                        help='number of measured evaluations (default: %(default)s)')
+    parser.add_argument('--prints', metavar='N', type=int, default=20000,
+                        help='number of printed lines (default: %(default)s)')
+    parser.add_argument('--print-size', metavar='N', type=int, default=80,
+                        help='length of a printed line including the newline (default: %(default)s)')
+    parser.add_argument('--output', metavar='FILE',
+                        help='write the results to the file (default: standard output)')
+    args = parser.parse_args()
+
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "target": args.jerry or "stand-in",
+        "channel": args.channel,
+        "scenarios": {},
+    }
+
+    for name in args.scenarios or SCENARIOS:
+        results["scenarios"][name] = run_scenario(name, args)
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
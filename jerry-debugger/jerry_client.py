@@ -21,7 +21,6 @@ import math
 import socket
 import sys
 import logging
-import time
 import jerry_client_main
 
 from jerry_client_websocket import WebSocket
@@ -95,7 +94,6 @@ class DebuggerPrompt(Cmd):
 
             while args > 0:
                 self.debugger.next()
-                time.sleep(0.1)
 
                 while True:
                     result = self.debugger.process_messages()
@@ -165,7 +163,7 @@ class DebuggerPrompt(Cmd):
 
     def do_eval(self, args):
         """ Evaluate JavaScript source code """
-        self.debugger.eval(args)
+        write(self.debugger.eval(args))
         self.stop = True
     do_e = do_eval
     do_print = do_eval
@@ -191,7 +189,7 @@ class DebuggerPrompt(Cmd):
             print("Error: %s" % (val_errno))
             return
 
-        self.debugger.eval_at(code, index)
+        write(self.debugger.eval_at(code, index))
         self.stop = True
 
     def do_throw(self, args):
@@ -212,7 +210,7 @@ class DebuggerPrompt(Cmd):
 
     def do_scope(self, _):
         """ Get lexical environment chain """
-        self.debugger.scope_chain()
+        write(self.debugger.scope_chain())
         self.stop = True
 
     def do_variables(self, args):
@@ -232,6 +230,7 @@ class DebuggerPrompt(Cmd):
             print("Error: No argument expected")
         else:
             pprint(self.debugger.function_list)
+            write(self.debugger.memory_usage())
 
     # pylint: disable=invalid-name
     def do_EOF(self, _):
@@ -269,7 +268,11 @@ def main():
     channel = None
     protocol = None
 
-    if args.protocol == "tcp":
+    if args.replay:
+        from jerry_client_record import ReplayProtocol
+        protocol = ReplayProtocol(args.replay, args.replay_realtime)
+        args.channel = protocol.channel_name
+    elif args.protocol == "tcp":
         address = None
         if ":" not in args.address:
             address = (args.address, 5001) # use default port
@@ -285,6 +288,10 @@ def main():
         print("Unsupported transmission protocol")
         return -1
 
+    if args.record:
+        from jerry_client_record import RecordingProtocol
+        protocol = RecordingProtocol(protocol, args.record, args.channel)
+
     if args.channel == "websocket":
         channel = WebSocket(protocol=protocol)
     elif args.channel == "rawpacket":
@@ -295,6 +302,8 @@ def main():
 
     debugger = jerry_client_main.JerryDebugger(channel)
     debugger.non_interactive = args.non_interactive
+    debugger.prefetch_stop_state = args.prefetch
+    debugger.cache_property_reads = args.cache_property_reads
 
     logging.debug("Connected to JerryScript")
 
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DEFAULT_BUFFER_SIZE = 65536
+
+class ReceiveBuffer(object):
+    """
+    Receive buffer of the transmission layers.
+
+    The data is received directly into a preallocated bytearray and the messages are
+    returned as memoryview slices of it, so the received data is never copied while it
+    is split into messages. A returned message is only valid until the next receive,
+    because the space of the consumed messages is reused.
+    """
+    def __init__(self, protocol, size=DEFAULT_BUFFER_SIZE):
+        self.protocol = protocol
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def byte_at(self, index):
+        """ Return the value of the byte at the given index of the unconsumed data. """
+        return self._buffer[self._start + index]
+
+    def has_message(self, header_size):
+        """ Return True if the next message has been received completely. """
+        start = self._start + header_size
+        return start <= self._end and start + self._buffer[start - 1] <= self._end
+
+    def take_message(self, header_size):
+        """
+        Remove the next message from the buffer and return its payload as a memoryview. The last
+        byte of the message header is the size of the payload. Returns None if the message has
+        not been received completely yet.
+        """
+        start = self._start + header_size
+        if start > self._end:
+            return None
+
+        end = start + self._buffer[start - 1]
+        if end > self._end:
+            return None
+
+        self._start = end
+        return self._view[start:end]
+
+    def consume(self, size):
+        """ Remove the given amount of data from the buffer and return it as a memoryview. """
+        result = self._view[self._start:self._start + size]
+        self._start += size
+        return result
+
+    def receive(self):
+        """ Receive the available data. Returns False if the connection was closed. """
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif self._end == len(self._buffer):
+            self._make_room()
+
+        received = self.protocol.receive_data_into(self._view[self._end:])
+
+        if not received:
+            return False
+
+        self._end += received
+        return True
+
+    def receive_at_least(self, size):
+        """ Receive data until the buffer contains at least size bytes. """
+        while len(self) < size:
+            if not self.receive():
+                raise Exception("Connection closed")
+
+    def _make_room(self):
+        """ Move the unconsumed data to the beginning of the buffer or grow the buffer if it is full. """
+        data = self._view[self._start:self._end].tobytes()
+
+        if self._start == 0:
+            self._buffer = bytearray(len(self._buffer) * 2)
+            self._view = memoryview(self._buffer)
+
+        self._buffer[0:len(data)] = data
+        self._start = 0
+        self._end = len(data)
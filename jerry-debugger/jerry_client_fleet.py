@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+import argparse
+import logging
+import select
+import socket
+import jerry_client_main
+
+from jerry_client_main import parse_arguments
+from jerry_client_tool import add_connection_arguments, create_channel, run_tool
+
+MEMSTATS_FIELDS = ["Allocated", "Byte code", "String", "Object", "Property"]
+
+def arguments_parse():
+    parser = argparse.ArgumentParser(description="JerryScript debugger client for multiple engines")
+
+    add_connection_arguments(parser, multiple=True)
+    parser.add_argument("--break", metavar="BREAKPOINT", dest="breakpoints", action="append", default=[],
+                        help="set a breakpoint in every engine (can be specified multiple times)")
+    parser.add_argument("--memstats", action="store_true", default=False,
+                        help="print the memory statistics of every engine after connecting")
+
+    return parse_arguments(parser)
+
+
+class DebuggerSession(object):
+    """ Debugger connected to one engine of the fleet. """
+    def __init__(self, name, debugger):
+        self.name = name
+        self.debugger = debugger
+        self.stopped = False
+        self.closed = False
+
+    def fileno(self):
+        return self.debugger.fileno()
+
+    def set_closed(self):
+        logging.debug("Session %s closed", self)
+        self.closed = True
+        self.stopped = False
+
+    def __str__(self):
+        return self.name
+
+
+class DebuggerFleet(object):
+    """
+    Drives the debuggers of many engines from a single select loop.
+
+    The messages of the engines are processed as they arrive, the breakpoint hits
+    are collected by the breakpoint (see hits) and the text reported by an engine
+    is passed to the write callback together with its session.
+
+    Only the first message of an engine is awaited by select: the debugger reads the
+    rest of a message sequence (e.g. a source code or an output text split into several
+    messages) with blocking reads. The engines send these sequences without waiting,
+    but an engine which stops in the middle of a sequence stalls the other sessions
+    until its connection is closed.
+    """
+    def __init__(self, write=None, auto_continue=True):
+        self.sessions = []
+        self.hits = {}
+        self.write = write or write_prefixed
+        self.auto_continue = auto_continue
+
+    def connect(self, name, channel):
+        """
+        Connect to an engine through the given channel and add it to the fleet.
+        Blocks until the engine accepts the connection and sends its configuration.
+        """
+        debugger = jerry_client_main.JerryDebugger(channel)
+        debugger.non_interactive = True
+
+        session = DebuggerSession(name, debugger)
+        self.sessions.append(session)
+        return session
+
+    def connect_all(self, addresses, channel, protocol, breakpoints=()):
+        """
+        Connect to the engines at the given addresses and set the breakpoints in each of them.
+        The engines stop before executing the first statement, so the breakpoints are set
+        before the execution starts. The engines are left stopped.
+        """
+        for address in addresses:
+            self.connect(address, create_channel(address, channel, protocol))
+
+        self.wait_stopped()
+
+        for breakpoint in breakpoints:
+            for session, result in sorted(self.set_break(breakpoint).items(), key=str):
+                self.write(session, result)
+
+    def open_sessions(self):
+        return [session for session in self.sessions if not session.closed]
+
+    def set_break(self, args):
+        """ Set a breakpoint in every engine, returns the result text of each session. """
+        return dict((session, session.debugger.set_break(args, add_pending=True))
+                    for session in self.open_sessions())
+
+    def do_continue(self):
+        """ Resume every stopped engine. """
+        for session in self.open_sessions():
+            if session.stopped:
+                session.stopped = False
+                session.debugger.do_continue()
+
+    def memstats(self):
+        """ Query the memory statistics of every engine, returns the statistics of each session. """
+        sessions = self.open_sessions()
+
+        for session in sessions:
+            session.debugger.memory_stats = None
+            session.debugger.memstats()
+
+        while True:
+            waiting = [session for session in sessions
+                       if not session.closed and session.debugger.memory_stats is None]
+            if not waiting:
+                break
+            self.poll()
+
+        return dict((session, session.debugger.memory_stats) for session in sessions if not session.closed)
+
+    def poll(self, timeout=None):
+        """
+        Wait until at least one engine sends data (or the timeout expires) and process
+        the received messages. Returns False if every session is closed.
+        """
+        sessions = self.open_sessions()
+        if not sessions:
+            return False
+
+        ready = [session for session in sessions if session.debugger.channel.has_message()]
+        if not ready:
+            ready = select.select(sessions, [], [], timeout)[0]
+
+        for session in ready:
+            self._process_message(session)
+
+        return True
+
+    def wait_stopped(self):
+        """ Process the messages until every engine is stopped (or closed). """
+        while any(not session.stopped for session in self.open_sessions()):
+            self.poll()
+
+    def run(self):
+        """ Process the messages until every session is closed. """
+        while self.poll():
+            pass
+
+    def hit_summary(self):
+        result = ""
+        for breakpoint in sorted(self.hits):
+            names = sorted(set(self.hits[breakpoint]))
+            result += "%s: hit %d times by %d instance(s): %s\n" % (
+                breakpoint, len(self.hits[breakpoint]), len(names), ", ".join(names))
+        return result or "No breakpoints were hit\n"
+
+    def _process_message(self, session):
+        debugger = session.debugger
+
+        try:
+            data = debugger.get_message(True)
+        except socket.error as error:
+            # An engine which is terminated does not stop the others.
+            logging.debug("Session %s: %s", session, error)
+            data = None
+
+        if not data:
+            session.set_closed()
+            return
+
+        buffer_type = ord(data[0])
+        action = debugger.process_message(data)
+
+        # The statistics are kept in debugger.memory_stats (see memstats).
+        if action is None or buffer_type == jerry_client_main.JERRY_DEBUGGER_MEMSTATS_RECEIVE:
+            return
+
+        if action.get_type() == jerry_client_main.DebuggerAction.END:
+            session.set_closed()
+            return
+
+        if action.get_text():
+            self.write(session, action.get_text())
+
+        if buffer_type in [jerry_client_main.JERRY_DEBUGGER_BREAKPOINT_HIT,
+                           jerry_client_main.JERRY_DEBUGGER_EXCEPTION_HIT]:
+            self.hits.setdefault(str(debugger.last_breakpoint_hit), []).append(session.name)
+
+            if self.auto_continue:
+                debugger.do_continue()
+            else:
+                session.stopped = True
+
+def write_prefixed(session, text):
+    """ Write the text reported by an engine, every line is prefixed with the name of the session. """
+    for line in text.splitlines():
+        print("[%s] %s" % (session, line))
+
+
+def main():
+    args = arguments_parse()
+    fleet = DebuggerFleet(auto_continue=False)
+    fleet.connect_all(args.address, args.channel, args.protocol, args.breakpoints)
+    # The first stops are not breakpoint hits.
+    fleet.hits.clear()
+
+    if args.memstats:
+        stats = fleet.memstats()
+        print("%-24s %s" % ("Instance", " ".join("%12s" % field for field in MEMSTATS_FIELDS)))
+        for session in sorted(stats, key=str):
+            print("%-24s %s" % (session, " ".join("%12d" % value for value in stats[session])))
+        print("%-24s %s" % ("Total", " ".join("%12d" % sum(column) for column in zip(*stats.values()))))
+
+    fleet.auto_continue = True
+    fleet.do_continue()
+
+    fleet.run()
+
+    print(fleet.hit_summary(), end='')
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -15,6 +15,9 @@
 # limitations under the License.
 
 from __future__ import print_function
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
 import argparse
 import logging
 import re
@@ -117,6 +120,13 @@ JERRY_DEBUGGER_VALUE_FUNCTION = 7
 JERRY_DEBUGGER_VALUE_ARRAY = 8
 JERRY_DEBUGGER_VALUE_OBJECT = 9
 
+# Evaluated expressions which only read a variable. Their results are cached until the engine is resumed.
+VARIABLE_EXPRESSION = re.compile(r"^\s*[A-Za-z_$][\w$]*\s*$")
+# Evaluated expressions which read properties (e.g. a.b[0]["c"]). Getters and proxy traps may
+# change the state of the engine, so their results are only cached when it is requested.
+PROPERTY_READ_EXPRESSION = re.compile(r"^\s*[A-Za-z_$][\w$]*"
+                                      r"""(\s*(\.\s*[A-Za-z_$][\w$]*|\[\s*(\d+|"[^"\\]*"|'[^'\\]*')\s*\]))*\s*$""")
+
 def arguments_parse():
     parser = argparse.ArgumentParser(description="JerryScript debugger client")
 
@@ -140,6 +150,24 @@ def arguments_parse():
                         help="specify the transmission protocol over the communication channel (default: %(default)s)")
     parser.add_argument("--serial-config", metavar="CONFIG_STRING", default="/dev/ttyUSB0,115200,8,N,1",
                         help="Configure parameters for serial port (default: %(default)s)")
+    parser.add_argument("--record", metavar="FILE", action="store", default=None,
+                        help="record the traffic of the debugger connection into a file")
+    parser.add_argument("--replay", metavar="FILE", action="store", default=None,
+                        help="replay a recorded debugger connection instead of connecting to an engine")
+    parser.add_argument("--replay-realtime", action="store_true", default=False,
+                        help="replay the recorded connection with its original timing (default: %(default)s)")
+    parser.add_argument("--prefetch", action="store_true", default=False,
+                        help="request the backtrace and the scope chain whenever the engine stops, "
+                        "so they are displayed without waiting (default: %(default)s)")
+    parser.add_argument("--cache-property-reads", action="store_true", default=False,
+                        help="cache the results of evaluated property reads (e.g. a.b[0]) while the engine is "
+                        "stopped, which is only correct if the getters have no side effects (default: %(default)s)")
+
+    return parse_arguments(parser)
+
+
+def parse_arguments(parser):
+    """ Parse the arguments of a debugger tool and enable the debug logging if it is requested. """
     args = parser.parse_args()
 
     if args.verbose:
@@ -150,6 +178,7 @@ def arguments_parse():
 
 
 class JerryBreakpoint(object):
+    __slots__ = ["line", "offset", "function", "active_index"]
 
     def __init__(self, line, offset, function):
         self.line = line
@@ -172,6 +201,8 @@ class JerryBreakpoint(object):
                 % (self.line, self.offset, self.active_index))
 
 class JerryPendingBreakpoint(object):
+    __slots__ = ["function", "line", "source_name", "index"]
+
     def __init__(self, line=None, source_name=None, function=None):
         self.function = function
         self.line = line
@@ -188,67 +219,195 @@ class JerryPendingBreakpoint(object):
         return result
 
 
+class JerrySource(object):
+    """
+    Source code of a parsed script, which is shared by all functions of the script.
+    The code is split into lines when the lines are used first.
+    """
+    __slots__ = ["code", "function_count", "_lines"]
+
+    def __init__(self, code):
+        self.code = code
+        self.function_count = 0
+        self._lines = None
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            self._lines = re.split("\r\n|[\r\n]", self.code)
+            self.code = None
+
+            if len(self._lines) > 1 and not self._lines[-1]:
+                self._lines.pop()
+
+        return self._lines
+
+    def release(self):
+        """ Free the source code after the last function of the script is released. """
+        self.code = None
+        self._lines = []
+
+
 class JerryFunction(object):
+    """
+    Parsed function. The breakpoint locations are stored in two parallel arrays sorted
+    by byte code offset, and a JerryBreakpoint object is only created for a location
+    when it is requested (e.g. it is hit, displayed or enabled).
+    """
     # pylint: disable=too-many-instance-attributes,too-many-arguments
+    __slots__ = ["is_func", "byte_code_cp", "source", "source_name", "name", "line", "column",
+                 "lines", "offsets", "first_breakpoint_line", "first_breakpoint_offset", "_breakpoints"]
+
     def __init__(self, is_func, byte_code_cp, source, source_name, line, column, name, lines, offsets):
         self.is_func = bool(is_func)
         self.byte_code_cp = byte_code_cp
-        self.source = re.split("\r\n|[\r\n]", source)
+        self.source = source
         self.source_name = source_name
         self.name = name
-        self.lines = {}
-        self.offsets = {}
         self.line = line
         self.column = column
         self.first_breakpoint_line = lines[0]
         self.first_breakpoint_offset = offsets[0]
 
-        if len(self.source) > 1 and not self.source[-1]:
-            self.source.pop()
-
-        for i, _line in enumerate(lines):
-            offset = offsets[i]
-            breakpoint = JerryBreakpoint(_line, offset, self)
-            self.lines[_line] = breakpoint
-            self.offsets[offset] = breakpoint
+        locations = sorted(zip(offsets, lines))
+        self.offsets = array('I', [location[0] for location in locations])
+        self.lines = array('I', [location[1] for location in locations])
+        self._breakpoints = None
+
+    def _breakpoint_at(self, index):
+        offset = self.offsets[index]
+
+        if self._breakpoints is None:
+            self._breakpoints = {}
+        elif offset in self._breakpoints:
+            return self._breakpoints[offset]
+
+        breakpoint = JerryBreakpoint(self.lines[index], offset, self)
+        self._breakpoints[offset] = breakpoint
+        return breakpoint
+
+    def breakpoints(self):
+        """ Return the breakpoint objects created so far. """
+        if self._breakpoints is None:
+            return []
+        return list(self._breakpoints.values())
+
+    def display_name(self):
+        """ Name of the function in the reports of the tools. """
+        if not self.is_func:
+            return "<global>"
+        return self.name or "<anonymous>"
+
+    def line_breakpoint(self, line):
+        """ Return the breakpoint of the given line (the last one if the line has more). """
+        index = len(self.lines) - 1
+        while self.lines[index] != line:
+            index -= 1
+        return self._breakpoint_at(index)
+
+    def find_breakpoint(self, offset):
+        """
+        Return the breakpoint at the given byte code offset or the closest breakpoint
+        before it, and whether the match is exact.
+        """
+        index = bisect_right(self.offsets, offset)
+        if index == 0:
+            index = bisect_left(self.offsets, self.first_breakpoint_offset)
+            return (self._breakpoint_at(index), False)
+
+        return (self._breakpoint_at(index - 1), self.offsets[index - 1] == offset)
 
     def __repr__(self):
         result = ("Function(byte_code_cp:0x%x, source_name:%r, name:%r, line:%d, column:%d { "
                   % (self.byte_code_cp, self.source_name, self.name, self.line, self.column))
 
-        result += ','.join([str(breakpoint) for breakpoint in self.lines.values()])
+        result += ','.join([str(JerryBreakpoint(line, 0, self)) for line in sorted(set(self.lines))])
 
         return result + " })"
 
 
 class Multimap(object):
+    __slots__ = ["map"]
 
     def __init__(self):
         self.map = {}
 
     def get(self, key):
-        if key in self.map:
-            return self.map[key]
-        return []
+        return self.map.get(key, frozenset())
 
     def insert(self, key, value):
         if key in self.map:
-            self.map[key].append(value)
+            self.map[key].add(value)
         else:
-            self.map[key] = [value]
+            self.map[key] = set([value])
 
     def delete(self, key, value):
         items = self.map[key]
+        items.remove(value)
 
-        if len(items) == 1:
+        if not items:
             del self.map[key]
-        else:
-            del items[items.index(value)]
 
     def __repr__(self):
         return "Multimap(%r)" % (self.map)
 
 
+class PathSuffixTrie(object):
+    """
+    Set of paths, which can be searched by path suffix: both 'b.js' and 'a/b.js'
+    find 'x/a/b.js'. The paths are split into components at '/' and '\\', and
+    each node of the trie stores the paths which end with the components on
+    the way from the root to the node.
+    """
+
+    def __init__(self):
+        self.root = ({}, set())
+
+    @staticmethod
+    def _components(path):
+        return reversed(re.split(r"[/\\]", path))
+
+    def insert(self, path):
+        node = self.root
+        node[1].add(path)
+        for component in self._components(path):
+            node = node[0].setdefault(component, ({}, set()))
+            node[1].add(path)
+
+    def delete(self, path):
+        node = self.root
+        node[1].discard(path)
+        for component in self._components(path):
+            child = node[0][component]
+            child[1].discard(path)
+            if not child[1]:
+                del node[0][component]
+                return
+            node = child
+
+    def find(self, suffix):
+        node = self.root
+        for component in self._components(suffix):
+            node = node[0].get(component)
+            if node is None:
+                return set()
+        return node[1]
+
+
+class JerryStopRequest(object):
+    """ Backtrace, scope or eval request whose response is valid until the engine is resumed. """
+    __slots__ = ["key", "response_type", "epoch", "visible", "frame_index", "started", "text"]
+
+    def __init__(self, key, response_type, epoch, visible, frame_index):
+        self.key = key
+        self.response_type = response_type
+        self.epoch = epoch
+        self.visible = visible
+        self.frame_index = frame_index
+        self.started = False
+        self.text = ""
+
+
 class DebuggerAction(object):
     END = 0
     WAIT = 1
@@ -279,10 +438,26 @@ class JerryDebugger(object):
         self.scope_data = ""
         self.client_sources = []
         self.last_breakpoint_hit = None
+        # Breakpoints of the frames received for the last backtrace request.
+        self.last_backtrace = []
+        self.memory_stats = None
+        # Responses by request which are valid while the engine remains stopped. The
+        # cache is invalidated (and the stop epoch is increased) when the engine is resumed.
+        self.stop_cache_enabled = True
+        self.prefetch_stop_state = False
+        self.cache_property_reads = False
+        self.stop_cache = {}
+        self.stop_epoch = 0
+        # Requests whose responses are not received yet, in the order of sending.
+        self.stop_requests = deque()
         self.next_breakpoint_index = 0
         self.active_breakpoint_list = {}
         self.pending_breakpoint_list = {}
+        # Functions by (source name, breakpoint line), by source name and by function name.
         self.line_list = Multimap()
+        self.source_functions = Multimap()
+        self.function_names = Multimap()
+        self.source_names = PathSuffixTrie()
         self.display = 0
         self.green = ''
         self.red = ''
@@ -345,9 +520,13 @@ class JerryDebugger(object):
                               command_id)
         self.channel.send_message(self.byte_order, message)
 
-    def quit(self):
+    def _resume(self, command_id):
         self.prompt = False
-        self._exec_command(JERRY_DEBUGGER_CONTINUE)
+        self.invalidate_stop_cache()
+        self._exec_command(command_id)
+
+    def quit(self):
+        self._resume(JERRY_DEBUGGER_CONTINUE)
 
     def set_colors(self):
         self.nocolor = '\033[0m'
@@ -361,7 +540,11 @@ class JerryDebugger(object):
     def stop(self):
         self._exec_command(JERRY_DEBUGGER_STOP)
 
-    def set_break(self, args):
+    def set_break(self, args, add_pending=None):
+        """
+        Set a breakpoint. If it is not found, it is added as a pending breakpoint when
+        add_pending is True, or after confirmation by the user when add_pending is None.
+        """
         if not args:
             return "Error: Breakpoint index expected"
 
@@ -370,12 +553,12 @@ class JerryDebugger(object):
                 if int(args.split(':', 1)[1]) <= 0:
                     return "Error: Positive breakpoint index expected"
 
-                return self._set_breakpoint(args, False)
+                return self._set_breakpoint(args, False, add_pending)
 
             except ValueError as val_errno:
                 return "Error: Positive breakpoint index expected: %s" % (val_errno)
 
-        return self._set_breakpoint(args, False)
+        return self._set_breakpoint(args, False, add_pending)
 
     def breakpoint_list(self):
         result = ''
@@ -432,20 +615,16 @@ class JerryDebugger(object):
             return "Error: Breakpoint %d not found\n" % (breakpoint_index)
 
     def next(self):
-        self.prompt = False
-        self._exec_command(JERRY_DEBUGGER_NEXT)
+        self._resume(JERRY_DEBUGGER_NEXT)
 
     def step(self):
-        self.prompt = False
-        self._exec_command(JERRY_DEBUGGER_STEP)
+        self._resume(JERRY_DEBUGGER_STEP)
 
     def do_continue(self):
-        self.prompt = False
-        self._exec_command(JERRY_DEBUGGER_CONTINUE)
+        self._resume(JERRY_DEBUGGER_CONTINUE)
 
     def finish(self):
-        self.prompt = False
-        self._exec_command(JERRY_DEBUGGER_FINISH)
+        self._resume(JERRY_DEBUGGER_FINISH)
 
     def backtrace(self, args):
         max_depth = 0
@@ -474,7 +653,19 @@ class JerryDebugger(object):
             except ValueError as val_errno:
                 return "Error: Positive integer number expected, %s\n" % (val_errno)
 
-        self.frame_index = min_depth
+        key = ("backtrace", min_depth, max_depth, get_total)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        self._send_backtrace_request(key, True)
+
+        self.prompt = False
+        return ""
+
+    def _send_backtrace_request(self, key, visible):
+        _, min_depth, max_depth, get_total = key
+        self._track_stop_request(key, JERRY_DEBUGGER_BACKTRACE, visible, min_depth)
 
         message = struct.pack(self.byte_order + "BB" + self.idx_format + self.idx_format + "B",
                               1 + 4 + 4 + 1,
@@ -485,28 +676,39 @@ class JerryDebugger(object):
 
         self.channel.send_message(self.byte_order, message)
 
-        self.prompt = False
-        return ""
-
     def eval(self, code):
-        self._send_string(JERRY_DEBUGGER_EVAL_EVAL + code, JERRY_DEBUGGER_EVAL)
-        self.prompt = False
+        return self.eval_at(code, 0)
 
     def eval_at(self, code, index):
+        key = None
+        if VARIABLE_EXPRESSION.match(code) or (self.cache_property_reads and PROPERTY_READ_EXPRESSION.match(code)):
+            key = ("eval", index, code)
+            cached = self._cached_response(key)
+            if cached is not None:
+                return cached
+        else:
+            # The code may change the state of the engine.
+            self.invalidate_stop_cache()
+
+        self._track_stop_request(key, JERRY_DEBUGGER_EVAL_RESULT, True)
         self._send_string(JERRY_DEBUGGER_EVAL_EVAL + code, JERRY_DEBUGGER_EVAL, index)
         self.prompt = False
+        return ""
 
     def throw(self, code):
+        self.invalidate_stop_cache()
         self._send_string(JERRY_DEBUGGER_EVAL_THROW + code, JERRY_DEBUGGER_EVAL)
         self.prompt = False
 
     def abort(self, args):
         self.delete("all")
         self.exception("0")  # disable the exception handler
+        self.invalidate_stop_cache()
         self._send_string(JERRY_DEBUGGER_EVAL_ABORT + args, JERRY_DEBUGGER_EVAL)
         self.prompt = False
 
     def restart(self):
+        self.invalidate_stop_cache()
         self._send_string(JERRY_DEBUGGER_EVAL_ABORT + "\"r353t\"", JERRY_DEBUGGER_EVAL)
         self.prompt = False
 
@@ -531,9 +733,16 @@ class JerryDebugger(object):
         return "Stop at exception disabled\n"
 
     def scope_chain(self):
-        self.prompt = False
+        cached = self._cached_response(("scope",))
+        if cached is not None:
+            return cached
+
+        self._track_stop_request(("scope",), JERRY_DEBUGGER_SCOPE_CHAIN, True)
         self._exec_command(JERRY_DEBUGGER_GET_SCOPE_CHAIN)
 
+        self.prompt = False
+        return ""
+
     def scope_variables(self, args):
         index = 0
         if args:
@@ -546,6 +755,13 @@ class JerryDebugger(object):
             except ValueError as val_errno:
                 return "Error: Non negative integer number expected, %s\n" % (val_errno)
 
+        key = ("variables", index)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        self._track_stop_request(key, JERRY_DEBUGGER_SCOPE_VARIABLES, True)
+
         message = struct.pack(self.byte_order + "BB" + self.idx_format,
                               1 + 4,
                               JERRY_DEBUGGER_GET_SCOPE_VARIABLES,
@@ -560,6 +776,96 @@ class JerryDebugger(object):
         self.prompt = False
         self._exec_command(JERRY_DEBUGGER_MEMSTATS)
 
+    def invalidate_stop_cache(self):
+        """ Forget the responses received in the current stop, e.g. because the engine is resumed. """
+        self.stop_epoch += 1
+        self.stop_cache.clear()
+
+    def _cached_response(self, key):
+        """
+        Returns the response to a request if it is already known in the current stop, otherwise
+        None, and the request needs to be sent. A prefetched response which is still being received
+        is reported from now on: the already received part is returned, the rest is processed as
+        the response to a sent request.
+        """
+        if not self.stop_cache_enabled:
+            return None
+
+        text = self.stop_cache.get(key)
+        if text is not None:
+            return text
+
+        for request in self.stop_requests:
+            if request.key == key and request.epoch == self.stop_epoch and not request.visible:
+                request.visible = True
+                self.prompt = False
+                return request.text
+
+        return None
+
+    def _track_stop_request(self, key, response_type, visible, frame_index=0):
+        """ Register a sent request, a key of None means that its response is not cached. """
+        self.stop_requests.append(JerryStopRequest(key, response_type, self.stop_epoch, visible, frame_index))
+
+    def _prefetch_stop_state(self):
+        """ Request the backtrace and the scope chain of the new stop without reporting them. """
+        self._send_backtrace_request(("backtrace", 0, 0, 0), False)
+        self._track_stop_request(("scope",), JERRY_DEBUGGER_SCOPE_CHAIN, False)
+        self._exec_command(JERRY_DEBUGGER_GET_SCOPE_CHAIN)
+
+    def _current_stop_request(self, response_type):
+        """ The request which is answered by a received response of the given type. """
+        if self.stop_requests and self.stop_requests[0].response_type == response_type:
+            request = self.stop_requests[0]
+
+            if not request.started and response_type == JERRY_DEBUGGER_BACKTRACE:
+                self.frame_index = request.frame_index
+                self.last_backtrace = []
+
+            request.started = True
+            return request
+
+        return None
+
+    def _stop_response(self, response_type, result, end):
+        """
+        Record a part of the response to a stop request. Returns False if the part must not
+        be reported because the request was prefetched.
+        """
+        request = self._current_stop_request(response_type)
+        if request is None:
+            return True
+
+        request.text += result
+
+        if end:
+            self.stop_requests.popleft()
+            if request.key is not None and request.epoch == self.stop_epoch and self.stop_cache_enabled:
+                self.stop_cache[request.key] = request.text
+
+        return request.visible
+
+    def memory_usage(self):
+        """ Describe the amount of debug information stored by the client and its memory usage. """
+        sources = set(id(function.source) for function in self.function_list.values())
+        breakpoints = sum(len(function.breakpoints()) for function in self.function_list.values())
+        locations = sum(len(function.offsets) for function in self.function_list.values())
+
+        result = "Scripts: %d, functions: %d\n" % (len(sources), len(self.function_list))
+        result += "Breakpoint locations: %d (%d breakpoint objects)\n" % (locations, breakpoints)
+
+        try:
+            import resource
+        except ImportError:
+            return result
+
+        # The peak resident set size is reported in kilobytes on Linux and in bytes on macOS.
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            max_rss //= 1024
+
+        return result + "Client peak memory usage: %d KB\n" % (max_rss)
+
     def _send_string(self, args, message_type, index=0):
 
         # 1: length of type byte
@@ -617,12 +923,20 @@ class JerryDebugger(object):
         return False
 
     def _send_breakpoint(self, breakpoint):
+        self.send_breakpoint_update(breakpoint.function.byte_code_cp, breakpoint.offset,
+                                    breakpoint.active_index >= 0)
+
+    def send_breakpoint_update(self, byte_code_cp, offset, enable):
+        """
+        Enable or disable the breakpoint at the given offset of a function in the engine.
+        The breakpoint lists of the client are not updated.
+        """
         message = struct.pack(self.byte_order + "BBB" + self.cp_format + self.idx_format,
                               1 + 1 + self.cp_size + 4,
                               JERRY_DEBUGGER_UPDATE_BREAKPOINT,
-                              int(breakpoint.active_index >= 0),
-                              breakpoint.function.byte_code_cp,
-                              breakpoint.offset)
+                              int(enable),
+                              byte_code_cp,
+                              offset)
         self.channel.send_message(self.byte_order, message)
 
     def _send_bytecode_cp(self, byte_code_cp):
@@ -667,162 +981,232 @@ class JerryDebugger(object):
     def send_no_more_source(self):
         self._exec_command(JERRY_DEBUGGER_NO_MORE_SOURCES)
 
-    # pylint: disable=too-many-branches,too-many-locals,too-many-statements,too-many-return-statements
+    def get_message(self, blocking):
+        # The channel returns the messages as views of its receive buffer,
+        # which are only valid until the next message is received.
+        data = self.channel.get_message(blocking)
+        if data:
+            data = data.tobytes()
+        return data
+
+    def fileno(self):
+        """ File descriptor of the connection, which can be waited on with select. """
+        return self.channel.fileno()
+
+    def _wait_for_input(self, timeout):
+        """
+        Wait until data arrives from the engine or the user presses enter (which stops
+        the execution). Returns True if data can be received from the engine.
+        """
+        inputs = [self.channel]
+        if not self.non_interactive and not self.prompt:
+            inputs.append(sys.stdin)
+
+        ready = select.select(inputs, [], [], timeout)[0]
+
+        if sys.stdin in ready:
+            sys.stdin.readline()
+            self.stop()
+
+        return self.channel in ready
+
     def process_messages(self):
-        result = ""
+        """
+        Process the incoming messages until there is something to report. Waits without
+        consuming CPU time while the engine is running and there is nothing to process.
+        """
         while True:
-            data = self.channel.get_message(False)
-            if not self.non_interactive:
-                if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                    sys.stdin.readline()
-                    self.stop()
+            if not self.channel.has_message():
+                # Only the already arrived data is processed before the user can enter commands.
+                if not self._wait_for_input(0 if self.prompt else None) and self.prompt:
+                    return DebuggerAction(DebuggerAction.PROMPT, "")
 
-            if data == b'':
-                action_type = DebuggerAction.PROMPT if self.prompt else DebuggerAction.WAIT
-                return DebuggerAction(action_type, "")
+            data = self.get_message(True)
 
             if not data:  # Break the while loop if there is no more data.
                 return DebuggerAction(DebuggerAction.END, "")
 
-            buffer_type = ord(data[0])
-            buffer_size = len(data) -1
-
-            logging.debug("Main buffer type: %d, message size: %d", buffer_type, buffer_size)
-
-            if buffer_type in [JERRY_DEBUGGER_PARSE_ERROR,
-                               JERRY_DEBUGGER_BYTE_CODE_CP,
-                               JERRY_DEBUGGER_PARSE_FUNCTION,
-                               JERRY_DEBUGGER_BREAKPOINT_LIST,
-                               JERRY_DEBUGGER_SOURCE_CODE,
-                               JERRY_DEBUGGER_SOURCE_CODE_END,
-                               JERRY_DEBUGGER_SOURCE_CODE_NAME,
-                               JERRY_DEBUGGER_SOURCE_CODE_NAME_END,
-                               JERRY_DEBUGGER_FUNCTION_NAME,
-                               JERRY_DEBUGGER_FUNCTION_NAME_END]:
-                result = self._parse_source(data)
-                if result:
-                    return DebuggerAction(DebuggerAction.TEXT, result)
-
-            elif buffer_type == JERRY_DEBUGGER_WAITING_AFTER_PARSE:
-                self._exec_command(JERRY_DEBUGGER_PARSER_RESUME)
+            action = self.process_message(data)
+            if action is not None:
+                return action
 
-            elif buffer_type == JERRY_DEBUGGER_RELEASE_BYTE_CODE_CP:
-                self._release_function(data)
-
-            elif buffer_type in [JERRY_DEBUGGER_BREAKPOINT_HIT, JERRY_DEBUGGER_EXCEPTION_HIT]:
-                breakpoint_data = struct.unpack(self.byte_order + self.cp_format + self.idx_format, data[1:])
+    # pylint: disable=too-many-branches,too-many-locals,too-many-statements,too-many-return-statements
+    def process_message(self, data):
+        """
+        Process a single message received from the engine. Returns a DebuggerAction if
+        the message has something to report, None otherwise.
+        """
+        result = ""
+        buffer_type = ord(data[0])
+        buffer_size = len(data) -1
+
+        logging.debug("Main buffer type: %d, message size: %d", buffer_type, buffer_size)
+
+        if buffer_type in [JERRY_DEBUGGER_PARSE_ERROR,
+                           JERRY_DEBUGGER_BYTE_CODE_CP,
+                           JERRY_DEBUGGER_PARSE_FUNCTION,
+                           JERRY_DEBUGGER_BREAKPOINT_LIST,
+                           JERRY_DEBUGGER_SOURCE_CODE,
+                           JERRY_DEBUGGER_SOURCE_CODE_END,
+                           JERRY_DEBUGGER_SOURCE_CODE_NAME,
+                           JERRY_DEBUGGER_SOURCE_CODE_NAME_END,
+                           JERRY_DEBUGGER_FUNCTION_NAME,
+                           JERRY_DEBUGGER_FUNCTION_NAME_END]:
+            result = self._parse_source(data)
+            if result:
+                return DebuggerAction(DebuggerAction.TEXT, result)
 
-                breakpoint = self._get_breakpoint(breakpoint_data)
-                self.last_breakpoint_hit = breakpoint[0]
+        elif buffer_type == JERRY_DEBUGGER_WAITING_AFTER_PARSE:
+            self._exec_command(JERRY_DEBUGGER_PARSER_RESUME)
 
-                if buffer_type == JERRY_DEBUGGER_EXCEPTION_HIT:
-                    result += "Exception throw detected (to disable automatic stop type exception 0)\n"
-                    if self.exception_string:
-                        result += "Exception hint: %s\n" % (self.exception_string)
-                        self.exception_string = ""
+        elif buffer_type == JERRY_DEBUGGER_RELEASE_BYTE_CODE_CP:
+            self._release_function(data)
 
-                if breakpoint[1]:
-                    breakpoint_info = "at"
-                else:
-                    breakpoint_info = "around"
+        elif buffer_type in [JERRY_DEBUGGER_BREAKPOINT_HIT, JERRY_DEBUGGER_EXCEPTION_HIT]:
+            breakpoint_data = struct.unpack(self.byte_order + self.cp_format + self.idx_format, data[1:])
 
-                if breakpoint[0].active_index >= 0:
-                    breakpoint_info += " breakpoint:%s%d%s" % (self.red, breakpoint[0].active_index, self.nocolor)
+            breakpoint = self._get_breakpoint(breakpoint_data)
+            self.last_breakpoint_hit = breakpoint[0]
 
-                result += "Stopped %s %s\n" % (breakpoint_info, breakpoint[0])
+            if buffer_type == JERRY_DEBUGGER_EXCEPTION_HIT:
+                result += "Exception throw detected (to disable automatic stop type exception 0)\n"
+                if self.exception_string:
+                    result += "Exception hint: %s\n" % (self.exception_string)
+                    self.exception_string = ""
 
-                if self.display > 0:
-                    result += self.print_source(self.display, self.src_offset)
+            if breakpoint[1]:
+                breakpoint_info = "at"
+            else:
+                breakpoint_info = "around"
 
-                self.prompt = True
-                return DebuggerAction(DebuggerAction.TEXT, result)
+            if breakpoint[0].active_index >= 0:
+                breakpoint_info += " breakpoint:%s%d%s" % (self.red, breakpoint[0].active_index, self.nocolor)
 
-            elif buffer_type == JERRY_DEBUGGER_EXCEPTION_STR:
-                self.exception_string += data[1:]
+            result += "Stopped %s %s\n" % (breakpoint_info, breakpoint[0])
 
-            elif buffer_type == JERRY_DEBUGGER_EXCEPTION_STR_END:
-                self.exception_string += data[1:]
+            if self.display > 0:
+                result += self.print_source(self.display, self.src_offset)
 
-            elif buffer_type == JERRY_DEBUGGER_BACKTRACE_TOTAL:
-                total = struct.unpack(self.byte_order + self.idx_format, data[1:])[0]
-                result += "Total number of frames: %d\n" % (total)
-                return DebuggerAction(DebuggerAction.TEXT, result)
+            # A stop which is not requested by a command (e.g. a breakpoint hit) starts a new epoch.
+            self.invalidate_stop_cache()
+            if self.prefetch_stop_state and self.stop_cache_enabled:
+                self._prefetch_stop_state()
 
-            elif buffer_type in [JERRY_DEBUGGER_BACKTRACE, JERRY_DEBUGGER_BACKTRACE_END]:
-                frame_index = self.frame_index
+            self.prompt = True
+            return DebuggerAction(DebuggerAction.TEXT, result)
 
-                buffer_pos = 1
-                while buffer_size > 0:
-                    breakpoint_data = struct.unpack(self.byte_order + self.cp_format + self.idx_format,
-                                                    data[buffer_pos: buffer_pos + self.cp_size + 4])
+        elif buffer_type == JERRY_DEBUGGER_EXCEPTION_STR:
+            self.exception_string += data[1:]
 
-                    breakpoint = self._get_breakpoint(breakpoint_data)
+        elif buffer_type == JERRY_DEBUGGER_EXCEPTION_STR_END:
+            self.exception_string += data[1:]
 
-                    result += "Frame %d: %s\n" % (frame_index, breakpoint[0])
+        elif buffer_type == JERRY_DEBUGGER_BACKTRACE_TOTAL:
+            total = struct.unpack(self.byte_order + self.idx_format, data[1:])[0]
+            result += "Total number of frames: %d\n" % (total)
 
-                    frame_index += 1
-                    buffer_pos += self.cp_size + 4
-                    buffer_size -= self.cp_size + 4
+            if not self._stop_response(JERRY_DEBUGGER_BACKTRACE, result, False):
+                return None
+            return DebuggerAction(DebuggerAction.TEXT, result)
 
-                if buffer_type == JERRY_DEBUGGER_BACKTRACE_END:
-                    self.prompt = True
-                else:
-                    self.frame_index = frame_index
+        elif buffer_type in [JERRY_DEBUGGER_BACKTRACE, JERRY_DEBUGGER_BACKTRACE_END]:
+            self._current_stop_request(JERRY_DEBUGGER_BACKTRACE)
+            frame_index = self.frame_index
 
-                return DebuggerAction(DebuggerAction.TEXT, result)
+            buffer_pos = 1
+            while buffer_size > 0:
+                breakpoint_data = struct.unpack(self.byte_order + self.cp_format + self.idx_format,
+                                                data[buffer_pos: buffer_pos + self.cp_size + 4])
 
-            elif buffer_type in [JERRY_DEBUGGER_EVAL_RESULT,
-                                 JERRY_DEBUGGER_EVAL_RESULT_END,
-                                 JERRY_DEBUGGER_OUTPUT_RESULT,
-                                 JERRY_DEBUGGER_OUTPUT_RESULT_END]:
+                breakpoint = self._get_breakpoint(breakpoint_data)
+                self.last_backtrace.append(breakpoint[0])
 
-                result = self._process_incoming_text(buffer_type, data)
-                return DebuggerAction(DebuggerAction.TEXT, result)
+                result += "Frame %d: %s\n" % (frame_index, breakpoint[0])
 
-            elif buffer_type == JERRY_DEBUGGER_MEMSTATS_RECEIVE:
+                frame_index += 1
+                buffer_pos += self.cp_size + 4
+                buffer_size -= self.cp_size + 4
 
-                memory_stats = struct.unpack(self.byte_order + self.idx_format * 5,
-                                             data[1: 1 + 4 * 5])
+            end = buffer_type == JERRY_DEBUGGER_BACKTRACE_END
+            if not end:
+                self.frame_index = frame_index
 
-                result += "Allocated bytes: %s\n" % memory_stats[0]
-                result += "Byte code bytes: %s\n" % memory_stats[1]
-                result += "String bytes: %s\n" % memory_stats[2]
-                result += "Object bytes: %s\n" % memory_stats[3]
-                result += "Property bytes: %s\n" % memory_stats[4]
+            if not self._stop_response(JERRY_DEBUGGER_BACKTRACE, result, end):
+                return None
 
+            if end:
                 self.prompt = True
-                return DebuggerAction(DebuggerAction.TEXT, result)
+            return DebuggerAction(DebuggerAction.TEXT, result)
 
-            elif buffer_type == JERRY_DEBUGGER_WAIT_FOR_SOURCE:
-                self.send_client_source()
+        elif buffer_type in [JERRY_DEBUGGER_EVAL_RESULT,
+                             JERRY_DEBUGGER_EVAL_RESULT_END]:
 
-            elif buffer_type in [JERRY_DEBUGGER_SCOPE_CHAIN, JERRY_DEBUGGER_SCOPE_CHAIN_END]:
-                self.scope_data = data[1:]
+            # The parts of the result are received by _process_incoming_text.
+            result = self._process_incoming_text(buffer_type, data)
+            self._stop_response(JERRY_DEBUGGER_EVAL_RESULT, result, True)
+            return DebuggerAction(DebuggerAction.TEXT, result)
 
-                if buffer_type == JERRY_DEBUGGER_SCOPE_CHAIN_END:
-                    result = self._process_scope()
-                    self.scope_data = ""
+        elif buffer_type in [JERRY_DEBUGGER_OUTPUT_RESULT,
+                             JERRY_DEBUGGER_OUTPUT_RESULT_END]:
 
-                    self.prompt = True
+            result = self._process_incoming_text(buffer_type, data)
+            return DebuggerAction(DebuggerAction.TEXT, result)
 
-                return DebuggerAction(DebuggerAction.TEXT, result)
+        elif buffer_type == JERRY_DEBUGGER_MEMSTATS_RECEIVE:
 
-            elif buffer_type in [JERRY_DEBUGGER_SCOPE_VARIABLES, JERRY_DEBUGGER_SCOPE_VARIABLES_END]:
-                self.scope_vars += "".join(data[1:])
+            memory_stats = struct.unpack(self.byte_order + self.idx_format * 5,
+                                         data[1: 1 + 4 * 5])
+            self.memory_stats = memory_stats
 
-                if buffer_type == JERRY_DEBUGGER_SCOPE_VARIABLES_END:
-                    result = self._process_scope_variables()
-                    self.scope_vars = ""
+            result += "Allocated bytes: %s\n" % memory_stats[0]
+            result += "Byte code bytes: %s\n" % memory_stats[1]
+            result += "String bytes: %s\n" % memory_stats[2]
+            result += "Object bytes: %s\n" % memory_stats[3]
+            result += "Property bytes: %s\n" % memory_stats[4]
 
-                    self.prompt = True
+            self.prompt = True
+            return DebuggerAction(DebuggerAction.TEXT, result)
 
-                return DebuggerAction(DebuggerAction.TEXT, result)
+        elif buffer_type == JERRY_DEBUGGER_WAIT_FOR_SOURCE:
+            self.send_client_source()
 
-            elif JERRY_DEBUGGER_CLOSE_CONNECTION:
-                return DebuggerAction(DebuggerAction.END, "")
+        elif buffer_type in [JERRY_DEBUGGER_SCOPE_CHAIN, JERRY_DEBUGGER_SCOPE_CHAIN_END]:
+            self.scope_data = data[1:]
+            end = buffer_type == JERRY_DEBUGGER_SCOPE_CHAIN_END
 
-            else:
-                raise Exception("Unknown message")
+            if end:
+                result = self._process_scope()
+                self.scope_data = ""
+
+            if not self._stop_response(JERRY_DEBUGGER_SCOPE_CHAIN, result, end):
+                return None
+
+            if end:
+                self.prompt = True
+            return DebuggerAction(DebuggerAction.TEXT, result)
+
+        elif buffer_type in [JERRY_DEBUGGER_SCOPE_VARIABLES, JERRY_DEBUGGER_SCOPE_VARIABLES_END]:
+            self.scope_vars += "".join(data[1:])
+            end = buffer_type == JERRY_DEBUGGER_SCOPE_VARIABLES_END
+
+            if end:
+                result = self._process_scope_variables()
+                self.scope_vars = ""
+
+            if not self._stop_response(JERRY_DEBUGGER_SCOPE_VARIABLES, result, end):
+                return None
+
+            if end:
+                self.prompt = True
+            return DebuggerAction(DebuggerAction.TEXT, result)
+
+        elif JERRY_DEBUGGER_CLOSE_CONNECTION:
+            return DebuggerAction(DebuggerAction.END, "")
+
+        else:
+            raise Exception("Unknown message")
+
+        return None
 
     def print_source(self, line_num, offset):
         msg = ""
@@ -831,26 +1215,26 @@ class JerryDebugger(object):
         if not last_bp:
             return ""
 
-        lines = last_bp.function.source
+        lines = last_bp.function.source.lines
         if last_bp.function.source_name:
             msg += "Source: %s\n" % (last_bp.function.source_name)
 
         if line_num == 0:
             start = 0
-            end = len(last_bp.function.source)
+            end = len(lines)
         else:
             start = max(last_bp.line - line_num, 0)
-            end = min(last_bp.line + line_num - 1, len(last_bp.function.source))
+            end = min(last_bp.line + line_num - 1, len(lines))
             if offset:
                 if start + offset < 0:
                     self.src_offset += self.src_offset_diff
                     offset += self.src_offset_diff
-                elif end + offset > len(last_bp.function.source):
+                elif end + offset > len(lines):
                     self.src_offset -= self.src_offset_diff
                     offset -= self.src_offset_diff
 
                 start = max(start + offset, 0)
-                end = min(end + offset, len(last_bp.function.source))
+                end = min(end + offset, len(lines))
 
         for i in range(start, end):
             if i == last_bp.line - 1:
@@ -866,6 +1250,7 @@ class JerryDebugger(object):
     def _parse_source(self, data):
         source_code = ""
         source_code_name = ""
+        source = None
         function_name = ""
         stack = [{"line": 1,
                   "column": 1,
@@ -903,8 +1288,7 @@ class JerryDebugger(object):
                 position = struct.unpack(self.byte_order + self.idx_format + self.idx_format,
                                          data[1: 1 + 4 + 4])
 
-                stack.append({"source": source_code,
-                              "source_name": source_code_name,
+                stack.append({"source_name": source_code_name,
                               "line": position[0],
                               "column": position[1],
                               "name": function_name,
@@ -937,12 +1321,15 @@ class JerryDebugger(object):
 
                 # We know the last item in the list is the general byte code.
                 if not stack:
-                    func_desc["source"] = source_code
                     func_desc["source_name"] = source_code_name
 
+                # The source code is received before the byte code of the first function.
+                if source is None:
+                    source = JerrySource(source_code)
+
                 function = JerryFunction(stack,
                                          byte_code_cp,
-                                         func_desc["source"],
+                                         source,
                                          func_desc["source_name"],
                                          func_desc["line"],
                                          func_desc["column"],
@@ -975,50 +1362,56 @@ class JerryDebugger(object):
                 logging.error("Parser error!")
                 raise Exception("Unexpected message")
 
-            data = self.channel.get_message(True)
+            data = self.get_message(True)
 
         # Copy the ready list to the global storage.
         self.function_list.update(new_function_list)
 
         for function in new_function_list.values():
-            for line, breakpoint in function.lines.items():
-                self.line_list.insert(line, breakpoint)
+            self._add_function(function)
 
         # Try to set the pending breakpoints
         if self.pending_breakpoint_list:
-            logging.debug("Pending breakpoints available")
-            bp_list = self.pending_breakpoint_list
-
-            for breakpoint_index, breakpoint in bp_list.items():
-                source_lines = 0
-                for src in new_function_list.values():
-                    if (src.source_name == breakpoint.source_name or
-                            src.source_name.endswith("/" + breakpoint.source_name) or
-                            src.source_name.endswith("\\" + breakpoint.source_name)):
-                        source_lines = len(src.source)
-                        break
+            result += self._resolve_pending_breakpoints(new_function_list.values())
+            return result
 
-                if breakpoint.line:
-                    if breakpoint.line <= source_lines:
-                        command = breakpoint.source_name + ":" + str(breakpoint.line)
-                        set_result = self._set_breakpoint(command, True)
+        logging.debug("No pending breakpoints")
+        return result
 
-                        if set_result:
-                            result += set_result
-                            del bp_list[breakpoint_index]
-                elif breakpoint.function:
-                    command = breakpoint.function
+    def _resolve_pending_breakpoints(self, new_functions):
+        """ Set the pending breakpoints which are in the sources of the newly parsed functions. """
+        logging.debug("Pending breakpoints available")
+        result = ""
+        bp_list = self.pending_breakpoint_list
+
+        # The sources are only split into lines if a pending line breakpoint refers to them.
+        new_sources = dict((function.source_name, function.source) for function in new_functions)
+
+        for breakpoint_index, breakpoint in bp_list.items():
+            if breakpoint.line:
+                source = None
+                for source_name in self._find_source_names(breakpoint.source_name):
+                    if source_name in new_sources:
+                        source = new_sources[source_name]
+                        break
+
+                if source is not None and breakpoint.line <= len(source.lines):
+                    command = breakpoint.source_name + ":" + str(breakpoint.line)
                     set_result = self._set_breakpoint(command, True)
 
                     if set_result:
                         result += set_result
                         del bp_list[breakpoint_index]
+            elif breakpoint.function:
+                command = breakpoint.function
+                set_result = self._set_breakpoint(command, True)
 
-            if not bp_list:
-                self._send_parser_config(0)
-            return result
+                if set_result:
+                    result += set_result
+                    del bp_list[breakpoint_index]
 
-        logging.debug("No pending breakpoints")
+        if not bp_list:
+            self._send_parser_config(0)
         return result
 
 
@@ -1028,15 +1421,47 @@ class JerryDebugger(object):
 
         function = self.function_list[byte_code_cp]
 
-        for line, breakpoint in function.lines.items():
-            self.line_list.delete(line, breakpoint)
+        for breakpoint in function.breakpoints():
             if breakpoint.active_index >= 0:
                 del self.active_breakpoint_list[breakpoint.active_index]
 
+        self._remove_function(function)
         del self.function_list[byte_code_cp]
         self._send_bytecode_cp(byte_code_cp)
         logging.debug("Function {0x%x} byte-code released", byte_code_cp)
 
+    def _add_function(self, function):
+        for line in set(function.lines):
+            self.line_list.insert((function.source_name, line), function)
+
+        if not self.source_functions.get(function.source_name):
+            self.source_names.insert(function.source_name)
+
+        self.source_functions.insert(function.source_name, function)
+        self.function_names.insert(function.name, function)
+        function.source.function_count += 1
+
+    def _remove_function(self, function):
+        for line in set(function.lines):
+            self.line_list.delete((function.source_name, line), function)
+
+        self.source_functions.delete(function.source_name, function)
+        self.function_names.delete(function.name, function)
+
+        function.source.function_count -= 1
+        if not function.source.function_count:
+            function.source.release()
+
+        if not self.source_functions.get(function.source_name):
+            self.source_names.delete(function.source_name)
+
+    def _find_source_names(self, source_name):
+        """ Return the loaded source names which are equal to or end with the given path. """
+        return [name for name in sorted(self.source_names.find(source_name))
+                if (name == source_name or
+                    name.endswith("/" + source_name) or
+                    name.endswith("\\" + source_name))]
+
 
     def _enable_breakpoint(self, breakpoint):
         if isinstance(breakpoint, JerryPendingBreakpoint):
@@ -1063,7 +1488,7 @@ class JerryDebugger(object):
                                               breakpoint)
 
 
-    def _set_breakpoint(self, string, pending):
+    def _set_breakpoint(self, string, pending, add_pending=None):
         line = re.match("(.*):(\\d+)$", string)
         result = ""
 
@@ -1071,31 +1496,26 @@ class JerryDebugger(object):
             source_name = line.group(1)
             new_line = int(line.group(2))
 
-            for breakpoint in self.line_list.get(new_line):
-                func_source = breakpoint.function.source_name
-                if (source_name == func_source or
-                        func_source.endswith("/" + source_name) or
-                        func_source.endswith("\\" + source_name)):
-
-                    result += self._enable_breakpoint(breakpoint)
+            for func_source in self._find_source_names(source_name):
+                functions = sorted(self.line_list.get((func_source, new_line)),
+                                   key=lambda x: (x.line, x.column))
+                for function in functions:
+                    result += self._enable_breakpoint(function.line_breakpoint(new_line))
 
         else:
-            functions_to_enable = []
-            for function in self.function_list.values():
-                if function.name == string:
-                    functions_to_enable.append(function)
-
-            functions_to_enable.sort(key=lambda x: x.line)
+            functions_to_enable = sorted(self.function_names.get(string), key=lambda x: x.line)
 
             for function in functions_to_enable:
-                result += self._enable_breakpoint(function.lines[function.first_breakpoint_line])
+                result += self._enable_breakpoint(function.line_breakpoint(function.first_breakpoint_line))
 
         if not result and not pending:
-            print("No breakpoint found, do you want to add a %spending breakpoint%s? (y or [n]) " % \
-                  (self.yellow, self.nocolor), end='')
+            if add_pending is None:
+                print("No breakpoint found, do you want to add a %spending breakpoint%s? (y or [n]) " % \
+                      (self.yellow, self.nocolor), end='')
 
-            ans = sys.stdin.readline()
-            if ans in ['yes\n', 'y\n']:
+                add_pending = sys.stdin.readline() in ['yes\n', 'y\n']
+
+            if add_pending:
                 if not self.pending_breakpoint_list:
                     self._send_parser_config(1)
 
@@ -1110,21 +1530,7 @@ class JerryDebugger(object):
 
     def _get_breakpoint(self, breakpoint_data):
         function = self.function_list[breakpoint_data[0]]
-        offset = breakpoint_data[1]
-
-        if offset in function.offsets:
-            return (function.offsets[offset], True)
-
-        if offset < function.first_breakpoint_offset:
-            return (function.offsets[function.first_breakpoint_offset], False)
-
-        nearest_offset = -1
-
-        for current_offset in function.offsets:
-            if current_offset <= offset and current_offset > nearest_offset:
-                nearest_offset = current_offset
-
-        return (function.offsets[nearest_offset], False)
+        return function.find_breakpoint(breakpoint_data[1])
 
     def _process_incoming_text(self, buffer_type, data):
         message = b""
@@ -1138,7 +1544,7 @@ class JerryDebugger(object):
             else:
                 message += data[1:]
 
-            data = self.channel.get_message(True)
+            data = self.get_message(True)
             buffer_type = ord(data[0])
             # Checks if the next frame would be an invalid data frame.
             # If it is not the message type, or the end type of it, an exception is thrown.
@@ -15,37 +15,32 @@
 # limitations under the License.
 
 import struct
-
-MAX_BUFFER_SIZE = 256
+from jerry_client_buffer import ReceiveBuffer
 
 class RawPacket(object):
     """ Simplified transmission layer. """
     def __init__(self, protocol):
         self.protocol = protocol
-        self.data_buffer = b""
+        self.data_buffer = ReceiveBuffer(protocol)
 
     def connect(self, config_size):
         """  Create connection. """
         self.protocol.connect()
-        self.data_buffer = b""
+        self.data_buffer = ReceiveBuffer(self.protocol)
 
         # It will return with the Network configurations, which has the following struct:
         # header [1] - size[1]
         # configuration [config_size]
         len_expected = config_size + 1
 
-        while len(self.data_buffer) < len_expected:
-            self.data_buffer += self.protocol.receive_data()
+        self.data_buffer.receive_at_least(len_expected)
 
         expected = struct.pack("B", config_size)
 
-        if self.data_buffer[0:1] != expected:
+        if self.data_buffer.consume(1).tobytes() != expected:
             raise Exception("Unexpected configuration")
 
-        result = self.data_buffer[1:len_expected]
-        self.data_buffer = self.data_buffer[len_expected:]
-
-        return result
+        return self.data_buffer.consume(config_size).tobytes()
 
     def close(self):
         """ Close connection. """
@@ -61,30 +56,34 @@ class RawPacket(object):
                 data = data[bytes_send:]
             msg_size -= bytes_send
 
+    def fileno(self):
+        """ File descriptor of the underlying protocol. """
+        return self.protocol.fileno()
+
+    def has_message(self):
+        """ Return True if get_message can return without receiving data. """
+        # A closed connection is reported by get_message immediately.
+        return self.data_buffer is None or self.data_buffer.has_message(1)
+
     def get_message(self, blocking):
-        """ Receive message. """
+        """
+        Receive message. The message is a memoryview, which is only valid until
+        the next message is received.
+        """
 
         # Connection was closed
         if self.data_buffer is None:
             return None
 
         while True:
-            if len(self.data_buffer) >= 1:
-                size = ord(self.data_buffer[0])
-                if size == 0:
+            result = self.data_buffer.take_message(1)
+            if result is not None:
+                if not result:
                     raise Exception("Unexpected data frame")
-
-                if len(self.data_buffer) >= size + 1:
-                    result = self.data_buffer[1:size + 1]
-                    self.data_buffer = self.data_buffer[size + 1:]
-                    return result
+                return result
 
             if not blocking and not self.protocol.ready():
                 return b''
 
-            received_data = self.protocol.receive_data(MAX_BUFFER_SIZE)
-
-            if not received_data:
+            if not self.data_buffer.receive():
                 return None
-
-            self.data_buffer += received_data
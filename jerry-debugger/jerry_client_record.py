@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+import time
+
+# Format of the recorded traffic:
+#   header: magic [8] - channel name length [1] - channel name
+#   records: time [8, double, seconds since connect] - direction [1] - size [4] - data [size]
+# All values are little-endian.
+RECORD_MAGIC = b"JRDBGREC"
+RECORD_HEADER = struct.Struct("<dBI")
+
+RECORD_RECEIVED = 0
+RECORD_SENT = 1
+
+class RecordingProtocol(object):
+    """ Transmission protocol wrapper, which records the traffic of the wrapped protocol into a file. """
+    def __init__(self, protocol, path, channel_name):
+        self.protocol = protocol
+        self.log = open(path, "wb")
+        self.log.write(RECORD_MAGIC + struct.pack("B", len(channel_name)) + channel_name.encode("ascii"))
+        self.start = None
+
+    def _record(self, direction, data):
+        self.log.write(RECORD_HEADER.pack(time.time() - self.start, direction, len(data)))
+        self.log.write(data)
+
+    def connect(self):
+        self.start = time.time()
+        self.protocol.connect()
+
+    def close(self):
+        self.protocol.close()
+        self.log.close()
+
+    def receive_data(self, max_size=1024):
+        data = self.protocol.receive_data(max_size)
+        self._record(RECORD_RECEIVED, data)
+        return data
+
+    def receive_data_into(self, view):
+        size = self.protocol.receive_data_into(view)
+        self._record(RECORD_RECEIVED, view[:size].tobytes())
+        return size
+
+    def send_data(self, data):
+        size = self.protocol.send_data(data)
+        self._record(RECORD_SENT, data[:size])
+        return size
+
+    def ready(self):
+        return self.protocol.ready()
+
+    def fileno(self):
+        return self.protocol.fileno()
+
+
+def read_header(log):
+    """ Read the header of a recording, returns the name of the recorded channel. """
+    if log.read(len(RECORD_MAGIC)) != RECORD_MAGIC:
+        raise Exception("Not a debugger traffic recording")
+
+    size = struct.unpack("B", log.read(1))[0]
+    return log.read(size).decode("ascii")
+
+
+def read_records(log):
+    """ Generate the (time, direction, data) records of a recording after its header. """
+    while True:
+        header = log.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return
+
+        timestamp, direction, size = RECORD_HEADER.unpack(header)
+        yield (timestamp, direction, log.read(size))
+
+
+class ReplayProtocol(object):
+    """
+    Transmission protocol, which plays back the data received in a recording. The client
+    must send the same commands as in the recorded session: the sent data is dropped, but
+    each received chunk is only played back after the client sent as much data as before
+    it in the recording. The data is returned as fast as it is requested, or with the
+    recorded timing if realtime is True.
+    """
+    def __init__(self, path, realtime=False):
+        self.received = []
+        sent = 0
+
+        with open(path, "rb") as log:
+            self.channel_name = read_header(log)
+            for timestamp, direction, data in read_records(log):
+                if direction == RECORD_SENT:
+                    sent += len(data)
+                elif data:
+                    self.received.append((timestamp, sent, data))
+
+        self.realtime = realtime
+        self.index = 0
+        self.pending = b""
+        self.sent = 0
+        self.start = None
+
+        # Select is used to wait for data, so the replayed connection needs a file descriptor.
+        # The read end of this pipe contains a byte while the next chunk can be played back.
+        self._pipe = os.pipe()
+        self._readable = False
+
+    def connect(self):
+        self.start = time.time()
+        self._update_pipe()
+
+    def close(self):
+        if self._pipe:
+            os.close(self._pipe[0])
+            os.close(self._pipe[1])
+            self._pipe = None
+
+    def _available(self):
+        # The end of the recording is reported as a closed connection.
+        return bool(self.pending) or self.index == len(self.received) or self.received[self.index][1] <= self.sent
+
+    def _update_pipe(self):
+        available = self._available()
+        if available and not self._readable:
+            os.write(self._pipe[1], b"\0")
+        elif not available and self._readable:
+            os.read(self._pipe[0], 1)
+        self._readable = available
+
+    def _next_data(self):
+        if not self.pending:
+            if not self._available() or self.index == len(self.received):
+                return b""
+
+            timestamp, _, self.pending = self.received[self.index]
+            self.index += 1
+
+            if self.realtime:
+                delay = self.start + timestamp - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+
+        return self.pending
+
+    def _consume(self, size):
+        self.pending = self.pending[size:]
+        self._update_pipe()
+
+    def receive_data(self, max_size=1024):
+        data = self._next_data()[:max_size]
+        self._consume(len(data))
+        return data
+
+    def receive_data_into(self, view):
+        data = self._next_data()[:len(view)]
+        view[:len(data)] = data
+        self._consume(len(data))
+        return len(data)
+
+    def send_data(self, data):
+        self.sent += len(data)
+        self._update_pipe()
+        return len(data)
+
+    def ready(self):
+        if not self._available():
+            return False
+
+        if self.pending or self.index == len(self.received) or not self.realtime:
+            return True
+
+        return self.start + self.received[self.index][0] <= time.time()
+
+    def fileno(self):
+        return self._pipe[0]
@@ -44,10 +44,19 @@ class Serial(object):
         """ The maximum amount of data to be received at once is specified by max_size. """
         return self.ser.read(max_size)
 
+    def receive_data_into(self, view):
+        """ Read the available data (but at least one byte) into the given writable buffer. """
+        size = min(len(view), max(self.ser.in_waiting, 1))
+        return self.ser.readinto(view[:size])
+
     def send_data(self, data):
         """ Write data to the serial port. """
         return self.ser.write(data)
 
+    def fileno(self):
+        """ Return the file descriptor of the serial port. """
+        return self.ser.fileno()
+
     def ready(self):
         """ Monitor the file descriptor. """
         result = select.select([self.ser.fileno()], [], [], 0)[0]
@@ -32,6 +32,11 @@ class Socket(object):
         print("Connecting to: %s:%s" % (self.address[0], self.address[1]))
         self.socket.connect(self.address)
 
+        # Commands often consist of several small messages (e.g. breakpoint updates followed
+        # by continue), which must not wait for the acknowledgement of the previous ones.
+        if self.socket.family in [socket.AF_INET, socket.AF_INET6]:
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     def close(self):
         """" Mark the socket closed. """
         self.socket.close()
@@ -40,10 +45,18 @@ class Socket(object):
         """ The maximum amount of data to be received at once is specified by max_size. """
         return self.socket.recv(max_size)
 
+    def receive_data_into(self, view):
+        """ Receive data into the given writable buffer, returns the number of received bytes. """
+        return self.socket.recv_into(view)
+
     def send_data(self, data):
         """ Send data to the socket. The socket must be connected to a remote socket. """
         return self.socket.send(data)
 
+    def fileno(self):
+        """ Return the file descriptor of the socket. """
+        return self.socket.fileno()
+
     def ready(self):
         """ Monitor the file descriptor. """
         result = select.select([self.socket], [], [], 0)[0]
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers of the debugger tools: the connection arguments, the creation of the channels
+and the timestamps.
+"""
+
+import logging
+import socket
+import sys
+import time
+import timeit
+import jerry_client_main
+
+from jerry_client_websocket import WebSocket
+from jerry_client_rawpacket import RawPacket
+from jerry_client_tcp import Socket
+
+# Timestamps of the tools: monotonic where it is available.
+monotonic = getattr(time, "monotonic", timeit.default_timer) # pylint: disable=invalid-name
+
+def add_connection_arguments(parser, multiple=False):
+    """
+    Add the address, verbosity and communication arguments of the debugger tools to the parser.
+    With multiple the tool connects to every given address (and serial configuration).
+    """
+    if multiple:
+        parser.add_argument("address", action="store", nargs="+",
+                            help="network address (tcp) or serial configuration (serial) of the engines")
+    else:
+        parser.add_argument("address", action="store", nargs="?", default="localhost:5001",
+                            help="specify a unique network address for tcp connection (default: %(default)s)")
+    parser.add_argument("-v", "--verbose", action="store_true", default=False,
+                        help="increase verbosity (default: %(default)s)")
+    parser.add_argument("--channel", choices=["websocket", "rawpacket"], default="websocket",
+                        help="specify the communication channel (default: %(default)s)")
+    parser.add_argument("--protocol", choices=["tcp", "serial"], default="tcp",
+                        help="specify the transmission protocol over the communication channel (default: %(default)s)")
+    if not multiple:
+        parser.add_argument("--serial-config", metavar="CONFIG_STRING", default="/dev/ttyUSB0,115200,8,N,1",
+                            help="Configure parameters for serial port (default: %(default)s)")
+
+
+def connect_debugger(args):
+    """ Connect a non-interactive debugger to the engine given by the arguments (see add_connection_arguments). """
+    address = args.address if args.protocol == "tcp" else args.serial_config
+
+    debugger = jerry_client_main.JerryDebugger(create_channel(address, args.channel, args.protocol))
+    debugger.non_interactive = True
+
+    logging.debug("Connected to JerryScript")
+    return debugger
+
+
+def disconnect(debugger):
+    """ Close the connection of a debugger. Disconnecting resumes the engine. """
+    debugger.channel.close()
+    debugger.channel = None
+
+
+def run_tool(main_function):
+    """ Run the main function of a debugger tool, connection errors exit with an error message. """
+    try:
+        main_function()
+    except socket.error as error_msg:
+        sys.exit("Failed to connect to the JerryScript debugger.\nError: %s" % (error_msg))
+
+
+def create_channel(address, channel_name, protocol_name):
+    """ Create the (not yet connected) communication channel for the given address. """
+    if protocol_name == "tcp":
+        if ":" not in address:
+            address = (address, 5001) # use default port
+        else:
+            host, port = address.split(":")
+            address = (host, int(port))
+
+        protocol = Socket(address)
+    else:
+        from jerry_client_serial import Serial
+        protocol = Serial(address)
+
+    if channel_name == "websocket":
+        return WebSocket(protocol=protocol)
+    return RawPacket(protocol=protocol)
+
+
+class DebuggerTool(object):
+    """
+    Base of the tools which drive the debugger of one engine. The messages of the engine
+    are processed one by one (see _process_message): the subclasses handle the message
+    types they are interested in, the session ends when the engine finishes or the
+    connection is closed, and the other texts reported by the engine are passed to the
+    write callback.
+    """
+    def __init__(self, debugger, write=None):
+        self.debugger = debugger
+        self.write = write
+        self.closed = False
+
+    def _prepare_message(self, buffer_type, data):
+        """ Called with a received message before it is processed by the debugger. """
+
+    def _handle_message(self, buffer_type, action):
+        """ Handle a processed message, returns True if the message needs no further processing. """
+
+    def _process_message(self):
+        """ Read and process one message of the engine. """
+        data = self.debugger.get_message(True)
+
+        if not data:
+            self.closed = True
+            return
+
+        buffer_type = ord(data[0])
+        self._prepare_message(buffer_type, data)
+        action = self.debugger.process_message(data)
+
+        if self._handle_message(buffer_type, action) or action is None:
+            return
+
+        if action.get_type() == jerry_client_main.DebuggerAction.END:
+            self.closed = True
+        elif action.get_text() and self.write:
+            self.write(action.get_text())
@@ -15,15 +15,15 @@
 # limitations under the License.
 
 import struct
+from jerry_client_buffer import ReceiveBuffer
 
-MAX_BUFFER_SIZE = 128
 WEBSOCKET_BINARY_FRAME = 2
 WEBSOCKET_FIN_BIT = 0x80
 
 class WebSocket(object):
     def __init__(self, protocol):
 
-        self.data_buffer = b""
+        self.data_buffer = ReceiveBuffer(protocol)
         self.protocol = protocol
 
     def __handshake(self):
@@ -41,21 +41,15 @@ class WebSocket(object):
 
         len_expected = len(expected)
 
-        while len(self.data_buffer) < len_expected:
-            self.data_buffer += self.protocol.receive_data()
+        self.data_buffer.receive_at_least(len_expected)
 
-        if self.data_buffer[0:len_expected] != expected:
+        if self.data_buffer.consume(len_expected).tobytes() != expected:
             raise Exception("Unexpected handshake")
 
-        if len(self.data_buffer) > len_expected:
-            self.data_buffer = self.data_buffer[len_expected:]
-        else:
-            self.data_buffer = b""
-
     def connect(self, config_size):
         """  WebSockets connection. """
         self.protocol.connect()
-        self.data_buffer = b""
+        self.data_buffer = ReceiveBuffer(self.protocol)
         self.__handshake()
 
         # It will return with the Network configurations, which has the following struct:
@@ -63,20 +57,16 @@ class WebSocket(object):
         # configuration [config_size]
         len_expected = config_size + 2
 
-        while len(self.data_buffer) < len_expected:
-            self.data_buffer += self.protocol.receive_data()
+        self.data_buffer.receive_at_least(len_expected)
 
         expected = struct.pack("BB",
                                WEBSOCKET_BINARY_FRAME | WEBSOCKET_FIN_BIT,
                                config_size)
 
-        if self.data_buffer[0:2] != expected:
+        if self.data_buffer.consume(2).tobytes() != expected:
             raise Exception("Unexpected configuration")
 
-        result = self.data_buffer[2:len_expected]
-        self.data_buffer = self.data_buffer[len_expected:]
-
-        return result
+        return self.data_buffer.consume(config_size).tobytes()
 
     def __send_data(self, data):
         """ Private function to send data using the given protocol. """
@@ -101,8 +91,20 @@ class WebSocket(object):
         """ Close the WebSockets connection. """
         self.protocol.close()
 
+    def fileno(self):
+        """ File descriptor of the underlying protocol. """
+        return self.protocol.fileno()
+
+    def has_message(self):
+        """ Return True if get_message can return without receiving data. """
+        # A closed connection is reported by get_message immediately.
+        return self.data_buffer is None or self.data_buffer.has_message(2)
+
     def get_message(self, blocking):
-        """ Receive message. """
+        """
+        Receive message. The message is a memoryview, which is only valid until
+        the next message is received.
+        """
 
         # Connection was closed
         if self.data_buffer is None:
@@ -110,24 +112,20 @@ class WebSocket(object):
 
         while True:
             if len(self.data_buffer) >= 2:
-                if ord(self.data_buffer[0]) != WEBSOCKET_BINARY_FRAME | WEBSOCKET_FIN_BIT:
+                if self.data_buffer.byte_at(0) != WEBSOCKET_BINARY_FRAME | WEBSOCKET_FIN_BIT:
                     raise Exception("Unexpected data frame")
 
-                size = ord(self.data_buffer[1])
+                size = self.data_buffer.byte_at(1)
                 if size == 0 or size >= 126:
                     raise Exception("Unexpected data frame")
 
-                if len(self.data_buffer) >= size + 2:
-                    result = self.data_buffer[2:size + 2]
-                    self.data_buffer = self.data_buffer[size + 2:]
+                result = self.data_buffer.take_message(2)
+                if result is not None:
                     return result
 
             if not blocking and not self.protocol.ready():
                 return b''
 
-            data = self.protocol.receive_data(MAX_BUFFER_SIZE)
-
-            if not data:
+            if not self.data_buffer.receive():
                 self.data_buffer = None
                 return None
-            self.data_buffer += data
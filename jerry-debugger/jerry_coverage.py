@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Line coverage collector built on the debugger protocol.
+
+Every breakpoint location is enabled when its function is parsed. When a breakpoint
+is hit, its line is recorded as covered, the breakpoints of the line are disabled and
+the execution is resumed, so the engine stops at most once for each line and the
+overhead decreases as the coverage saturates. The coverage can be written in lcov
+tracefile and JSON formats.
+"""
+
+from __future__ import print_function
+import argparse
+import json
+import struct
+import sys
+import jerry_client_main
+
+from jerry_client_main import parse_arguments
+from jerry_client_tool import DebuggerTool, add_connection_arguments, connect_debugger, run_tool
+
+def arguments_parse():
+    parser = argparse.ArgumentParser(description="JerryScript line coverage collector")
+
+    add_connection_arguments(parser)
+    parser.add_argument("--lcov", metavar="FILE",
+                        help="write the coverage as an lcov tracefile into the file")
+    parser.add_argument("--json", metavar="FILE",
+                        help="write the coverage in JSON format into the file")
+    return parse_arguments(parser)
+
+
+class CoverageCollector(DebuggerTool):
+    """
+    Collects the line coverage of a debugged engine.
+
+    The lines with breakpoint locations are the coverable lines, the coverage is
+    kept by source name (see lines and functions), so it is not lost when the byte
+    code of a function is released. The engine waits after parsing a script until
+    the breakpoints of the new functions are enabled.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, debugger, write=None):
+        super(CoverageCollector, self).__init__(debugger, write)
+        # Coverage by source name: {line: covered} and {(line, function name): covered}.
+        self.lines = {}
+        self.functions = {}
+        self.stops = 0
+        self.enabled_breakpoints = 0
+        self.disabled_breakpoints = 0
+        self._armed = set()
+
+        # pylint: disable=protected-access
+        debugger._send_parser_config(1)
+        debugger.exception("0")
+
+    def run(self):
+        """ Collect the coverage until the engine finishes. """
+        while not self.closed:
+            self._process_message()
+
+    def _prepare_message(self, buffer_type, data):
+        debugger = self.debugger
+
+        if buffer_type == jerry_client_main.JERRY_DEBUGGER_WAITING_AFTER_PARSE:
+            # The engine resumes parsing after the breakpoints are enabled.
+            self._arm_new_functions()
+        elif buffer_type == jerry_client_main.JERRY_DEBUGGER_RELEASE_BYTE_CODE_CP:
+            byte_code_cp = struct.unpack(debugger.byte_order + debugger.cp_format,
+                                         data[1:1 + debugger.cp_size])[0]
+            self._armed.discard(debugger.function_list.get(byte_code_cp))
+
+    def _handle_message(self, buffer_type, action):
+        if buffer_type == jerry_client_main.JERRY_DEBUGGER_BREAKPOINT_HIT:
+            self.stops += 1
+            self._cover(self.debugger.last_breakpoint_hit)
+
+            # The functions parsed before the first stop are enabled here.
+            self._arm_new_functions()
+            self.debugger.do_continue()
+            return True
+
+        if buffer_type == jerry_client_main.JERRY_DEBUGGER_EXCEPTION_HIT:
+            self.debugger.do_continue()
+            return True
+
+        return False
+
+    def _arm_new_functions(self):
+        for function in self.debugger.function_list.values():
+            if function not in self._armed:
+                self._armed.add(function)
+                self._arm(function)
+
+    def _arm(self, function):
+        lines = self.lines.setdefault(function.source_name, {})
+        functions = self.functions.setdefault(function.source_name, {})
+
+        if function.is_func:
+            functions.setdefault((function.line, function.display_name()), False)
+
+        for offset, line in zip(function.offsets, function.lines):
+            if not lines.setdefault(line, False):
+                self.debugger.send_breakpoint_update(function.byte_code_cp, offset, True)
+                self.enabled_breakpoints += 1
+
+    def _cover(self, breakpoint):
+        function = breakpoint.function
+        lines = self.lines.setdefault(function.source_name, {})
+
+        if function.is_func:
+            functions = self.functions.setdefault(function.source_name, {})
+            functions[(function.line, function.display_name())] = True
+
+        if lines.get(breakpoint.line):
+            return
+
+        lines[breakpoint.line] = True
+
+        # Disable every breakpoint of the line.
+        for line_function in self.debugger.line_list.get((function.source_name, breakpoint.line)):
+            if line_function not in self._armed:
+                continue
+
+            for offset, line in zip(line_function.offsets, line_function.lines):
+                if line == breakpoint.line:
+                    self.debugger.send_breakpoint_update(line_function.byte_code_cp, offset, False)
+                    self.disabled_breakpoints += 1
+
+    def to_lcov(self):
+        """ Coverage as an lcov tracefile. The sources without name (e.g. eval code) are omitted. """
+        result = ""
+        for source_name in sorted(self.lines):
+            if not source_name:
+                continue
+
+            lines = self.lines[source_name]
+            functions = self.functions.get(source_name, {})
+
+            result += "TN:\nSF:%s\n" % source_name
+            for line, name in sorted(functions):
+                result += "FN:%d,%s\n" % (line, name)
+            for line, name in sorted(functions):
+                result += "FNDA:%d,%s\n" % (int(functions[(line, name)]), name)
+            result += "FNF:%d\nFNH:%d\n" % (len(functions), sum(functions.values()))
+            for line in sorted(lines):
+                result += "DA:%d,%d\n" % (line, int(lines[line]))
+            result += "LF:%d\nLH:%d\nend_of_record\n" % (len(lines), sum(lines.values()))
+        return result
+
+    def to_json(self):
+        """ Coverage by source name: the covered and not covered lines and functions. """
+        result = {}
+        for source_name in self.lines:
+            lines = self.lines[source_name]
+            functions = self.functions.get(source_name, {})
+            result[source_name] = {
+                "lines": dict((str(line), int(covered)) for line, covered in lines.items()),
+                "functions": [{"name": name, "line": line, "covered": covered}
+                              for (line, name), covered in sorted(functions.items())],
+            }
+        return result
+
+    def summary(self):
+        result = ""
+        total = covered = 0
+        for source_name in sorted(self.lines):
+            lines = self.lines[source_name]
+            total += len(lines)
+            covered += sum(lines.values())
+            result += "%s: %d of %d lines covered\n" % (source_name or "<unknown>", sum(lines.values()), len(lines))
+
+        if total:
+            result += "Total: %d of %d lines covered (%.1f%%)\n" % (covered, total, covered * 100.0 / total)
+        result += "Stops: %d, enabled breakpoints: %d, disabled breakpoints: %d\n" % (
+            self.stops, self.enabled_breakpoints, self.disabled_breakpoints)
+        return result
+
+
+def main():
+    args = arguments_parse()
+
+    debugger = connect_debugger(args)
+
+    collector = CoverageCollector(debugger, write=sys.stdout.write)
+    collector.run()
+
+    if args.lcov:
+        with open(args.lcov, "w") as lcov_file:
+            lcov_file.write(collector.to_lcov())
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(collector.to_json(), json_file, indent=2, sort_keys=True)
+
+    print(collector.summary(), end="")
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory statistics time-series collector built on the debugger protocol.
+
+The memory statistics of one or more engines are polled at a fixed interval, either
+while the engines are running or when they stop at the given breakpoints (safe points).
+The samples are streamed to a CSV or JSON lines file, so the memory use of the collector
+does not grow with the length of the collection.
+
+Leaks are detected from the minimum of each window of samples: the garbage collector
+makes the heap usage saw-toothed, but the low-water mark of a leaking engine keeps
+growing. A statistic is flagged when its window minimum grew in each of the last windows.
+"""
+
+from __future__ import print_function
+import argparse
+import collections
+import json
+import logging
+import socket
+import time
+
+from jerry_client_fleet import MEMSTATS_FIELDS, DebuggerFleet, write_prefixed
+from jerry_client_main import parse_arguments
+from jerry_client_tool import add_connection_arguments, disconnect, monotonic, run_tool
+
+MEMSTATS_COLUMNS = ["allocated", "byte_code", "string", "object", "property"]
+
+def arguments_parse():
+    parser = argparse.ArgumentParser(description="JerryScript memory statistics collector")
+
+    add_connection_arguments(parser, multiple=True)
+    parser.add_argument("--interval", metavar="SECONDS", type=float, default=1.0,
+                        help="time between the samples of an engine (default: %(default)s)")
+    parser.add_argument("--break", metavar="BREAKPOINT", dest="breakpoints", action="append", default=[],
+                        help="sample when the engines stop at the breakpoint instead of while they are running "
+                        "(can be specified multiple times)")
+    parser.add_argument("--duration", metavar="SECONDS", type=float,
+                        help="disconnect from the engines after collecting for the given time")
+    parser.add_argument("--output", metavar="FILE", default="memstats.csv",
+                        help="file of the samples (default: %(default)s)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv",
+                        help="format of the samples (default: %(default)s)")
+    parser.add_argument("--window", metavar="SAMPLES", type=int, default=60,
+                        help="number of samples in a window of the leak detection (default: %(default)s)")
+    parser.add_argument("--leak-windows", metavar="N", type=int, default=5,
+                        help="number of consecutive windows with growing minimum which indicate a leak "
+                        "(default: %(default)s)")
+    args = parse_arguments(parser)
+
+    if args.interval < 0:
+        parser.error("the interval must not be negative")
+    if args.window < 1 or args.leak_windows < 2:
+        parser.error("the window must contain at least one sample and at least two windows are required")
+
+    return args
+
+
+class CsvWriter(object):
+    """ Writes the samples as comma separated values with a header line. """
+    def __init__(self, output):
+        self.output = output
+        output.write("time,instance,location,%s\n" % ",".join(MEMSTATS_COLUMNS))
+
+    def sample(self, timestamp, name, location, stats):
+        self.output.write("%.3f,%s,%s,%s\n" % (timestamp, _csv_field(name), _csv_field(location or ""),
+                                               ",".join(str(value) for value in stats)))
+        self.output.flush()
+
+
+def _csv_field(text):
+    if any(char in text for char in ",\"\n"):
+        return '"%s"' % text.replace('"', '""')
+    return text
+
+
+class JsonLinesWriter(object):
+    """ Writes the samples as JSON objects, one per line. """
+    def __init__(self, output):
+        self.output = output
+
+    def sample(self, timestamp, name, location, stats):
+        record = {"time": round(timestamp, 3), "instance": name}
+        if location is not None:
+            record["location"] = location
+        record.update(zip(MEMSTATS_COLUMNS, stats))
+        self.output.write(json.dumps(record, sort_keys=True) + "\n")
+        self.output.flush()
+
+
+class MemoryTrend(object):
+    """
+    Statistics of one engine in constant space: the first and last sample, the
+    maxima, and the minima of the last leak_windows windows of samples.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, window, leak_windows):
+        self.window = window
+        self.samples = 0
+        self.first = None
+        self.last = None
+        self.maximum = None
+        self.window_minima = collections.deque(maxlen=leak_windows)
+        self.leaking = set()
+        self._window_minimum = None
+        self._window_samples = 0
+
+    def add(self, timestamp, stats):
+        """ Add a sample, returns the indexes of the statistics which started to look leaking. """
+        self.samples += 1
+        self.last = (timestamp, stats)
+
+        if self.first is None:
+            self.first = self.last
+            self.maximum = stats
+        else:
+            self.maximum = tuple(max(values) for values in zip(self.maximum, stats))
+
+        if self._window_minimum is None:
+            self._window_minimum = stats
+        else:
+            self._window_minimum = tuple(min(values) for values in zip(self._window_minimum, stats))
+
+        self._window_samples += 1
+        if self._window_samples < self.window:
+            return []
+
+        self.window_minima.append((timestamp, self._window_minimum))
+        self._window_minimum = None
+        self._window_samples = 0
+
+        if self.window_minima.maxlen != len(self.window_minima):
+            return []
+
+        growing = set()
+        for index in range(len(MEMSTATS_COLUMNS)):
+            minima = [stats[index] for _, stats in self.window_minima]
+            if all(previous < current for previous, current in zip(minima, minima[1:])):
+                growing.add(index)
+
+        started = sorted(growing - self.leaking)
+        self.leaking = growing
+        return started
+
+    def growth_rate(self, index):
+        """ Growth of a statistic in bytes per hour according to the window minima. """
+        (start_time, start), (end_time, end) = self.window_minima[0], self.window_minima[-1]
+        if end_time <= start_time:
+            return 0.0
+        return (end[index] - start[index]) * 3600.0 / (end_time - start_time)
+
+
+class MemstatsCollector(object):
+    """
+    Collects the memory statistics of the engines of a debugger fleet.
+
+    Without breakpoints the engines are resumed whenever they stop and a statistics
+    request is sent to each engine at every interval. With breakpoints the request is
+    sent when the engine is stopped at a breakpoint (at most once in every interval),
+    followed by the continue command, so the engine answers before it is resumed.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, fleet, writer, interval, at_breakpoints=False, window=60, leak_windows=5, write=None):
+        self.fleet = fleet
+        self.writer = writer
+        self.interval = interval
+        self.at_breakpoints = at_breakpoints
+        self.write = write
+        self.trends = dict((session, MemoryTrend(window, leak_windows)) for session in fleet.sessions)
+        # The locations of the requests which are not answered yet, by session.
+        self._pending = dict((session, collections.deque()) for session in fleet.sessions)
+        self._next_sample = dict((session, 0.0) for session in fleet.sessions)
+
+    def run(self, duration=None):
+        """ Collect the samples until every engine finishes or the duration of the collection expires. """
+        fleet = self.fleet
+        end_time = monotonic() + duration if duration is not None else None
+
+        while True:
+            now = monotonic()
+            if end_time is not None and now >= end_time:
+                break
+
+            if not self.at_breakpoints:
+                for session in fleet.open_sessions():
+                    if now >= self._next_sample[session] and not self._pending[session]:
+                        self._request(session, None, now)
+
+            self._resume_stopped()
+
+            timeout = None
+            if not self.at_breakpoints:
+                timeout = max(0.0, min([self._next_sample[session] for session in fleet.open_sessions()] or [0.0])
+                              - now)
+            if end_time is not None:
+                timeout = end_time - now if timeout is None else min(timeout, end_time - now)
+
+            if not fleet.poll(timeout):
+                break
+
+            self._collect()
+
+    def _request(self, session, location, now):
+        self._pending[session].append(location)
+        # The samples are not bunched up after a delay (e.g. a long stop).
+        self._next_sample[session] += self.interval
+        if self._next_sample[session] <= now:
+            self._next_sample[session] = now + self.interval
+        try:
+            session.debugger.memstats()
+        except socket.error as error:
+            # The session is closed when the connection error is received.
+            logging.debug("Session %s: %s", session, error)
+
+    def _resume_stopped(self):
+        now = monotonic()
+        for session in self.fleet.open_sessions():
+            if not session.stopped:
+                continue
+
+            if self.at_breakpoints and now >= self._next_sample[session]:
+                self._request(session, str(session.debugger.last_breakpoint_hit), now)
+
+            session.stopped = False
+            try:
+                session.debugger.do_continue()
+            except socket.error as error:
+                logging.debug("Session %s: %s", session, error)
+
+    def _collect(self):
+        for session in self.fleet.sessions:
+            stats = session.debugger.memory_stats
+            if stats is None:
+                continue
+
+            session.debugger.memory_stats = None
+            location = self._pending[session].popleft() if self._pending[session] else None
+            timestamp = time.time()
+
+            self.writer.sample(timestamp, session.name, location, stats)
+
+            trend = self.trends[session]
+            for index in trend.add(timestamp, stats):
+                if self.write:
+                    self.write(session, "Possible leak: %s bytes grew in the last %d windows (%.0f bytes/hour)\n" % (
+                        MEMSTATS_FIELDS[index], len(trend.window_minima), trend.growth_rate(index)))
+
+    def summary(self):
+        result = "%-24s %8s %-10s %12s %12s %12s  %s\n" % (
+            "Instance", "Samples", "Statistic", "First", "Last", "Maximum", "Trend")
+        for session in sorted(self.trends, key=str):
+            trend = self.trends[session]
+            if not trend.samples:
+                result += "%-24s %8d\n" % (session, 0)
+                continue
+
+            for index, name in enumerate(MEMSTATS_FIELDS):
+                if index in trend.leaking:
+                    status = "growing (%.0f bytes/hour)" % trend.growth_rate(index)
+                elif len(trend.window_minima) == trend.window_minima.maxlen:
+                    status = "stable"
+                else:
+                    status = "not enough samples"
+
+                result += "%-24s %8s %-10s %12d %12d %12d  %s\n" % (
+                    session if index == 0 else "", trend.samples if index == 0 else "", name,
+                    trend.first[1][index], trend.last[1][index], trend.maximum[index], status)
+        return result
+
+
+def main():
+    args = arguments_parse()
+    fleet = DebuggerFleet(auto_continue=False)
+    fleet.connect_all(args.address, args.channel, args.protocol, args.breakpoints)
+
+    if args.format == "csv":
+        output = open(args.output, "w")
+        writer = CsvWriter(output)
+    else:
+        output = open(args.output, "w")
+        writer = JsonLinesWriter(output)
+
+    collector = MemstatsCollector(fleet, writer, args.interval, bool(args.breakpoints),
+                                  args.window, args.leak_windows, write=write_prefixed)
+    try:
+        collector.run(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        output.close()
+
+    for session in fleet.open_sessions():
+        disconnect(session.debugger)
+
+    print(collector.summary(), end="")
+
+if __name__ == "__main__":
+    run_tool(main)
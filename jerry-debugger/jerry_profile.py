@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Sampling profiler built on the debugger protocol (jerry-profile).
+
+The engine is stopped periodically, its backtrace is requested and the execution is
+resumed. The samples can be written as collapsed stacks (for flame graph tools) and
+in the speedscope file format. The time the engine spends stopped is reported as the
+sampling overhead.
+"""
+
+from __future__ import print_function
+import argparse
+import json
+import select
+import sys
+import jerry_client_main
+
+from jerry_client_main import parse_arguments
+from jerry_client_tool import DebuggerTool, add_connection_arguments, connect_debugger, disconnect, monotonic, run_tool
+
+# Sampler states.
+STATE_STARTING = 0
+STATE_RESUMING = 1
+STATE_RUNNING = 2
+STATE_STOPPING = 3
+STATE_BACKTRACE = 4
+
+def arguments_parse():
+    parser = argparse.ArgumentParser(description="JerryScript sampling profiler")
+
+    add_connection_arguments(parser)
+    parser.add_argument("--rate", type=float, default=50.0,
+                        help="number of samples per second of execution (default: %(default)s)")
+    parser.add_argument("--duration", metavar="SECONDS", type=float,
+                        help="disconnect from the engine after profiling for the given time")
+    parser.add_argument("--lines", action="store_true", default=False,
+                        help="distinguish the frames by their line instead of their function (default: %(default)s)")
+    parser.add_argument("--collapsed", metavar="FILE",
+                        help="write the samples as collapsed stacks into the file")
+    parser.add_argument("--speedscope", metavar="FILE",
+                        help="write the samples in speedscope format into the file")
+    parser.add_argument("--top", metavar="N", type=int, default=10,
+                        help="number of functions in the summary (default: %(default)s)")
+    args = parse_arguments(parser)
+
+    if args.rate <= 0:
+        parser.error("the sampling rate must be positive")
+
+    return args
+
+
+class SamplingProfiler(DebuggerTool):
+    """
+    Collects the call stacks of a debugged engine. The engine is resumed after its first
+    stop, and from then on it is stopped after running for the sampling interval.
+
+    A stop request is ignored by the engine if it is processed together with the
+    preceding continue command, so the engine is stopped only after it acknowledged
+    the continue command: a memory statistics request is sent after the command,
+    and the engine processes the messages in order.
+
+    Every sample is a tuple of frame indexes (outermost frame first) with the running
+    time it represents. The frames are (name, source name, line) tuples, where the line
+    is the line of the function, or the line of the executed statement if line_level
+    is True.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, debugger, interval, line_level=False, write=None):
+        super(SamplingProfiler, self).__init__(debugger, write)
+        self.interval = interval
+        self.line_level = line_level
+        self.frames = []
+        self.frame_indexes = {}
+        self.samples = []
+        self.weights = []
+        # Time from stop request to breakpoint hit, and from breakpoint hit to resume.
+        self.stop_latencies = []
+        self.pauses = []
+        self.start_time = None
+        self.end_time = None
+        self._state = STATE_STARTING
+        self._stop_time = None
+        self._hit_time = None
+        self._resume_time = None
+
+    def run(self, duration=None):
+        """ Sample until the engine finishes or the duration of the profiling expires. """
+        debugger = self.debugger
+
+        while not self.closed:
+            now = monotonic()
+            timeout = None
+
+            if self._state == STATE_RUNNING:
+                if duration is not None and now >= self.start_time + duration:
+                    break
+
+                next_sample = self._resume_time + self.interval
+                if now >= next_sample:
+                    self._stop_time = now
+                    self._state = STATE_STOPPING
+                    debugger.stop()
+                    continue
+
+                timeout = next_sample - now
+
+            if not debugger.channel.has_message() and not select.select([debugger], [], [], timeout)[0]:
+                continue
+
+            self._process_message()
+
+        if self.start_time is not None:
+            self.end_time = monotonic()
+
+    def _resume(self):
+        self.debugger.do_continue()
+        self.debugger.memstats()
+        self._state = STATE_RESUMING
+
+    def _handle_message(self, buffer_type, action):
+        if buffer_type in [jerry_client_main.JERRY_DEBUGGER_BREAKPOINT_HIT,
+                           jerry_client_main.JERRY_DEBUGGER_EXCEPTION_HIT]:
+            self._stopped()
+            return True
+
+        if buffer_type in [jerry_client_main.JERRY_DEBUGGER_BACKTRACE,
+                           jerry_client_main.JERRY_DEBUGGER_BACKTRACE_END]:
+            if buffer_type == jerry_client_main.JERRY_DEBUGGER_BACKTRACE_END and self._state == STATE_BACKTRACE:
+                self._add_sample(self.debugger.last_backtrace, self._hit_time - self._resume_time)
+                self._resume()
+            return True
+
+        if buffer_type == jerry_client_main.JERRY_DEBUGGER_MEMSTATS_RECEIVE and self._state == STATE_RESUMING:
+            self._resume_time = monotonic()
+            self._state = STATE_RUNNING
+
+            if self.start_time is None:
+                self.start_time = self._resume_time
+            if self._hit_time is not None:
+                self.pauses.append(self._resume_time - self._hit_time)
+            return True
+
+        return False
+
+    def _stopped(self):
+        if self._state != STATE_STOPPING:
+            # Stops which are not requested by the profiler (e.g. the first stop) are not sampled.
+            self._hit_time = None
+            self._resume()
+            return
+
+        self._hit_time = monotonic()
+        self.stop_latencies.append(self._hit_time - self._stop_time)
+        self._state = STATE_BACKTRACE
+        self.debugger.backtrace("")
+
+    def _frame_index(self, breakpoint):
+        function = breakpoint.function
+        frame = (function.display_name(), function.source_name, breakpoint.line if self.line_level else function.line)
+        index = self.frame_indexes.get(frame)
+
+        if index is None:
+            index = len(self.frames)
+            self.frames.append(frame)
+            self.frame_indexes[frame] = index
+
+        return index
+
+    def _add_sample(self, backtrace, weight):
+        # The backtrace starts with the innermost frame.
+        self.samples.append(tuple(self._frame_index(breakpoint) for breakpoint in reversed(backtrace)))
+        self.weights.append(weight)
+
+    def frame_name(self, index):
+        name, source_name, line = self.frames[index]
+        return "%s (%s:%d)" % (name, source_name or "<unknown>", line)
+
+    def collapsed_stacks(self):
+        """ Samples in the collapsed stack format: frames separated by semicolons followed by the count. """
+        counts = {}
+        for sample in self.samples:
+            stack = ";".join(self.frame_name(index) for index in sample)
+            counts[stack] = counts.get(stack, 0) + 1
+
+        return "".join("%s %d\n" % (stack, counts[stack]) for stack in sorted(counts))
+
+    def speedscope(self, name):
+        """ Samples as a sampled profile of the speedscope file format. """
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "jerry-profile",
+            "name": name,
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [{"name": frame[0], "file": frame[1], "line": frame[2]} for frame in self.frames],
+            },
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(self.weights),
+                "samples": [list(sample) for sample in self.samples],
+                "weights": self.weights,
+            }],
+        }
+
+    def summary(self, top=10):
+        """ Describe the sampling rate and overhead, and the functions with the most samples. """
+        if not self.samples:
+            return "No samples were collected\n"
+
+        count = len(self.samples)
+        duration = self.end_time - self.start_time
+        pauses = sorted(self.pauses) or [0.0]
+
+        result = "Samples: %d in %.3f s (requested rate: %.1f/s, achieved rate: %.1f/s)\n" % (
+            count, duration, 1 / self.interval, count / duration)
+        result += "Stop latency: mean %.3f ms, max %.3f ms\n" % (
+            sum(self.stop_latencies) * 1000 / count, max(self.stop_latencies) * 1000)
+        result += "Stopped time per sample: mean %.3f ms, p99 %.3f ms, max %.3f ms\n" % (
+            sum(pauses) * 1000 / len(pauses), pauses[min(len(pauses) - 1, len(pauses) * 99 // 100)] * 1000,
+            pauses[-1] * 1000)
+        result += "Sampling overhead: %.1f%% of the time the engine was stopped\n" % (
+            sum(pauses) * 100 / duration)
+
+        self_counts = {}
+        for sample in self.samples:
+            if sample:
+                self_counts[sample[-1]] = self_counts.get(sample[-1], 0) + 1
+
+        result += "\n%8s %8s  %s\n" % ("Self", "Samples", "Function")
+        for index in sorted(self_counts, key=lambda index: (-self_counts[index], index))[:top]:
+            result += "%7.1f%% %8d  %s\n" % (self_counts[index] * 100.0 / count, self_counts[index],
+                                             self.frame_name(index))
+        return result
+
+
+def main():
+    args = arguments_parse()
+
+    debugger = connect_debugger(args)
+
+    profiler = SamplingProfiler(debugger, 1 / args.rate, args.lines, write=sys.stdout.write)
+    profiler.run(args.duration)
+
+    if not profiler.closed:
+        disconnect(debugger)
+
+    if args.collapsed:
+        with open(args.collapsed, "w") as collapsed_file:
+            collapsed_file.write(profiler.collapsed_stacks())
+
+    if args.speedscope:
+        with open(args.speedscope, "w") as speedscope_file:
+            json.dump(profiler.speedscope(args.address), speedscope_file)
+
+    print(profiler.summary(args.top), end="")
+
+if __name__ == "__main__":
+    run_tool(main)
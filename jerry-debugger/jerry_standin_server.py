@@ -0,0 +1,526 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Stand-in for the debugger server of the engine, which speaks the debugger protocol
+(WebSocket or raw packets over tcp) and plays a synthesized workload instead of
+running JavaScript code. It can be used to test and load-test the debugger client
+without building the engine.
+
+The workload consists of parsed scripts with generated functions, followed by an
+execution which visits the breakpoint locations of the functions. The engine stops
+at the first location (like a real engine after a client is connected), at every
+enabled breakpoint and after step/next/finish commands. Further scripts can be
+parsed after the first stop (like evaluated code) and output messages can be
+produced while executing.
+"""
+
+from __future__ import print_function
+import argparse
+import base64
+import collections
+import hashlib
+import select
+import socket
+import struct
+import time
+import jerry_client_main as protocol
+
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WEBSOCKET_BINARY_FRAME = 2
+WEBSOCKET_FIN_BIT = 0x80
+WEBSOCKET_MASK_BIT = 0x80
+
+# Maximum payload size of a message in each direction.
+MAX_MESSAGE_SIZE = {
+    "websocket": 125,
+    "rawpacket": 255,
+}
+
+# Distance of the byte code offsets of the generated breakpoint locations.
+OFFSET_STEP = 6
+
+class ServerChannel(object):
+    """ Server side of the WebSocket and raw packet communication channels. """
+    def __init__(self, connection, channel_name):
+        self.connection = connection
+        self.websocket = channel_name == "websocket"
+        self.buffer = bytearray()
+
+    def _receive(self):
+        data = self.connection.recv(65536)
+        if not data:
+            raise EOFError()
+        self.buffer += data
+
+    def handshake(self):
+        """ Process the WebSocket upgrade request of the client. """
+        if not self.websocket:
+            return
+
+        while b"\r\n\r\n" not in self.buffer:
+            self._receive()
+
+        request, _, rest = bytes(self.buffer).partition(b"\r\n\r\n")
+        self.buffer = bytearray(rest)
+
+        key = None
+        for line in request.split(b"\r\n"):
+            if line.lower().startswith(b"sec-websocket-key:"):
+                key = line.split(b":", 1)[1].strip()
+
+        if key is None:
+            raise Exception("Sec-WebSocket-Key not found")
+
+        accept = base64.b64encode(hashlib.sha1(key + WEBSOCKET_GUID).digest())
+        self.connection.sendall(b"HTTP/1.1 101 Switching Protocols\r\n" +
+                                b"Upgrade: websocket\r\n" +
+                                b"Connection: Upgrade\r\n" +
+                                b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+
+    def send_message(self, message):
+        """ Send a message (type byte and payload). """
+        if self.websocket:
+            header = struct.pack("BB", WEBSOCKET_BINARY_FRAME | WEBSOCKET_FIN_BIT, len(message))
+        else:
+            header = struct.pack("B", len(message))
+        self.connection.sendall(header + message)
+
+    def _take_message(self):
+        if self.websocket:
+            if len(self.buffer) < 2:
+                return None
+
+            if self.buffer[0] != WEBSOCKET_BINARY_FRAME | WEBSOCKET_FIN_BIT or not self.buffer[1] & WEBSOCKET_MASK_BIT:
+                raise Exception("Unexpected data frame")
+
+            size = self.buffer[1] & ~WEBSOCKET_MASK_BIT
+            if len(self.buffer) < 6 + size:
+                return None
+
+            mask = self.buffer[2:6]
+            message = bytearray(self.buffer[6:6 + size])
+            for i in range(size):
+                message[i] ^= mask[i % 4]
+            del self.buffer[:6 + size]
+            return bytes(message)
+
+        if not self.buffer or len(self.buffer) < 1 + self.buffer[0]:
+            return None
+
+        size = self.buffer[0]
+        message = bytes(self.buffer[1:1 + size])
+        del self.buffer[:1 + size]
+        return message
+
+    def receive_message(self, blocking):
+        """ Receive a message, returns None if no message is available and blocking is False. """
+        while True:
+            message = self._take_message()
+            if message is not None or (not blocking and not select.select([self.connection], [], [], 0)[0]):
+                return message
+            self._receive()
+
+
+class Workload(object):
+    """ Generated scripts and the parameters of their execution. """
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    def __init__(self, scripts=1, functions=10, lines=5, hits=100, prints=0, print_size=40, release=False,
+                 late_scripts=0):
+        self.scripts = scripts
+        self.late_scripts = late_scripts
+        self.functions = functions
+        self.lines = lines
+        self.hits = hits
+        self.prints = prints
+        self.print_size = print_size
+        self.release = release
+
+
+class StandInFunction(object):
+    def __init__(self, byte_code_cp, name, line, lines):
+        self.byte_code_cp = byte_code_cp
+        self.name = name
+        self.line = line
+        self.lines = lines
+        self.offsets = [(i + 1) * OFFSET_STEP for i in range(len(lines))]
+
+
+class StandInEngine(object):
+    """ Plays a workload to one connected debugger client. """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, channel, channel_name, workload):
+        self.channel = channel
+        self.workload = workload
+        self.max_message_size = MAX_MESSAGE_SIZE[channel_name]
+        self.cp_format = "H"
+        self.cp_size = 2
+        self.scripts = []
+        self.functions = {}
+        self.breakpoints = set()
+        self.wait_after_parse = False
+        self.stop = True
+        self.location = None
+        self.eval_data = None
+        self.hit_time = None
+        self.latencies = []
+        self.messages_sent = 0
+        # Number of the received commands by message type.
+        self.commands_received = collections.Counter()
+
+        # Byte code pointers start from 1, the compressed pointer size grows if it is needed.
+        if (workload.scripts + workload.late_scripts) * (workload.functions + 1) >= 0xffff:
+            self.cp_format = "I"
+            self.cp_size = 4
+
+    def _send(self, message_type, payload=b""):
+        self.channel.send_message(struct.pack("B", message_type) + payload)
+        self.messages_sent += 1
+
+    def _send_string(self, message_type, string):
+        """ Send a string in fragments, the type of the last fragment is message_type + 1. """
+        max_fragment = self.max_message_size - 1
+        while len(string) > max_fragment:
+            self._send(message_type, string[:max_fragment])
+            string = string[max_fragment:]
+        self._send(message_type + 1, string)
+
+    def _send_uint32_list(self, message_type, values):
+        max_count = (self.max_message_size - 1) // 4
+        for start in range(0, len(values), max_count):
+            chunk = values[start:start + max_count]
+            self._send(message_type, struct.pack("<%dI" % len(chunk), *chunk))
+
+    def _send_cp(self, message_type, byte_code_cp):
+        self._send(message_type, struct.pack("<" + self.cp_format, byte_code_cp))
+
+    def run(self):
+        """ Play the workload. """
+        self.channel.handshake()
+
+        # Configuration: little endian flag, protocol version, max message size, cpointer size.
+        self._send(protocol.JERRY_DEBUGGER_CONFIGURATION,
+                   struct.pack("<BIBB", protocol.JERRY_DEBUGGER_LITTLE_ENDIAN, protocol.JERRY_DEBUGGER_VERSION,
+                               self.max_message_size, self.cp_size))
+
+        for index in range(self.workload.scripts):
+            self._parse_script(index)
+
+        self._execute()
+
+        if self.workload.release:
+            for script in self.scripts:
+                for function in script:
+                    self._send_cp(protocol.JERRY_DEBUGGER_RELEASE_BYTE_CODE_CP, function.byte_code_cp)
+                    self._process_commands()
+
+    def _parse_script(self, index):
+        workload = self.workload
+        name = "script%d.js" % index
+        source_lines = []
+        script = []
+        next_cp = len(self.functions) + 1
+
+        for function_index in range(workload.functions):
+            function_line = len(source_lines) + 1
+            source_lines.append("function f%d_%d(x) {" % (index, function_index))
+            lines = []
+            for line_index in range(workload.lines):
+                lines.append(len(source_lines) + 1)
+                source_lines.append("  x = x + %d;" % line_index)
+            source_lines.append("}")
+            script.append(StandInFunction(next_cp, "f%d_%d" % (index, function_index), function_line, lines))
+            next_cp += 1
+
+        root_lines = []
+        for function_index in range(workload.functions):
+            root_lines.append(len(source_lines) + 1)
+            source_lines.append("f%d_%d(%d);" % (index, function_index, function_index))
+        root = StandInFunction(next_cp, "", 1, root_lines or [1])
+
+        self._send_string(protocol.JERRY_DEBUGGER_SOURCE_CODE, ("\n".join(source_lines) + "\n").encode("ascii"))
+        self._send_string(protocol.JERRY_DEBUGGER_SOURCE_CODE_NAME, name.encode("ascii"))
+
+        for function in script:
+            self._send_string(protocol.JERRY_DEBUGGER_FUNCTION_NAME, function.name.encode("ascii"))
+            self._send(protocol.JERRY_DEBUGGER_PARSE_FUNCTION, struct.pack("<II", function.line, 1))
+            self._send_function(function)
+
+        self._send_function(root)
+        script.append(root)
+
+        self.scripts.append(script)
+        for function in script:
+            self.functions[function.byte_code_cp] = function
+
+        self._process_commands()
+        if self.wait_after_parse:
+            self._send(protocol.JERRY_DEBUGGER_WAITING_AFTER_PARSE)
+            self._wait(protocol.JERRY_DEBUGGER_PARSER_RESUME)
+
+    def _send_function(self, function):
+        self._send_uint32_list(protocol.JERRY_DEBUGGER_BREAKPOINT_LIST, function.lines)
+        self._send_uint32_list(protocol.JERRY_DEBUGGER_BREAKPOINT_OFFSET_LIST, function.offsets)
+        self._send_cp(protocol.JERRY_DEBUGGER_BYTE_CODE_CP, function.byte_code_cp)
+
+    def _locations(self):
+        """ Generate the visited breakpoint locations: the root of each script calls its functions. """
+        while True:
+            for script in self.scripts:
+                root = script[-1]
+                for index, function in enumerate(script[:-1]):
+                    yield (root, root.offsets[index])
+                    for offset in function.offsets:
+                        yield (function, offset)
+
+                if len(script) == 1:
+                    yield (root, root.offsets[0])
+
+    def _execute(self):
+        workload = self.workload
+        prints = 0
+        locations = self._locations()
+
+        for hit in range(workload.hits):
+            function, offset = next(locations)
+
+            self._process_commands()
+
+            if self.stop or (function.byte_code_cp, offset) in self.breakpoints:
+                self.location = (function, offset)
+                self.hit_time = time.time()
+                self._send(protocol.JERRY_DEBUGGER_BREAKPOINT_HIT,
+                           struct.pack("<" + self.cp_format + "I", function.byte_code_cp, offset))
+                self._wait(None)
+
+            if hit == 0:
+                for index in range(workload.scripts, workload.scripts + workload.late_scripts):
+                    self._parse_script(index)
+
+            # The print calls are distributed evenly over the execution.
+            while prints < workload.prints and prints * workload.hits <= hit * workload.prints:
+                self._print(prints)
+                prints += 1
+
+        while prints < workload.prints:
+            self._print(prints)
+            prints += 1
+
+    def _print(self, index):
+        text = ("print %d " % index).ljust(self.workload.print_size - 1, "x") + "\n"
+        self._send_string(protocol.JERRY_DEBUGGER_OUTPUT_RESULT,
+                          text.encode("ascii") + struct.pack("B", protocol.JERRY_DEBUGGER_OUTPUT_OK))
+
+    def _process_commands(self):
+        """ Process the commands which arrived while running. """
+        while True:
+            message = self.channel.receive_message(False)
+            if message is None:
+                return
+            self._process_command(message)
+
+    def _wait(self, message_type):
+        """ Process the commands until the execution is resumed (or the given message arrives). """
+        while True:
+            message = self.channel.receive_message(True)
+            if self._process_command(message) or ord(message[0:1]) == message_type:
+                return
+
+    # pylint: disable=too-many-branches
+    def _process_command(self, message):
+        """ Process a command, returns True if the execution is resumed. """
+        message_type = ord(message[0:1])
+        payload = message[1:]
+        self.commands_received[message_type] += 1
+
+        if self.hit_time is not None:
+            self.latencies.append(time.time() - self.hit_time)
+            self.hit_time = None
+
+        if message_type in [protocol.JERRY_DEBUGGER_CONTINUE,
+                            protocol.JERRY_DEBUGGER_STEP,
+                            protocol.JERRY_DEBUGGER_NEXT,
+                            protocol.JERRY_DEBUGGER_FINISH]:
+            self.stop = message_type != protocol.JERRY_DEBUGGER_CONTINUE
+            return True
+
+        if message_type == protocol.JERRY_DEBUGGER_STOP:
+            self.stop = True
+        elif message_type == protocol.JERRY_DEBUGGER_UPDATE_BREAKPOINT:
+            is_set, byte_code_cp, offset = struct.unpack("<B" + self.cp_format + "I", payload)
+            if is_set:
+                self.breakpoints.add((byte_code_cp, offset))
+            else:
+                self.breakpoints.discard((byte_code_cp, offset))
+        elif message_type == protocol.JERRY_DEBUGGER_PARSER_CONFIG:
+            self.wait_after_parse = bool(ord(payload[0:1]))
+        elif message_type == protocol.JERRY_DEBUGGER_MEMSTATS:
+            self._send(protocol.JERRY_DEBUGGER_MEMSTATS_RECEIVE, struct.pack("<5I", *self._memstats()))
+        elif message_type == protocol.JERRY_DEBUGGER_GET_BACKTRACE:
+            self._send_backtrace(*struct.unpack("<IIB", payload))
+        elif message_type == protocol.JERRY_DEBUGGER_GET_SCOPE_CHAIN:
+            self._send(protocol.JERRY_DEBUGGER_SCOPE_CHAIN_END,
+                       struct.pack("BB", protocol.JERRY_DEBUGGER_SCOPE_LOCAL, protocol.JERRY_DEBUGGER_SCOPE_GLOBAL))
+        elif message_type == protocol.JERRY_DEBUGGER_GET_SCOPE_VARIABLES:
+            self._send(protocol.JERRY_DEBUGGER_SCOPE_VARIABLES_END,
+                       struct.pack("B", 1) + b"x" + struct.pack("BB", protocol.JERRY_DEBUGGER_VALUE_NUMBER, 1) + b"1")
+        elif message_type in [protocol.JERRY_DEBUGGER_EVAL, protocol.JERRY_DEBUGGER_EVAL_PART]:
+            return self._receive_eval(message_type, payload)
+
+        # The other messages (e.g. exception config, byte code release acknowledgement) are ignored.
+        return False
+
+    def _memstats(self):
+        functions = len(self.functions)
+        locations = sum(len(function.offsets) for function in self.functions.values())
+        byte_code = locations * OFFSET_STEP
+        strings = functions * 16
+        objects = functions * 32
+        properties = functions * 24
+        return (byte_code + strings + objects + properties, byte_code, strings, objects, properties)
+
+    def _send_backtrace(self, min_depth, max_depth, get_total):
+        function, offset = self.location
+        frames = [(function.byte_code_cp, offset)]
+
+        # The functions are called from the root of their script.
+        for script in self.scripts:
+            if function in script[:-1]:
+                root = script[-1]
+                frames.append((root.byte_code_cp, root.offsets[script.index(function)]))
+
+        if get_total:
+            self._send(protocol.JERRY_DEBUGGER_BACKTRACE_TOTAL, struct.pack("<I", len(frames)))
+
+        frames = frames[min_depth:max_depth] if max_depth else frames[min_depth:]
+        frame_format = "<" + self.cp_format + "I"
+        max_count = (self.max_message_size - 1) // struct.calcsize(frame_format)
+
+        while len(frames) > max_count:
+            self._send(protocol.JERRY_DEBUGGER_BACKTRACE,
+                       b"".join(struct.pack(frame_format, *frame) for frame in frames[:max_count]))
+            frames = frames[max_count:]
+
+        self._send(protocol.JERRY_DEBUGGER_BACKTRACE_END,
+                   b"".join(struct.pack(frame_format, *frame) for frame in frames))
+
+    def _receive_eval(self, message_type, payload):
+        if message_type == protocol.JERRY_DEBUGGER_EVAL:
+            # The total size is followed by the scope chain index, the eval subtype and the code.
+            size = struct.unpack("<I", payload[0:4])[0]
+            self.eval_data = (size, payload[4:])
+        else:
+            self.eval_data = (self.eval_data[0], self.eval_data[1] + payload)
+
+        size, data = self.eval_data
+        if len(data) < size:
+            return False
+
+        self.eval_data = None
+        subtype = data[4:5]
+        code = data[5:]
+
+        if subtype == protocol.JERRY_DEBUGGER_EVAL_EVAL.encode("ascii"):
+            # The result of the evaluation is the evaluated code itself.
+            self._send_string(protocol.JERRY_DEBUGGER_EVAL_RESULT,
+                              code + struct.pack("B", protocol.JERRY_DEBUGGER_EVAL_OK))
+            return False
+
+        # Throw and abort resume the execution.
+        self.stop = False
+        return True
+
+
+def create_server(port):
+    """ Create the listening socket of the server, port 0 selects a free port. """
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_socket.bind(("", port))
+    server_socket.listen(1)
+    return server_socket
+
+
+def serve(server_socket, channel_name, workload):
+    """ Wait for a client on the server socket and play the workload. Returns the engine after the client left. """
+    connection = server_socket.accept()[0]
+    server_socket.close()
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    engine = StandInEngine(ServerChannel(connection, channel_name), channel_name, workload)
+    try:
+        engine.run()
+
+        # Closing a socket with unread data resets the connection, which may drop the
+        # data not yet processed by the client, so wait until the client disconnects.
+        connection.shutdown(socket.SHUT_WR)
+        while connection.recv(65536):
+            pass
+    except EOFError:
+        pass
+    finally:
+        connection.close()
+
+    return engine
+
+
+def latency_summary(latencies):
+    """ Describe the latencies from breakpoint hit to the next command in milliseconds. """
+    if not latencies:
+        return "No breakpoint was hit"
+
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return ("Breakpoint hit to command latency (%d hits): mean %.3f ms, median %.3f ms, p99 %.3f ms, max %.3f ms"
+            % (count, sum(latencies) * 1000 / count, latencies[count // 2] * 1000,
+               latencies[min(count - 1, count * 99 // 100)] * 1000, latencies[-1] * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in JerryScript debugger server")
+    parser.add_argument("--port", type=int, default=5001,
+                        help="tcp port to listen on (default: %(default)s)")
+    parser.add_argument("--channel", choices=["websocket", "rawpacket"], default="websocket",
+                        help="specify the communication channel (default: %(default)s)")
+    parser.add_argument("--scripts", type=int, default=1,
+                        help="number of parsed scripts (default: %(default)s)")
+    parser.add_argument("--functions", type=int, default=10,
+                        help="number of functions in each script (default: %(default)s)")
+    parser.add_argument("--lines", type=int, default=5,
+                        help="number of breakpoint lines in each function (default: %(default)s)")
+    parser.add_argument("--late-scripts", type=int, default=0,
+                        help="number of scripts parsed after the first stop (default: %(default)s)")
+    parser.add_argument("--hits", type=int, default=100,
+                        help="number of visited breakpoint locations during the execution (default: %(default)s)")
+    parser.add_argument("--prints", type=int, default=0,
+                        help="number of printed lines during the execution (default: %(default)s)")
+    parser.add_argument("--print-size", type=int, default=40,
+                        help="length of a printed line including the newline (default: %(default)s)")
+    parser.add_argument("--release", action="store_true", default=False,
+                        help="release the byte code of every function at the end (default: %(default)s)")
+    args = parser.parse_args()
+
+    workload = Workload(scripts=args.scripts, functions=args.functions, lines=args.lines, hits=args.hits,
+                        prints=args.prints, print_size=args.print_size, release=args.release,
+                        late_scripts=args.late_scripts)
+
+    start = time.time()
+    engine = serve(create_server(args.port), args.channel, workload)
+
+    print("Session time: %.3f s, messages sent: %d" % (time.time() - start, engine.messages_sent))
+    print(latency_summary(engine.latencies))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Execution trace recorder built on the debugger protocol.
+
+Breakpoints are set at the given locations, and every hit is recorded with a
+timestamp, the function and the line (and optionally the result of an expression
+evaluated at the hit), then the execution is resumed. The records are streamed to
+a JSON lines or a binary file, which can be converted to JSON lines with --dump.
+"""
+
+from __future__ import print_function
+import argparse
+import json
+import select
+import struct
+import sys
+import jerry_client_main
+
+from jerry_client_main import parse_arguments
+from jerry_client_tool import (DebuggerTool, add_connection_arguments, connect_debugger, disconnect, monotonic,
+                               run_tool)
+
+# Format of the binary trace:
+#   header: magic [8]
+#   records: type [1] followed by
+#     location: id [4] - line [4] - source name length [2] - source name - function name length [2] - function name
+#     hit: time [8, double, seconds since the start of the trace] - location id [4] - value length [4] - value
+# The value length of a hit without evaluated expression is 0xffffffff. All values are little-endian.
+TRACE_MAGIC = b"JRDBGTRC"
+TRACE_LOCATION = 0
+TRACE_HIT = 1
+
+TRACE_LOCATION_HEADER = struct.Struct("<II")
+TRACE_HIT_HEADER = struct.Struct("<dII")
+TRACE_STRING_SIZE = struct.Struct("<H")
+TRACE_NO_VALUE = 0xffffffff
+
+def arguments_parse():
+    parser = argparse.ArgumentParser(description="JerryScript execution trace recorder")
+
+    add_connection_arguments(parser)
+    parser.add_argument("--break", metavar="BREAKPOINT", dest="breakpoints", action="append", default=[],
+                        help="trace the hits of a location (file:line) or function (can be specified multiple times)")
+    parser.add_argument("--eval", metavar="EXPRESSION",
+                        help="evaluate the expression at every hit and record its result")
+    parser.add_argument("--output", metavar="FILE", default="trace.jsonl",
+                        help="file of the records (default: %(default)s)")
+    parser.add_argument("--format", choices=["jsonl", "binary"], default="jsonl",
+                        help="format of the records (default: %(default)s)")
+    parser.add_argument("--duration", metavar="SECONDS", type=float,
+                        help="disconnect from the engine after tracing for the given time")
+    parser.add_argument("--dump", metavar="FILE",
+                        help="print the records of a binary trace as JSON lines instead of tracing")
+    args = parse_arguments(parser)
+
+    if not args.dump and not args.breakpoints:
+        parser.error("at least one breakpoint is required")
+
+    return args
+
+
+def _encode(text):
+    # The texts of the client are byte strings in Python 2.
+    return text if isinstance(text, bytes) else text.encode("utf8")
+
+
+class JsonLinesWriter(object):
+    """ Writes the records as JSON objects, one per line. """
+    def __init__(self, output):
+        self.output = output
+        self.locations = {}
+
+    def location(self, location_id, source_name, line, function_name):
+        self.locations[location_id] = '"source": %s, "line": %d, "function": %s' % (
+            json.dumps(source_name), line, json.dumps(function_name))
+
+    def hit(self, timestamp, location_id, value):
+        record = '{"time": %.6f, %s' % (timestamp, self.locations[location_id])
+        if value is not None:
+            record += ', "value": ' + json.dumps(value)
+        self.output.write(record + "}\n")
+
+
+class BinaryWriter(object):
+    """ Writes the records in the binary trace format. """
+    def __init__(self, output):
+        self.output = output
+        output.write(TRACE_MAGIC)
+
+    def location(self, location_id, source_name, line, function_name):
+        source_name = _encode(source_name)
+        function_name = _encode(function_name)
+        self.output.write(struct.pack("B", TRACE_LOCATION) + TRACE_LOCATION_HEADER.pack(location_id, line) +
+                          TRACE_STRING_SIZE.pack(len(source_name)) + source_name +
+                          TRACE_STRING_SIZE.pack(len(function_name)) + function_name)
+
+    def hit(self, timestamp, location_id, value):
+        record = struct.pack("B", TRACE_HIT)
+        if value is None:
+            self.output.write(record + TRACE_HIT_HEADER.pack(timestamp, location_id, TRACE_NO_VALUE))
+            return
+
+        value = _encode(value)
+        self.output.write(record + TRACE_HIT_HEADER.pack(timestamp, location_id, len(value)) + value)
+
+
+class TruncatedTrace(Exception):
+    pass
+
+
+def _read(trace, size):
+    data = trace.read(size)
+    if len(data) != size:
+        raise TruncatedTrace()
+    return data
+
+
+def _read_string(trace):
+    size = TRACE_STRING_SIZE.unpack(_read(trace, TRACE_STRING_SIZE.size))[0]
+    return _read(trace, size).decode("utf8")
+
+
+def read_trace(trace):
+    """
+    Generate the hits of a binary trace as (time, source name, line, function name, value) tuples.
+    A trace which is still written (or whose recorder was killed) may end with a partial record,
+    which is ignored.
+    """
+    if trace.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+        raise Exception("Not a debugger trace")
+
+    locations = {}
+    while True:
+        record_type = trace.read(1)
+        if not record_type:
+            return
+
+        try:
+            if ord(record_type) == TRACE_LOCATION:
+                location_id, line = TRACE_LOCATION_HEADER.unpack(_read(trace, TRACE_LOCATION_HEADER.size))
+                source_name = _read_string(trace)
+                locations[location_id] = (source_name, line, _read_string(trace))
+                continue
+
+            timestamp, location_id, size = TRACE_HIT_HEADER.unpack(_read(trace, TRACE_HIT_HEADER.size))
+            value = _read(trace, size).decode("utf8") if size != TRACE_NO_VALUE else None
+        except TruncatedTrace:
+            return
+
+        source_name, line, function_name = locations[location_id]
+        yield (timestamp, source_name, line, function_name, value)
+
+
+class TraceRecorder(DebuggerTool):
+    """
+    Records the breakpoint hits of a debugged engine. The breakpoints are set at the
+    first stop of the engine (the ones in scripts which are not parsed yet become
+    pending breakpoints), afterwards every stop is recorded and resumed without delay.
+    The client processing time of every hit is kept in processing_times.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, debugger, writer, breakpoints, expression=None, write=None):
+        super(TraceRecorder, self).__init__(debugger, write)
+        self.writer = writer
+        self.breakpoints = breakpoints
+        self.expression = expression
+        self.hits = 0
+        self.processing_times = []
+        self.start_time = None
+        self._location_ids = {}
+        self._pending_hit = None
+        # Time of the message in processing.
+        self._message_time = None
+
+        debugger.exception("0")
+
+    def run(self, duration=None):
+        """ Record the hits until the engine finishes or the duration of the tracing expires. """
+        debugger = self.debugger
+
+        while not self.closed:
+            timeout = None
+
+            if duration is not None and self.start_time is not None:
+                timeout = self.start_time + duration - monotonic()
+                if timeout <= 0:
+                    break
+
+            if not debugger.channel.has_message() and not select.select([debugger], [], [], timeout)[0]:
+                continue
+
+            self._process_message()
+
+    def _prepare_message(self, buffer_type, data):
+        self._message_time = monotonic()
+
+    def _handle_message(self, buffer_type, action):
+        if buffer_type == jerry_client_main.JERRY_DEBUGGER_BREAKPOINT_HIT:
+            self._breakpoint_hit(self._message_time)
+            return True
+
+        if buffer_type == jerry_client_main.JERRY_DEBUGGER_EXCEPTION_HIT:
+            self.debugger.do_continue()
+            return True
+
+        if self._pending_hit is not None and buffer_type in [jerry_client_main.JERRY_DEBUGGER_EVAL_RESULT,
+                                                             jerry_client_main.JERRY_DEBUGGER_EVAL_RESULT_END]:
+            hit_time, breakpoint, processing_time = self._pending_hit
+            self._pending_hit = None
+
+            text = action.get_text()
+            if text.endswith("\n"):
+                text = text[:-1]
+            self._record(hit_time, breakpoint, text, processing_time + monotonic() - self._message_time)
+            return True
+
+        return False
+
+    def _breakpoint_hit(self, start):
+        if self.start_time is None:
+            self._start()
+            return
+
+        breakpoint = self.debugger.last_breakpoint_hit
+        if self.expression is None:
+            self._record(start, breakpoint, None)
+            return
+
+        self.debugger.eval(self.expression)
+        self._pending_hit = (start, breakpoint, monotonic() - start)
+
+    def _start(self):
+        for breakpoint in self.breakpoints:
+            result = self.debugger.set_break(breakpoint, add_pending=True)
+            if self.write:
+                self.write(result)
+
+        self.start_time = monotonic()
+        self.debugger.do_continue()
+
+    def _record(self, hit_time, breakpoint, value, processing_time=0.0):
+        location_id = self._location_ids.get(breakpoint)
+
+        if location_id is None:
+            location_id = len(self._location_ids)
+            self._location_ids[breakpoint] = location_id
+
+            function = breakpoint.function
+            self.writer.location(location_id, function.source_name, breakpoint.line, function.display_name())
+
+        self.writer.hit(hit_time - self.start_time, location_id, value)
+        self.debugger.do_continue()
+
+        self.hits += 1
+        self.processing_times.append(processing_time + monotonic() - hit_time)
+
+    def summary(self):
+        if not self.hits:
+            return "No breakpoints were hit\n"
+
+        times = sorted(self.processing_times)
+        count = len(times)
+        return ("Recorded %d hits at %d locations\n" % (self.hits, len(self._location_ids)) +
+                "Client processing per hit: mean %.1f us, p99 %.1f us, max %.1f us\n" % (
+                    sum(times) * 1000000 / count, times[min(count - 1, count * 99 // 100)] * 1000000,
+                    times[-1] * 1000000))
+
+
+def dump(path):
+    with open(path, "rb") as trace:
+        for timestamp, source_name, line, function_name, value in read_trace(trace):
+            record = {"time": timestamp, "source": source_name, "line": line, "function": function_name}
+            if value is not None:
+                record["value"] = value
+            print(json.dumps(record, sort_keys=True))
+
+
+def main():
+    args = arguments_parse()
+
+    if args.dump:
+        dump(args.dump)
+        return
+
+    debugger = connect_debugger(args)
+
+    if args.format == "binary":
+        output = open(args.output, "wb")
+        writer = BinaryWriter(output)
+    else:
+        output = open(args.output, "w")
+        writer = JsonLinesWriter(output)
+
+    recorder = TraceRecorder(debugger, writer, args.breakpoints, args.eval, write=sys.stdout.write)
+    try:
+        recorder.run(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        output.close()
+
+    if not recorder.closed:
+        disconnect(debugger)
+
+    print(recorder.summary(), end="")
+
+if __name__ == "__main__":
+    run_tool(main)
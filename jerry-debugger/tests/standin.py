@@ -0,0 +1,68 @@
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers of the tests which run the debugger client against the stand-in server.
+"""
+
+import threading
+import jerry_client_main
+import jerry_standin_server
+
+from jerry_client_tool import create_channel
+
+class StandInServer(object):
+    """
+    Runs the stand-in server in a thread of the test, so the statistics of the
+    engine (e.g. the received commands) can be checked after the session.
+    """
+    def __init__(self, workload, channel_name="websocket"):
+        server_socket = jerry_standin_server.create_server(0)
+        self.address = "localhost:%d" % server_socket.getsockname()[1]
+        self.channel_name = channel_name
+        self.engine = None
+
+        self._thread = threading.Thread(target=self._serve, args=(server_socket, channel_name, workload))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _serve(self, server_socket, channel_name, workload):
+        self.engine = jerry_standin_server.serve(server_socket, channel_name, workload)
+
+    def connect(self):
+        """ Connect a non-interactive debugger to the server. """
+        debugger = jerry_client_main.JerryDebugger(create_channel(self.address, self.channel_name, "tcp"))
+        debugger.non_interactive = True
+        return debugger
+
+    def join(self, timeout=30):
+        """ Wait until the session is finished and return the engine. """
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise AssertionError("The stand-in server did not finish")
+        return self.engine
+
+
+def process_until(debugger, message_types):
+    """ Process the messages of the engine until one of the given types, returns the action of that message. """
+    while True:
+        data = debugger.get_message(True)
+        if not data:
+            raise AssertionError("The connection was closed")
+
+        buffer_type = ord(data[0])
+        action = debugger.process_message(data)
+
+        if buffer_type in message_types:
+            return action
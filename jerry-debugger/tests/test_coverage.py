@@ -0,0 +1,77 @@
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from jerry_coverage import CoverageCollector
+from jerry_standin_server import Workload
+from tests.standin import StandInServer
+
+# A stand-in script with two functions of two lines: the functions start at lines 1 and 5,
+# their breakpoint lines are 2, 3 and 6, 7, and the global code calls them at lines 9 and 10.
+# The execution visits the lines 9, 2, 3, 10, 6, 7 of each script.
+
+def _collect(workload):
+    server = StandInServer(workload)
+    collector = CoverageCollector(server.connect())
+    collector.run()
+    collector.debugger.channel.close()
+    server.join()
+    return collector
+
+
+class CoverageCollectorTest(unittest.TestCase):
+
+    def test_partial_coverage(self):
+        # The byte code is released at the end, the coverage is kept by source name.
+        collector = _collect(Workload(scripts=2, functions=2, lines=2, hits=8, release=True))
+
+        self.assertEqual(collector.to_lcov(),
+                         "TN:\nSF:script0.js\n"
+                         "FN:1,f0_0\nFN:5,f0_1\nFNDA:1,f0_0\nFNDA:1,f0_1\nFNF:2\nFNH:2\n"
+                         "DA:2,1\nDA:3,1\nDA:6,1\nDA:7,1\nDA:9,1\nDA:10,1\nLF:6\nLH:6\nend_of_record\n"
+                         "TN:\nSF:script1.js\n"
+                         "FN:1,f1_0\nFN:5,f1_1\nFNDA:1,f1_0\nFNDA:0,f1_1\nFNF:2\nFNH:1\n"
+                         "DA:2,1\nDA:3,0\nDA:6,0\nDA:7,0\nDA:9,1\nDA:10,0\nLF:6\nLH:2\nend_of_record\n")
+
+        # The engine stops once for every covered line.
+        self.assertEqual(collector.stops, 8)
+
+        coverage = collector.to_json()
+        self.assertEqual(coverage["script1.js"]["lines"], {"2": 1, "3": 0, "6": 0, "7": 0, "9": 1, "10": 0})
+        self.assertEqual(coverage["script1.js"]["functions"],
+                         [{"name": "f1_0", "line": 1, "covered": True},
+                          {"name": "f1_1", "line": 5, "covered": False}])
+
+    def test_repeated_execution(self):
+        # Every line is visited three times, but it is covered by the first visit.
+        collector = _collect(Workload(functions=2, lines=2, hits=18))
+
+        self.assertIn("DA:2,1\nDA:3,1\nDA:6,1\nDA:7,1\nDA:9,1\nDA:10,1\nLF:6\nLH:6\n", collector.to_lcov())
+        self.assertEqual(collector.stops, 6)
+        self.assertEqual(collector.enabled_breakpoints, collector.disabled_breakpoints)
+
+    def test_late_parsed_script(self):
+        # The engine waits after parsing the late script until its breakpoints are enabled.
+        collector = _collect(Workload(scripts=1, late_scripts=1, functions=2, lines=2, hits=12))
+
+        lcov = collector.to_lcov()
+        self.assertEqual(lcov.count("LF:6\nLH:6\n"), 2)
+        self.assertIn("SF:script1.js\nFN:1,f1_0\nFN:5,f1_1\nFNDA:1,f1_0\nFNDA:1,f1_1\nFNF:2\nFNH:2\n", lcov)
+        self.assertEqual(collector.stops, 12)
+        self.assertEqual(collector.summary().splitlines()[-2], "Total: 12 of 12 lines covered (100.0%)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import jerry_client_main
+
+from jerry_client_fleet import DebuggerFleet
+from jerry_client_tool import create_channel
+from jerry_standin_server import Workload
+from tests.standin import StandInServer
+
+# The stand-in executes the lines 9, 2, 3, 10, 6, 7 of script0.js: engine "a" twice, engine "b" once.
+WORKLOADS = [("a", Workload(functions=2, lines=2, hits=12, prints=2)),
+             ("b", Workload(functions=2, lines=2, hits=6))]
+FIRST_STOP = "Stopped at script0.js:9\n"
+BREAKPOINT_HIT = "Stopped at breakpoint:1 script0.js:6 (in f0_1() at line:5, col:1)\n"
+
+class DebuggerFleetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.texts = []
+        self.fleet = DebuggerFleet(write=lambda session, text: self.texts.append((session.name, text)),
+                                   auto_continue=False)
+        self.servers = {}
+
+        for name, workload in WORKLOADS:
+            server = StandInServer(workload)
+            self.fleet.connect(name, create_channel(server.address, server.channel_name, "tcp"))
+            self.servers[name] = server
+
+    def _finish(self):
+        """ Run the engines to completion, returns the engines by session name. """
+        self.fleet.auto_continue = True
+        self.fleet.do_continue()
+        self.fleet.run()
+
+        for session in self.fleet.sessions:
+            self.assertTrue(session.closed)
+            session.debugger.channel.close()
+
+        return dict((name, server.join()) for name, server in self.servers.items())
+
+    def test_breakpoint_hits(self):
+        # The engines stop before the first statement.
+        self.fleet.wait_stopped()
+        self.assertTrue(all(session.stopped for session in self.fleet.sessions))
+        self.fleet.hits.clear()
+
+        results = self.fleet.set_break("f0_1")
+        self.assertEqual(sorted(session.name for session in results), ["a", "b"])
+        self.assertTrue(all(result.startswith("Breakpoint 1 at script0.js:6 ") for result in results.values()))
+
+        engines = self._finish()
+
+        self.assertEqual([sorted(names) for names in self.fleet.hits.values()], [["a", "a", "b"]])
+        self.assertEqual(self.fleet.hit_summary().split(": ", 1)[1], "hit 3 times by 2 instance(s): a, b\n")
+
+        # Each engine is resumed after the first stop and after every breakpoint hit.
+        self.assertEqual(engines["a"].commands_received[jerry_client_main.JERRY_DEBUGGER_CONTINUE], 3)
+        self.assertEqual(engines["b"].commands_received[jerry_client_main.JERRY_DEBUGGER_CONTINUE], 2)
+
+        # The texts are reported with the session of the engine, in the order of each engine.
+        self.assertEqual([text.split(" x")[0] for name, text in self.texts if name == "a"],
+                         [FIRST_STOP, "out: print 0", BREAKPOINT_HIT, "out: print 1", BREAKPOINT_HIT])
+        self.assertEqual([text for name, text in self.texts if name == "b"], [FIRST_STOP, BREAKPOINT_HIT])
+
+    def test_memstats(self):
+        self.fleet.wait_stopped()
+        stats = self.fleet.memstats()
+
+        self.assertEqual(sorted(session.name for session in stats), ["a", "b"])
+        self.assertEqual(len(set(stats.values())), 1)
+        self.assertEqual(len(list(stats.values())[0]), 5)
+
+        # The first stops are recorded as hits of the first breakpoint location.
+        summary = self.fleet.hit_summary()
+        self._finish()
+        self.assertEqual(summary, "script0.js:9: hit 2 times by 2 instance(s): a, b\n")
+        self.assertEqual(self.fleet.hit_summary(), summary)
+
+    def test_connect_all(self):
+        server = StandInServer(WORKLOADS[1][1])
+        fleet = DebuggerFleet(write=lambda session, text: self.texts.append((session.name, text)),
+                              auto_continue=False)
+        fleet.connect_all([server.address], server.channel_name, "tcp", ["f0_1"])
+
+        # The engine is left stopped after the breakpoint is set.
+        self.assertTrue(fleet.sessions[0].stopped)
+        self.assertEqual(self.texts[0], (server.address, FIRST_STOP))
+        self.assertTrue(self.texts[1][1].startswith("Breakpoint 1 at script0.js:6 "))
+
+        fleet.auto_continue = True
+        fleet.do_continue()
+        fleet.run()
+        fleet.sessions[0].debugger.channel.close()
+        server.join()
+        self._finish()
+        self.assertEqual(self.texts[2], (server.address, BREAKPOINT_HIT))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from jerry_memstats import CsvWriter, MemoryTrend, _csv_field
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+WINDOW = 10
+LEAK_WINDOWS = 3
+
+def saw_tooth(sample, growth, offset=0):
+    """
+    Statistics of a sample of a garbage collected heap: the allocated and the object bytes
+    grow by 1000 bytes in each of five samples, then they are collected. The low-water mark
+    grows by growth bytes per sample, the other statistics are constant.
+    """
+    heap = 1000 * (sample % 5) + growth * sample + offset
+    return (5000 + heap, 300, 200, 1000 + heap, 400)
+
+
+def add_samples(trend, first, count, growth, offset=0):
+    """ Add samples taken every second, returns the statistics which started to look leaking after each. """
+    return [trend.add(float(sample), saw_tooth(sample, growth, offset)) for sample in range(first, first + count)]
+
+
+class MemoryTrendTest(unittest.TestCase):
+
+    def test_stable(self):
+        trend = MemoryTrend(WINDOW, LEAK_WINDOWS)
+        started = add_samples(trend, 0, 20 * WINDOW, 0)
+
+        self.assertEqual([index for indexes in started for index in indexes], [])
+        self.assertEqual(trend.leaking, set())
+        self.assertEqual(len(trend.window_minima), LEAK_WINDOWS)
+        self.assertEqual(trend.growth_rate(0), 0.0)
+
+        self.assertEqual(trend.samples, 20 * WINDOW)
+        self.assertEqual(trend.first, (0.0, (5000, 300, 200, 1000, 400)))
+        self.assertEqual(trend.maximum, (9000, 300, 200, 5000, 400))
+
+    def test_leaking(self):
+        trend = MemoryTrend(WINDOW, LEAK_WINDOWS)
+        started = add_samples(trend, 0, 20 * WINDOW, 1)
+
+        # The leak is reported once, when the minima of the first windows are known.
+        self.assertEqual([(sample, indexes) for sample, indexes in enumerate(started) if indexes],
+                         [(LEAK_WINDOWS * WINDOW - 1, [0, 3])])
+        self.assertEqual(trend.leaking, set([0, 3]))
+
+        # The minimum of each window is its first sample, which grows by one byte per second.
+        self.assertEqual(trend.growth_rate(0), 3600.0)
+        self.assertEqual(trend.growth_rate(3), 3600.0)
+        self.assertEqual(trend.growth_rate(1), 0.0)
+
+    def test_leak_transitions(self):
+        trend = MemoryTrend(WINDOW, LEAK_WINDOWS)
+        add_samples(trend, 0, 5 * WINDOW, 1)
+        self.assertEqual(trend.leaking, set([0, 3]))
+
+        # The leak stops: the minimum of the first stable window is still higher than the previous one.
+        started = add_samples(trend, 5 * WINDOW, WINDOW, 0, 5 * WINDOW)
+        self.assertEqual(started[-1], [])
+        self.assertEqual(trend.leaking, set([0, 3]))
+
+        started = add_samples(trend, 6 * WINDOW, WINDOW, 0, 5 * WINDOW)
+        self.assertEqual(started[-1], [])
+        self.assertEqual(trend.leaking, set())
+
+        # The leak starts again, and it is reported again.
+        started = add_samples(trend, 7 * WINDOW, LEAK_WINDOWS * WINDOW, 1, -2 * WINDOW)
+        self.assertEqual([(sample, indexes) for sample, indexes in enumerate(started) if indexes],
+                         [(LEAK_WINDOWS * WINDOW - 1, [0, 3])])
+        self.assertEqual(trend.leaking, set([0, 3]))
+
+    def test_partial_window(self):
+        trend = MemoryTrend(WINDOW, LEAK_WINDOWS)
+        add_samples(trend, 0, WINDOW - 1, 1)
+
+        self.assertEqual(len(trend.window_minima), 0)
+        add_samples(trend, WINDOW - 1, 1, 1)
+        self.assertEqual(list(trend.window_minima), [(WINDOW - 1.0, saw_tooth(0, 1))])
+
+
+class CsvTest(unittest.TestCase):
+
+    def test_csv_field(self):
+        self.assertEqual(_csv_field("localhost:5001"), "localhost:5001")
+        self.assertEqual(_csv_field(""), "")
+        self.assertEqual(_csv_field("a.js:1, b.js:2"), '"a.js:1, b.js:2"')
+        self.assertEqual(_csv_field('say "hi"'), '"say ""hi"""')
+        self.assertEqual(_csv_field("two\nlines"), '"two\nlines"')
+
+    def test_writer(self):
+        output = StringIO()
+        writer = CsvWriter(output)
+        writer.sample(1.5, "engine,1", None, (1, 2, 3, 4, 5))
+        writer.sample(2.25, "engine2", 'f (a.js:3) "x"', (6, 7, 8, 9, 10))
+
+        self.assertEqual(output.getvalue(),
+                         "time,instance,location,allocated,byte_code,string,object,property\n"
+                         '1.500,"engine,1",,1,2,3,4,5\n'
+                         '2.250,engine2,"f (a.js:3) ""x""",6,7,8,9,10\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
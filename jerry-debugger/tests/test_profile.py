@@ -0,0 +1,112 @@
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from jerry_profile import SamplingProfiler
+from jerry_standin_server import Workload
+from tests.standin import StandInServer
+
+# The stand-in scripts consist of functions with three lines, called from the global code.
+FUNCTION_LINES = {"f0_0": 1, "f0_1": 6, "f0_2": 11}
+
+class SamplingProfilerTest(unittest.TestCase):
+
+    def _profile(self, line_level=False):
+        server = StandInServer(Workload(functions=3, lines=3, hits=20000))
+        profiler = SamplingProfiler(server.connect(), 0.0001, line_level)
+        profiler.run()
+        profiler.debugger.channel.close()
+        server.join()
+
+        self.assertTrue(profiler.closed)
+        self.assertTrue(profiler.samples)
+        return profiler
+
+    def test_sample_accounting(self):
+        profiler = self._profile()
+        count = len(profiler.samples)
+
+        # Every sample is a requested stop, which is resumed after its backtrace is received. The
+        # resume is timed by the answer to a statistics request, which an engine may not send if it
+        # finishes right after the last sample.
+        self.assertEqual(len(profiler.weights), count)
+        self.assertEqual(len(profiler.stop_latencies), count)
+        self.assertIn(len(profiler.pauses), [count - 1, count])
+        self.assertTrue(all(weight >= 0 for weight in profiler.weights))
+        self.assertLessEqual(sum(profiler.weights) + sum(profiler.pauses),
+                             profiler.end_time - profiler.start_time)
+
+        # Every frame is referenced by a sample.
+        self.assertEqual(set(index for sample in profiler.samples for index in sample),
+                         set(range(len(profiler.frames))))
+
+        self.assertTrue(profiler.summary().startswith("Samples: %d in " % count))
+
+    def test_frames(self):
+        profiler = self._profile()
+
+        for sample in profiler.samples:
+            frames = [profiler.frames[index] for index in sample]
+            self.assertEqual(frames[0], ("<global>", "script0.js", 1))
+
+            for name, source_name, line in frames[1:]:
+                self.assertEqual(source_name, "script0.js")
+                self.assertEqual(line, FUNCTION_LINES[name])
+
+    def test_line_level_frames(self):
+        profiler = self._profile(line_level=True)
+
+        for sample in profiler.samples:
+            for name, _, line in (profiler.frames[index] for index in sample[1:]):
+                self.assertIn(line - FUNCTION_LINES[name], [1, 2, 3])
+
+    def test_collapsed_stacks(self):
+        profiler = self._profile()
+        counts = {}
+
+        for line in profiler.collapsed_stacks().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertNotIn(stack, counts)
+            counts[stack] = int(count)
+
+        expected = {}
+        for sample in profiler.samples:
+            stack = ";".join(profiler.frame_name(index) for index in sample)
+            expected[stack] = expected.get(stack, 0) + 1
+
+        self.assertEqual(counts, expected)
+        self.assertEqual(sum(counts.values()), len(profiler.samples))
+        self.assertTrue(all(stack.startswith("<global> (script0.js:1)") for stack in counts))
+
+    def test_speedscope(self):
+        profiler = self._profile()
+        document = json.loads(json.dumps(profiler.speedscope("stand-in")))
+
+        frames = document["shared"]["frames"]
+        self.assertEqual([(frame["name"], frame["file"], frame["line"]) for frame in frames], profiler.frames)
+
+        profile = document["profiles"][0]
+        self.assertEqual(profile["type"], "sampled")
+        self.assertEqual(profile["samples"], [list(sample) for sample in profiler.samples])
+        self.assertEqual(len(profile["weights"]), len(profile["samples"]))
+        self.assertAlmostEqual(profile["endValue"], sum(profiler.weights))
+
+        for sample in profile["samples"]:
+            self.assertTrue(all(0 <= index < len(frames) for index in sample))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import jerry_client_main as protocol
+
+from jerry_client_tool import disconnect
+from jerry_standin_server import Workload
+from tests.standin import StandInServer, process_until
+
+def _request(debugger, response_type, command, *args):
+    """ Send a request and return its response, or return the cached response if nothing was sent. """
+    cached = command(*args)
+    if cached:
+        return cached
+    return process_until(debugger, [response_type]).get_text()
+
+
+def _run(commands, cache_property_reads=False):
+    """ Run the commands in the first stop of the engine and return the responses and the received commands. """
+    server = StandInServer(Workload(functions=1, lines=2, hits=4))
+    debugger = server.connect()
+    debugger.cache_property_reads = cache_property_reads
+    process_until(debugger, [protocol.JERRY_DEBUGGER_BREAKPOINT_HIT])
+
+    responses = [_request(debugger, *command) for command in commands(debugger)]
+
+    disconnect(debugger)
+    return responses, server.join().commands_received
+
+
+class StopCacheTest(unittest.TestCase):
+    """ The repeated requests of a stop are answered by the client without sending them to the engine. """
+
+    def test_repeated_requests(self):
+        def commands(debugger):
+            return [(protocol.JERRY_DEBUGGER_BACKTRACE_END, debugger.backtrace, ""),
+                    (protocol.JERRY_DEBUGGER_BACKTRACE_END, debugger.backtrace, ""),
+                    (protocol.JERRY_DEBUGGER_SCOPE_CHAIN_END, debugger.scope_chain),
+                    (protocol.JERRY_DEBUGGER_SCOPE_CHAIN_END, debugger.scope_chain),
+                    (protocol.JERRY_DEBUGGER_SCOPE_VARIABLES_END, debugger.scope_variables, "0"),
+                    (protocol.JERRY_DEBUGGER_SCOPE_VARIABLES_END, debugger.scope_variables, "0"),
+                    (protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval, "counter"),
+                    (protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval, "counter")]
+
+        responses, received = _run(commands)
+
+        self.assertEqual(responses[0], responses[1])
+        self.assertIn("Frame 0:", responses[0])
+        self.assertEqual(responses[2], responses[3])
+        self.assertEqual(responses[4], responses[5])
+        self.assertEqual(responses[6], responses[7])
+
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_GET_BACKTRACE], 1)
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_GET_SCOPE_CHAIN], 1)
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_GET_SCOPE_VARIABLES], 1)
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_EVAL], 1)
+
+    def test_different_requests(self):
+        def commands(debugger):
+            return [(protocol.JERRY_DEBUGGER_BACKTRACE_END, debugger.backtrace, ""),
+                    (protocol.JERRY_DEBUGGER_BACKTRACE_END, debugger.backtrace, "1"),
+                    (protocol.JERRY_DEBUGGER_SCOPE_VARIABLES_END, debugger.scope_variables, "0"),
+                    (protocol.JERRY_DEBUGGER_SCOPE_VARIABLES_END, debugger.scope_variables, "1"),
+                    (protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval, "counter"),
+                    (protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval_at, "counter", 1)]
+
+        received = _run(commands)[1]
+
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_GET_BACKTRACE], 2)
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_GET_SCOPE_VARIABLES], 2)
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_EVAL], 2)
+
+    def test_side_effects_invalidate(self):
+        def commands(debugger):
+            return [(protocol.JERRY_DEBUGGER_BACKTRACE_END, debugger.backtrace, ""),
+                    (protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval, "counter"),
+                    (protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval, "counter++"),
+                    (protocol.JERRY_DEBUGGER_BACKTRACE_END, debugger.backtrace, ""),
+                    (protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval, "counter")]
+
+        received = _run(commands)[1]
+
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_GET_BACKTRACE], 2)
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_EVAL], 3)
+
+    def test_property_reads(self):
+        def commands(debugger):
+            return [(protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval, "obj.list[1]"),
+                    (protocol.JERRY_DEBUGGER_EVAL_RESULT_END, debugger.eval, "obj.list[1]")]
+
+        # A getter or a proxy trap of a property read may change the state of the engine.
+        received = _run(commands)[1]
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_EVAL], 2)
+
+        responses, received = _run(commands, cache_property_reads=True)
+        self.assertEqual(responses[0], responses[1])
+        self.assertEqual(received[protocol.JERRY_DEBUGGER_EVAL], 1)
+
+    def test_resume_invalidates(self):
+        server = StandInServer(Workload(functions=1, lines=2, hits=4))
+        debugger = server.connect()
+        process_until(debugger, [protocol.JERRY_DEBUGGER_BREAKPOINT_HIT])
+
+        _request(debugger, protocol.JERRY_DEBUGGER_BACKTRACE_END, debugger.backtrace, "")
+        debugger.next()
+        process_until(debugger, [protocol.JERRY_DEBUGGER_BREAKPOINT_HIT])
+        _request(debugger, protocol.JERRY_DEBUGGER_BACKTRACE_END, debugger.backtrace, "")
+
+        disconnect(debugger)
+        self.assertEqual(server.join().commands_received[protocol.JERRY_DEBUGGER_GET_BACKTRACE], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
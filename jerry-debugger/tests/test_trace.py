@@ -0,0 +1,150 @@
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from jerry_standin_server import Workload
+from jerry_trace import TRACE_HIT_HEADER, BinaryWriter, JsonLinesWriter, TraceRecorder, dump, read_trace
+from tests.standin import StandInServer
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO # pylint: disable=ungrouped-imports
+
+# The texts of the client are UTF-8 byte strings in Python 2.
+NON_ASCII_VALUE = u"\u00e9t\u00e9 \u2603"
+NON_ASCII_NAME = u"\u00fcber.js"
+
+def _client_text(text):
+    return text.encode("utf8") if str is bytes else text
+
+
+def _write_records(writer):
+    writer.location(0, "a.js", 3, "<global>")
+    writer.hit(0.25, 0, None)
+    writer.location(1, _client_text(NON_ASCII_NAME), 12, "f")
+    writer.hit(0.5, 1, "")
+    writer.hit(0.75, 0, _client_text(NON_ASCII_VALUE))
+    writer.hit(1.0, 1, "42")
+
+EXPECTED_HITS = [
+    (0.25, u"a.js", 3, u"<global>", None),
+    (0.5, NON_ASCII_NAME, 12, u"f", u""),
+    (0.75, u"a.js", 3, u"<global>", NON_ASCII_VALUE),
+    (1.0, NON_ASCII_NAME, 12, u"f", u"42"),
+]
+
+
+def _binary_trace():
+    output = io.BytesIO()
+    _write_records(BinaryWriter(output))
+    return output.getvalue()
+
+
+class BinaryTraceTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        self.assertEqual(list(read_trace(io.BytesIO(_binary_trace()))), EXPECTED_HITS)
+
+    def test_truncated_last_record(self):
+        trace = _binary_trace()
+        last_record_size = 1 + TRACE_HIT_HEADER.size + len("42")
+
+        # A recorder which is killed may leave a partial record at the end of the trace.
+        for size in range(len(trace) - last_record_size + 1, len(trace)):
+            self.assertEqual(list(read_trace(io.BytesIO(trace[:size]))), EXPECTED_HITS[:-1])
+
+    def test_truncated_location_record(self):
+        output = io.BytesIO()
+        writer = BinaryWriter(output)
+        writer.location(0, "a.js", 3, "<global>")
+        writer.hit(0.25, 0, None)
+        size = len(output.getvalue())
+        writer.location(1, "b.js", 4, "g")
+
+        for end in range(size + 1, len(output.getvalue())):
+            self.assertEqual(list(read_trace(io.BytesIO(output.getvalue()[:end]))), EXPECTED_HITS[:1])
+
+    def test_not_a_trace(self):
+        with self.assertRaises(Exception):
+            list(read_trace(io.BytesIO(b"JRDBGTRX")))
+
+    def test_dump(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "trace.bin")
+
+        try:
+            with open(path, "wb") as trace:
+                trace.write(_binary_trace())
+
+            stdout = sys.stdout
+            sys.stdout = StringIO()
+            try:
+                dump(path)
+                output = sys.stdout.getvalue()
+            finally:
+                sys.stdout = stdout
+        finally:
+            shutil.rmtree(directory)
+
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(records, [_json_record(*hit) for hit in EXPECTED_HITS])
+
+
+def _json_record(timestamp, source_name, line, function_name, value):
+    record = {"time": timestamp, "source": source_name, "line": line, "function": function_name}
+    if value is not None:
+        record["value"] = value
+    return record
+
+
+class JsonLinesTraceTest(unittest.TestCase):
+
+    def test_records(self):
+        output = StringIO()
+        _write_records(JsonLinesWriter(output))
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(records, [_json_record(*hit) for hit in EXPECTED_HITS])
+
+
+class TraceRecorderTest(unittest.TestCase):
+
+    def test_function_breakpoint(self):
+        # The stand-in executes the lines 9, 2, 3, 10, 6, 7 of script0.js three times.
+        server = StandInServer(Workload(functions=2, lines=2, hits=18))
+        output = StringIO()
+        recorder = TraceRecorder(server.connect(), JsonLinesWriter(output), ["f0_1"], "x")
+        recorder.run()
+        recorder.debugger.channel.close()
+        server.join()
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        # The stand-in evaluates an expression to its own code.
+        self.assertEqual([(record["source"], record["line"], record["function"], record["value"])
+                          for record in records], [(u"script0.js", 6, u"f0_1", u"x")] * 3)
+        self.assertEqual(sorted(record["time"] for record in records), [record["time"] for record in records])
+        self.assertEqual(recorder.hits, 3)
+        self.assertEqual(len(recorder.processing_times), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+// Copyright JS Foundation and other contributors, http://js.foundation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+/* Parses a large source with many identifiers and string literals, most of
+ * which are (or look like) the names of built-in properties, so the run time
+ * is dominated by the parser and the magic string lookup of the literals. */
+
+var names = Object.getOwnPropertyNames (Object.prototype)
+  .concat (Object.getOwnPropertyNames (Array.prototype))
+  .concat (Object.getOwnPropertyNames (String.prototype))
+  .concat (Object.getOwnPropertyNames (Math))
+  .concat (Object.getOwnPropertyNames (this));
+
+var lines = [];
+for (var i = 0; i < 200; i++)
+{
+  var name = names[i % names.length];
+  lines.push ("var v" + i + " = o." + name + " || o['" + name + "_'] || o." + name + i + ";");
+}
+
+var source = lines.join ("\n");
+
+for (var i = 0; i < 500; i++)
+{
+  Function ("o", source);
+}
@@ -0,0 +1,9 @@
+b area
+c
+bt
+e width + height
+scope
+n
+e result
+delete 1
+c
@@ -0,0 +1,20 @@
+break do_stop_cache.js:20
+c
+backtrace
+backtrace
+scope
+scope
+variables 0
+variables 0
+eval obj.list[1]
+eval obj.list[1]
+eval_at 0 obj.list[1]
+eval counter
+eval counter++
+eval counter
+variables 1
+backtrace
+c
+eval obj.count
+scope
+c
@@ -0,0 +1,102 @@
+/* Copyright JS Foundation and other contributors, http://js.foundation
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "lit-magic-strings.h"
+
+#include "test-common.h"
+
+/* Maximum size of the generated strings. */
+#define MAX_STRING_SIZE 32
+
+/**
+ * Check that the string is either not found or the found magic string is the same
+ */
+static void
+check_lookup (const lit_utf8_byte_t *string_p, /**< utf-8 string */
+              lit_utf8_size_t string_size) /**< string size in bytes */
+{
+  lit_magic_string_id_t id = lit_is_utf8_string_magic (string_p, string_size);
+
+  if (id != LIT_MAGIC_STRING__COUNT)
+  {
+    TEST_ASSERT (id < LIT_NON_INTERNAL_MAGIC_STRING__COUNT);
+    TEST_ASSERT (lit_get_magic_string_size (id) == string_size);
+    TEST_ASSERT (memcmp (lit_get_magic_string_utf8 (id), string_p, string_size) == 0);
+  }
+
+  for (lit_utf8_size_t split = 0; split <= string_size; split++)
+  {
+    TEST_ASSERT (lit_is_utf8_string_pair_magic (string_p, split, string_p + split, string_size - split) == id);
+  }
+} /* check_lookup */
+
+int
+main (void)
+{
+  TEST_INIT ();
+
+  lit_utf8_byte_t buffer[MAX_STRING_SIZE + 1];
+
+  /* Every magic string must be found by itself and as any pair of its prefix and suffix. */
+  for (uint32_t id = 0; id < LIT_NON_INTERNAL_MAGIC_STRING__COUNT; id++)
+  {
+    const lit_utf8_byte_t *string_p = lit_get_magic_string_utf8 (id);
+    lit_utf8_size_t string_size = lit_get_magic_string_size (id);
+
+    TEST_ASSERT (lit_is_utf8_string_magic (string_p, string_size) == (lit_magic_string_id_t) id);
+
+    for (lit_utf8_size_t split = 0; split <= string_size; split++)
+    {
+      TEST_ASSERT (lit_is_utf8_string_pair_magic (string_p,
+                                                  split,
+                                                  string_p + split,
+                                                  string_size - split) == (lit_magic_string_id_t) id);
+    }
+
+    if (string_size < MAX_STRING_SIZE)
+    {
+      /* Slightly modified magic strings must not be found, unless they are magic strings as well. */
+      memcpy (buffer, string_p, string_size);
+      buffer[string_size] = (lit_utf8_byte_t) 'x';
+      check_lookup (buffer, string_size + 1);
+
+      if (string_size > 0)
+      {
+        check_lookup (buffer, string_size - 1);
+        check_lookup (buffer + 1, string_size);
+
+        buffer[string_size - 1] = (lit_utf8_byte_t) (buffer[string_size - 1] ^ 0x1);
+        check_lookup (buffer, string_size);
+      }
+    }
+  }
+
+  /* Random strings */
+  static const lit_utf8_byte_t chars[] = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_";
+
+  for (int i = 0; i < 10000; i++)
+  {
+    lit_utf8_size_t string_size = (lit_utf8_size_t) ((unsigned long) rand () % MAX_STRING_SIZE);
+
+    for (lit_utf8_size_t j = 0; j < string_size; j++)
+    {
+      buffer[j] = chars[(unsigned long) rand () % (sizeof (chars) - 1)];
+    }
+
+    check_lookup (buffer, string_size);
+  }
+
+  return 0;
+} /* main */
@@ -18,8 +18,10 @@ from __future__ import print_function
 
 import argparse
 import fnmatch
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import re
 import shutil
@@ -35,14 +37,17 @@ class Amalgamator(object):
 
     _RE_INCLUDE = re.compile(r'\s*#include ("|<)(.*?)("|>)\n$')
 
-    def __init__(self, h_files, extra_includes=(), remove_includes=(), add_lineinfo=False):
+    def __init__(self, h_files, extra_includes=(), remove_includes=(), add_lineinfo=False, line_cache=None):
         self._h_files = h_files
         self._extra_includes = extra_includes
         self._remove_includes = remove_includes
         self._add_lineinfo = add_lineinfo
+        self._line_cache = line_cache if line_cache is not None else {}
         self._last_builtin = None
-        self._processed = []
+        self._processed = set()
         self._output = []
+        # All the files which were read to produce the output
+        self.dependencies = set()
         # The copyright will be loaded from the first input file
         self._copyright = {'lines': [], 'loaded': False}
 
@@ -78,6 +83,13 @@ class Amalgamator(object):
         else:
             self._output.append(line_info)
 
+    def _read_lines(self, filename):
+        # Headers are included by every chunk of a split output, read them only once
+        if filename not in self._line_cache:
+            with open(filename, 'r') as input_file:
+                self._line_cache[filename] = input_file.readlines()
+        return self._line_cache[filename]
+
     def add_file(self, filename, file_level=0):
         if os.path.basename(filename) in self._processed:
             logging.warning('Tried to to process an already processed file: "%s"', filename)
@@ -91,75 +103,76 @@ class Amalgamator(object):
         # mark the start of the new file in the output
         self._emit_lineinfo(1, filename)
 
+        self.dependencies.add(filename)
+
         line_idx = 0
-        with open(filename, 'r') as input_file:
-            in_copyright = False
-            for line in input_file:
-                line_idx += 1
-
-                if not in_copyright and line.startswith('/* Copyright '):
-                    in_copyright = True
-                    if not self._copyright['loaded']:
-                        self._copyright['lines'].append(line)
-                    continue
-
-                if in_copyright:
-                    if not self._copyright['loaded']:
-                        self._copyright['lines'].append(line)
-
-                    if line.strip().endswith('*/'):
-                        in_copyright = False
-                        self._copyright['loaded'] = True
-                        # emit a line info so the line numbering can be tracked correctly
-                        self._emit_lineinfo(line_idx + 1, filename)
-
-                    continue
-
-                # check if the line is an '#include' line
-                match = self._RE_INCLUDE.match(line)
-                if not match:
-                    # the line is not a header
-                    self._process_non_include(line, file_level)
-                    continue
-
-                if match.group(1) == '<':
-                    # found a "global" include
-                    self._output.append(line)
-                    continue
-
-                name = match.group(2)
-
-                if name in self._remove_includes:
-                    logging.debug('[%d] Removing include line (%s:%d): %s',
-                                  file_level, filename, line_idx, line.strip())
+        in_copyright = False
+        for line in self._read_lines(filename):
+            line_idx += 1
+
+            if not in_copyright and line.startswith('/* Copyright '):
+                in_copyright = True
+                if not self._copyright['loaded']:
+                    self._copyright['lines'].append(line)
+                continue
+
+            if in_copyright:
+                if not self._copyright['loaded']:
+                    self._copyright['lines'].append(line)
+
+                if line.strip().endswith('*/'):
+                    in_copyright = False
+                    self._copyright['loaded'] = True
                     # emit a line info so the line numbering can be tracked correctly
                     self._emit_lineinfo(line_idx + 1, filename)
-                    continue
 
-                if name not in self._h_files:
-                    logging.warning('[%d] Include not found (%s:%d): "%s"', file_level, filename, line_idx, name)
-                    self._output.append(line)
-                    continue
+                continue
 
-                if name in self._processed:
-                    logging.debug('[%d] Already included: "%s"', file_level, name)
-                    # emit a line info so the line numbering can be tracked correctly
-                    self._emit_lineinfo(line_idx + 1, filename)
-                    continue
+            # check if the line is an '#include' line
+            match = self._RE_INCLUDE.match(line)
+            if not match:
+                # the line is not a header
+                self._process_non_include(line, file_level)
+                continue
+
+            if match.group(1) == '<':
+                # found a "global" include
+                self._output.append(line)
+                continue
 
-                logging.debug('[%d] Including: "%s"', file_level, self._h_files[name])
-                self.add_file(self._h_files[name], file_level)
+            name = match.group(2)
 
-                # mark the continuation of the current file in the output
+            if name in self._remove_includes:
+                logging.debug('[%d] Removing include line (%s:%d): %s',
+                              file_level, filename, line_idx, line.strip())
+                # emit a line info so the line numbering can be tracked correctly
                 self._emit_lineinfo(line_idx + 1, filename)
+                continue
+
+            if name not in self._h_files:
+                logging.warning('[%d] Include not found (%s:%d): "%s"', file_level, filename, line_idx, name)
+                self._output.append(line)
+                continue
+
+            if name in self._processed:
+                logging.debug('[%d] Already included: "%s"', file_level, name)
+                # emit a line info so the line numbering can be tracked correctly
+                self._emit_lineinfo(line_idx + 1, filename)
+                continue
+
+            logging.debug('[%d] Including: "%s"', file_level, self._h_files[name])
+            self.add_file(self._h_files[name], file_level)
 
-                if not name.endswith('.inc.h'):
-                    # if the included file is not a "*.inc.h" file mark it as processed
-                    self._processed.append(name)
+            # mark the continuation of the current file in the output
+            self._emit_lineinfo(line_idx + 1, filename)
+
+            if not name.endswith('.inc.h'):
+                # if the included file is not a "*.inc.h" file mark it as processed
+                self._processed.add(name)
 
         file_level -= 1
         if not filename.endswith('.inc.h'):
-            self._processed.append(os.path.basename(filename))
+            self._processed.add(os.path.basename(filename))
 
     def write_output(self, out_fp):
         for line in self._copyright['lines']:
@@ -168,8 +181,7 @@ class Amalgamator(object):
         for include in self._extra_includes:
             out_fp.write('#include "%s"\n' % include)
 
-        for line in self._output:
-            out_fp.write(line)
+        out_fp.writelines(self._output)
 
 
 def match_files(base_dir, pattern):
@@ -208,14 +220,171 @@ def collect_files(base_dir, pattern):
     return name_mapping
 
 
+def split_into_chunks(input_files, c_files, chunk_count):
+    """
+    Distribute the C files between the given number of chunks, so the chunks have roughly
+    the same source size. The input files are always put at the beginning of the first chunk
+    and the original order of the C files is kept in every chunk.
+
+    :param input_files: Main input source files
+    :param c_files: C files to distribute
+    :param chunk_count: number of chunks
+    :returns list: the list of files of each chunk
+    """
+    chunks = [[] for _ in range(chunk_count)]
+    chunk_sizes = [0] * chunk_count
+    chunk_sizes[0] = sum(os.path.getsize(fname) for fname in input_files)
+
+    # Greedy balancing: the largest files are placed first, always into the smallest chunk
+    for fname in sorted(c_files, key=os.path.getsize, reverse=True):
+        chunk_idx = chunk_sizes.index(min(chunk_sizes))
+        chunks[chunk_idx].append(fname)
+        chunk_sizes[chunk_idx] += os.path.getsize(fname)
+
+    file_order = {fname: idx for idx, fname in enumerate(c_files)}
+    chunks = [sorted(chunk, key=file_order.get) for chunk in chunks]
+    chunks[0] = list(input_files) + chunks[0]
+    return chunks
+
+
+def hash_file(path):
+    hasher = hashlib.sha1()
+    with open(path, 'rb') as input_file:
+        hasher.update(input_file.read())
+    return hasher.hexdigest()
+
+
+def get_deps_file_name(output_file):
+    return output_file + '.deps.json'
+
+
+def is_up_to_date(deps_file, settings, outputs):
+    """
+    Check whether the outputs were generated with the same settings from the same inputs.
+    A dependency with a changed modification time is only considered modified if its
+    content changed as well.
+
+    :param deps_file: dependency file written by the previous run
+    :param settings: everything which affects the content of the outputs except the inputs
+    :param outputs: list of output file names
+    :returns bool: True if the outputs need not be regenerated
+    """
+    try:
+        with open(deps_file, 'r') as deps_fp:
+            deps = json.load(deps_fp)
+    except (IOError, OSError, ValueError):
+        return False
+
+    if deps.get('settings') != settings or not all(os.path.isfile(output) for output in outputs):
+        return False
+
+    for (path, (mtime, size, digest)) in deps['dependencies'].items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime != mtime and hash_file(path) != digest:
+            return False
+
+    return True
+
+
+def write_deps(deps_file, settings, dependencies):
+    deps = {'settings': settings, 'dependencies': {}}
+    for path in dependencies:
+        stat = os.stat(path)
+        deps['dependencies'][path] = [stat.st_mtime, stat.st_size, hash_file(path)]
+
+    with open(deps_file, 'w') as deps_fp:
+        json.dump(deps, deps_fp, indent=1, sort_keys=True)
+
+
+def write_if_changed(output_file, amalgam):
+    """
+    Write the output of the amalgamator, but keep the original file (and its modification time)
+    if the content is the same, so the build system does not recompile it unnecessarily.
+    """
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as output:
+        amalgam.write_output(output)
+
+    if os.path.isfile(output_file) and hash_file(output_file) == hash_file(tmp_file):
+        os.remove(tmp_file)
+        return
+
+    if os.path.exists(output_file):
+        os.remove(output_file)
+    os.rename(tmp_file, output_file)
+
+
+def copy_if_changed(src, dst):
+    if os.path.isfile(dst) and hash_file(src) == hash_file(dst):
+        return
+    shutil.copyfile(src, dst)
+
+
+def get_chunk_file_name(output_file, chunk_idx):
+    (base_name, ext) = os.path.splitext(output_file)
+    return '%s-%d%s' % (base_name, chunk_idx, ext)
+
+
+def get_appended_files(c_files, input_files):
+    # if the input file is in the C files list it should be removed to avoid
+    # double inclusion of the file
+    for input_file in input_files:
+        input_name = os.path.basename(input_file)
+        c_files.pop(input_name, '')
+
+    # Add the C files in reverse order to make sure that builtins are
+    # not at the beginning.
+    return sorted(c_files.values(), reverse=True)
+
+
+def get_outputs(output_file, input_files, appended_files, output_chunks):
+    """
+    :returns list: (output file name, list of files merged into the output) pairs
+    """
+    if output_chunks == 1:
+        return [(output_file, list(input_files) + appended_files)]
+
+    chunks = split_into_chunks(input_files, appended_files, output_chunks)
+    return [(get_chunk_file_name(output_file, chunk_idx + 1), chunk) for chunk_idx, chunk in enumerate(chunks)]
+
+
+def write_outputs(outputs, h_files, extra_includes, remove_includes, add_lineinfo):
+    """
+    Write the amalgamated outputs, the unchanged outputs are kept.
+
+    :returns set: the files the outputs were generated from
+    """
+    line_cache = {}
+    dependencies = {os.path.abspath(__file__)}
+    for (output_name, files) in outputs:
+        # Every chunk is a separate translation unit, so each of them gets its own copy of the headers
+        amalgam = Amalgamator(h_files, extra_includes, remove_includes, add_lineinfo, line_cache)
+        for fname in files:
+            amalgam.add_file(fname)
+
+        write_if_changed(output_name, amalgam)
+        dependencies.update(amalgam.dependencies)
+
+    return dependencies
+
+
 def amalgamate(base_dir, input_files=(), output_file=None,
                append_c_files=False, remove_includes=(), extra_includes=(),
-               add_lineinfo=False):
+               add_lineinfo=False, output_chunks=1, force=False):
     """
     :param input_files: Main input source/header files
     :param output_file: Output source/header file
     :param append_c_files: Enable auto inclusion of c files under the base-dir
     :param add_lineinfo: Enable #line macro insertion into the generated sources
+    :param output_chunks: Split the C files into this many independently compilable output files
+                          (named <output_file base name>-<N>.c) instead of a single one
+    :param force: Regenerate the output even if none of its inputs changed
     """
     logging.debug('Starting merge with args: %s', json.dumps(locals(), indent=4, sort_keys=True))
 
@@ -226,27 +395,30 @@ def amalgamate(base_dir, input_files=(), output_file=None,
         c_files.pop(name, '')
         h_files.pop(name, '')
 
-    amalgam = Amalgamator(h_files, extra_includes, remove_includes, add_lineinfo)
-    for input_file in input_files:
-        amalgam.add_file(input_file)
-
-    if append_c_files:
-        # if the input file is in the C files list it should be removed to avoid
-        # double inclusion of the file
-        for input_file in input_files:
-            input_name = os.path.basename(input_file)
-            c_files.pop(input_name, '')
-
-        # Add the C files in reverse order to make sure that builtins are
-        # not at the beginning.
-        for fname in sorted(c_files.values(), reverse=True):
-            amalgam.add_file(fname)
+    appended_files = get_appended_files(c_files, input_files) if append_c_files else []
+    outputs = get_outputs(output_file, input_files, appended_files, output_chunks)
 
-    with open(output_file, 'w') as output:
-        amalgam.write_output(output)
+    # The file name mappings are part of the settings: adding or removing a source file
+    # changes the output even if none of the previously used files changed.
+    settings = {
+        'h_files': h_files,
+        'outputs': [list(output) for output in outputs],
+        'remove_includes': list(remove_includes),
+        'extra_includes': list(extra_includes),
+        'add_lineinfo': add_lineinfo,
+    }
+    deps_file = get_deps_file_name(output_file)
+    output_names = [output[0] for output in outputs]
 
+    if not force and is_up_to_date(deps_file, settings, output_names):
+        logging.debug('Up to date: %s', ', '.join(output_names))
+        return
 
-def amalgamate_jerry_core(output_dir):
+    dependencies = write_outputs(outputs, h_files, extra_includes, remove_includes, add_lineinfo)
+    write_deps(deps_file, settings, dependencies)
+
+
+def amalgamate_jerry_core(output_dir, output_chunks=1, force=False):
     amalgamate(
         base_dir=JERRY_CORE,
         input_files=[
@@ -257,6 +429,8 @@ def amalgamate_jerry_core(output_dir):
         ],
         output_file=os.path.join(output_dir, 'jerryscript.c'),
         append_c_files=True,
+        output_chunks=output_chunks,
+        force=force,
         remove_includes=[
             'jerryscript.h',
             'jerryscript-port.h',
@@ -280,13 +454,14 @@ def amalgamate_jerry_core(output_dir):
         output_file=os.path.join(output_dir, 'jerryscript.h'),
         remove_includes=['config.h'],
         extra_includes=['jerryscript-config.h'],
+        force=force,
     )
 
-    shutil.copyfile(os.path.join(JERRY_CORE, 'config.h'),
+    copy_if_changed(os.path.join(JERRY_CORE, 'config.h'),
                     os.path.join(output_dir, 'jerryscript-config.h'))
 
 
-def amalgamate_jerry_port_default(output_dir):
+def amalgamate_jerry_port_default(output_dir, force=False):
     amalgamate(
         base_dir=JERRY_PORT,
         output_file=os.path.join(output_dir, 'jerryscript-port-default.c'),
@@ -300,6 +475,7 @@ def amalgamate_jerry_port_default(output_dir):
             'jerryscript.h',
             'jerryscript-port-default.h',
         ],
+        force=force,
     )
 
     amalgamate(
@@ -311,29 +487,42 @@ def amalgamate_jerry_port_default(output_dir):
             'jerryscript.h',
         ],
         extra_includes=['jerryscript.h'],
+        force=force,
     )
 
 
-def amalgamate_jerry_math(output_dir):
+def amalgamate_jerry_math(output_dir, force=False):
     amalgamate(
         base_dir=JERRY_MATH,
         output_file=os.path.join(output_dir, 'jerryscript-math.c'),
         append_c_files=True,
+        force=force,
     )
 
-    shutil.copyfile(os.path.join(JERRY_MATH, 'include', 'math.h'),
+    copy_if_changed(os.path.join(JERRY_MATH, 'include', 'math.h'),
                     os.path.join(output_dir, 'math.h'))
 
+
+def run_task(task):
+    (function, args) = task
+    function(*args)
+
 def main():
     parser = argparse.ArgumentParser(description='Generate amalgamated sources.')
     parser.add_argument('--jerry-core', action='store_true',
                         help='amalgamate jerry-core files')
+    parser.add_argument('--jerry-core-chunks', metavar='N', type=int, default=1,
+                        help='split the amalgamated jerry-core source into N files '
+                             '(jerryscript-1.c ... jerryscript-N.c) which can be compiled in parallel '
+                             '(default: %(default)s)')
     parser.add_argument('--jerry-port-default', action='store_true',
                         help='amalgamate jerry-port-default files')
     parser.add_argument('--jerry-math', action='store_true',
                         help='amalgamate jerry-math files')
     parser.add_argument('--output-dir', metavar='DIR', default='amalgam',
                         help='output dir (default: %(default)s)')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate the outputs even if none of their inputs changed')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='increase verbosity')
 
@@ -347,14 +536,27 @@ def main():
     except os.error:
         pass
 
+    tasks = []
     if args.jerry_core:
-        amalgamate_jerry_core(args.output_dir)
+        tasks.append((amalgamate_jerry_core, (args.output_dir, args.jerry_core_chunks, args.force)))
 
     if args.jerry_port_default:
-        amalgamate_jerry_port_default(args.output_dir)
+        tasks.append((amalgamate_jerry_port_default, (args.output_dir, args.force)))
 
     if args.jerry_math:
-        amalgamate_jerry_math(args.output_dir)
+        tasks.append((amalgamate_jerry_math, (args.output_dir, args.force)))
+
+    # The outputs are independent of each other, so they are generated in parallel
+    if len(tasks) > 1 and multiprocessing.cpu_count() > 1:
+        pool = multiprocessing.Pool(min(len(tasks), multiprocessing.cpu_count()))
+        try:
+            pool.map(run_task, tasks)
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        for task in tasks:
+            run_task(task)
 
 
 if __name__ == '__main__':
@@ -17,6 +17,7 @@
 from __future__ import print_function
 
 import argparse
+import hashlib
 import multiprocessing
 import os
 import shutil
@@ -63,6 +64,8 @@ def get_arguments():
                           help='add custom argument to CMake')
     buildgrp.add_argument('--compile-flag', metavar='OPT', action='append', default=[],
                           help='add custom compile flag')
+    buildgrp.add_argument('--force-configure', action='store_true', default=False,
+                          help='run cmake configure even if the build options did not change')
     buildgrp.add_argument('--build-type', metavar='TYPE', default='MinSizeRel',
                           help='set build type (default: %(default)s)')
     buildgrp.add_argument('--debug', dest='build_type', action='store_const', const='Debug', default=argparse.SUPPRESS,
@@ -78,6 +81,8 @@ def get_arguments():
                           help='add custom linker flag')
     buildgrp.add_argument('--amalgam', metavar='X', choices=['ON', 'OFF'], type=str.upper,
                           help='enable amalgamated build (%(choices)s)')
+    buildgrp.add_argument('--amalgam-chunks', metavar='N', type=int,
+                          help='number of amalgamated jerry-core sources compiled in parallel')
     buildgrp.add_argument('--lto', metavar='X', choices=['ON', 'OFF'], type=str.upper,
                           help='enable link-time optimizations (%(choices)s)')
     buildgrp.add_argument('--shared-libs', metavar='X', choices=['ON', 'OFF'], type=str.upper,
@@ -181,6 +186,7 @@ def generate_build_options(arguments):
     build_options_append('EXTERNAL_LINK_LIBS', ' '.join(arguments.link_lib))
     build_options_append('EXTERNAL_LINKER_FLAGS', ' '.join(arguments.linker_flag))
     build_options_append('ENABLE_AMALGAM', arguments.amalgam)
+    build_options_append('AMALGAM_CHUNKS', arguments.amalgam_chunks)
     build_options_append('ENABLE_LTO', arguments.lto)
     build_options_append('BUILD_SHARED_LIBS', arguments.shared_libs)
     build_options_append('ENABLE_STRIP', arguments.strip)
@@ -244,6 +250,17 @@ def configure_output_dir(arguments):
     if not os.path.exists(arguments.builddir):
         os.makedirs(arguments.builddir)
 
+def get_configure_fingerprint(arguments, cmake_cmd):
+    hasher = hashlib.sha1()
+    for arg in cmake_cmd:
+        hasher.update(arg.encode('utf-8') + b'\0')
+
+    if arguments.toolchain and os.path.isfile(arguments.toolchain):
+        with open(arguments.toolchain, 'rb') as toolchain_file:
+            hasher.update(toolchain_file.read())
+
+    return hasher.hexdigest()
+
 def configure_jerry(arguments):
     configure_output_dir(arguments)
 
@@ -256,7 +273,29 @@ def configure_jerry(arguments):
 
     cmake_cmd.extend(build_options)
 
-    return subprocess.call(cmake_cmd)
+    # The fingerprint of the last successful configure is kept in the build directory. If nothing
+    # changed since then, the configure step can be skipped: the build step still re-runs cmake
+    # on its own if any of the CMakeLists.txt files changed.
+    fingerprint = get_configure_fingerprint(arguments, cmake_cmd)
+    fingerprint_path = os.path.join(arguments.builddir, 'jerry-configure.sha1')
+    cmake_cache_path = os.path.join(arguments.builddir, 'CMakeCache.txt')
+
+    if not arguments.force_configure and os.path.isfile(fingerprint_path) and os.path.isfile(cmake_cache_path):
+        with open(fingerprint_path, 'r') as fingerprint_file:
+            if fingerprint_file.read().strip() == fingerprint:
+                print('Build options did not change, skipping configure (use --force-configure to override)')
+                return 0
+
+    if os.path.isfile(fingerprint_path):
+        os.remove(fingerprint_path)
+
+    ret = subprocess.call(cmake_cmd)
+
+    if not ret:
+        with open(fingerprint_path, 'w') as fingerprint_file:
+            fingerprint_file.write(fingerprint + '\n')
+
+    return ret
 
 def make_jerry(arguments):
     make_cmd = ['cmake', '--build', arguments.builddir, '--config', arguments.build_type]
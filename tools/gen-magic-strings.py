@@ -22,8 +22,9 @@ except ImportError:
     from ConfigParser import ConfigParser
 
 import argparse
-import fileinput
+import hashlib
 import json
+import multiprocessing
 import os
 import re
 
@@ -70,73 +71,161 @@ def read_magic_string_defs(debug=False):
     return defs
 
 
-def extract_magic_string_refs(debug=False):
+MAGIC_STRINGS_SCAN_CACHE = os.path.join(PROJECT_DIR, 'build', 'magic-strings-scan-cache.json')
+
+# Matches every preprocessor conditional directive: `#if...` (including `#ifdef` and
+# `#ifndef`), `#elif`, `#else` and `#endif`.
+RE_CONDITIONAL = re.compile(r'^ *# *(if|elif|else|endif)(.*)')
+RE_MAGIC_STRING_REF = re.compile(r'LIT_MAGIC_STRING_[a-zA-Z0-9_]+')
+
+IGNORED_MAGIC_STRING_REFS = frozenset(['LIT_MAGIC_STRING_DEF',
+                                       'LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE',
+                                       'LIT_MAGIC_STRING_LENGTH_LIMIT',
+                                       'LIT_MAGIC_STRING__COUNT'])
+
+
+def hash_file(fname):
+    with open(fname, 'rb') as input_file:
+        return hashlib.sha1(input_file.read()).hexdigest()
+
+
+def process_guard(guard):
+    # Transform `#ifndef MACRO` to `#if !defined (MACRO)` and
+    # `#ifdef MACRO` to `#if defined (MACRO)` to enable or-ing/and-ing the
+    # conditions later on.
+    if guard.startswith('ndef '):
+        guard = guard.replace('ndef ', '!defined (', 1) + ')'
+    elif guard.startswith('def '):
+        guard = guard.replace('def ', 'defined (', 1) + ')'
+    return guard
+
+
+def scan_file(fname):
+    # Collects the magic string references of a file as
+    #   [('LIT_MAGIC_STRING_xxx', ['!defined (CONFIG_DISABLE_yyy_BUILTIN)', ...], 123), ...]
+    # meaning that the given literal is referenced under the given guards at
+    # the given line number. The second item of the returned tuple is the list
+    # of the conditionals which are not closed at the end of the file.
+    #
+    # The `guard_stack` list is maintained for each line of the file as
+    #   [['!defined (CONFIG_DISABLE_yyy_BUILTIN)', ...], ...]
+    # meaning that all the listed guards (conditionals) have to hold for the
+    # line to be kept by the preprocessor.
+    refs = []
+    guard_stack = []
+
+    with open(fname, 'r') as input_file:
+        for lnum, line in enumerate(input_file, 1):
+            if '#' in line:
+                match = RE_CONDITIONAL.match(line)
+                if match is not None:
+                    directive = match.group(1)
+                    if directive == 'if':
+                        guard_stack.append([process_guard(match.group(2))])
+                    elif directive == 'elif':
+                        guards = guard_stack[-1]
+                        guards[-1] = '!(%s)' % guards[-1].strip()
+                        guards.append(process_guard(match.group(2)))
+                    elif directive == 'else':
+                        guards = guard_stack[-1]
+                        guards[-1] = '!(%s)' % guards[-1].strip()
+                    else:
+                        guard_stack.pop()
+
+            if 'LIT_MAGIC_STRING_' not in line:
+                continue
+
+            guard_list = None
+            for str_ref in RE_MAGIC_STRING_REF.findall(line):
+                if str_ref in IGNORED_MAGIC_STRING_REFS:
+                    continue
+
+                if guard_list is None:
+                    guard_set = set()
+                    for guards in guard_stack:
+                        guard_set.update(guards)
+                    guard_list = sorted(guard_set)
+
+                refs.append((str_ref, guard_list, lnum))
+
+    return (refs, guard_stack)
+
+
+def scan_files(fnames, cache, jobs):
+    # Scans the given files and returns the content hash and the result of
+    # `scan_file` for each of them in the same order. Files whose content hash
+    # is found in the cache are not scanned again.
+    hashes = [hash_file(fname) for fname in fnames]
+    missing = {}
+    for fname, digest in zip(fnames, hashes):
+        if digest not in cache:
+            missing[digest] = fname
+    missing_hashes = list(missing)
+    missing_fnames = [missing[digest] for digest in missing_hashes]
+
+    if jobs > 1 and len(missing_fnames) > 1:
+        pool = multiprocessing.Pool(min(jobs, len(missing_fnames)))
+        try:
+            scanned = pool.map(scan_file, missing_fnames, chunksize=8)
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        scanned = [scan_file(fname) for fname in missing_fnames]
+
+    results = dict(zip(missing_hashes, scanned))
+    return [(digest, cache[digest] if digest in cache else results[digest]) for digest in hashes]
+
+
+def load_scan_cache(cache_file):
+    # The cache is invalidated whenever this script changes, as the format or
+    # the semantics of the scan results may change with it.
+    try:
+        with open(cache_file, 'r') as cache_fp:
+            cache = json.load(cache_fp)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if cache.get('script') != hash_file(__file__):
+        return {}
+    return cache['files']
+
+
+def save_scan_cache(cache_file, cache):
+    cache_dir = os.path.dirname(cache_file)
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    with open(cache_file, 'w') as cache_fp:
+        json.dump({'script': hash_file(__file__), 'files': cache}, cache_fp)
+
+
+def extract_magic_string_refs(debug=False, cache_file=None, jobs=1):
     results = {}
 
-    def process_line(fname, lnum, line, guard_stack):
+    fnames = []
+    for root, _, files in os.walk(os.path.join(PROJECT_DIR, 'jerry-core')):
+        for fname in files:
+            if (fname.endswith('.c') or fname.endswith('.h')) \
+               and fname != 'lit-magic-strings.inc.h':
+                fnames.append(os.path.join(root, fname))
+
+    cache = load_scan_cache(cache_file) if cache_file else {}
+    scan_results = scan_files(fnames, cache, jobs)
+
+    if cache_file:
+        # Only the results of the current files are kept, so the cache does not grow indefinitely
+        save_scan_cache(cache_file, dict(scan_results))
+
+    for fname, (_, (refs, guard_stack)) in zip(fnames, scan_results):
         # Build `results` dictionary as
         #   results['LIT_MAGIC_STRING_xxx'][('!defined (CONFIG_DISABLE_yyy_BUILTIN)', ...)]
         #       = [('zzz.c', 123), ...]
         # meaning that the given literal is referenced under the given guards at
         # the listed (file, line number) locations.
-        for str_ref in re.findall('LIT_MAGIC_STRING_[a-zA-Z0-9_]+', line):
-            if str_ref in ['LIT_MAGIC_STRING_DEF',
-                           'LIT_MAGIC_STRING_FIRST_STRING_WITH_SIZE',
-                           'LIT_MAGIC_STRING_LENGTH_LIMIT',
-                           'LIT_MAGIC_STRING__COUNT']:
-                continue
-
-            guard_set = set()
-            for guards in guard_stack:
-                guard_set.update(guards)
-            guard_tuple = tuple(sorted(guard_set))
-
-            if str_ref not in results:
-                results[str_ref] = {}
-            str_guards = results[str_ref]
-
-            if guard_tuple not in str_guards:
-                str_guards[guard_tuple] = []
-            file_list = str_guards[guard_tuple]
-
-            file_list.append((fname, lnum))
-
-    def process_guard(guard):
-        # Transform `#ifndef MACRO` to `#if !defined (MACRO)` and
-        # `#ifdef MACRO` to `#if defined (MACRO)` to enable or-ing/and-ing the
-        # conditions later on.
-        if guard.startswith('ndef '):
-            guard = guard.replace('ndef ', '!defined (', 1) + ')'
-        elif guard.startswith('def '):
-            guard = guard.replace('def ', 'defined (', 1) + ')'
-        return guard
-
-    def process_file(fname):
-        # Builds `guard_stack` list for each line of a file as
-        #   [['!defined (CONFIG_DISABLE_yyy_BUILTIN)', ...], ...]
-        # meaning that all the listed guards (conditionals) have to hold for the
-        # line to be kept by the preprocessor.
-        guard_stack = []
-
-        for line in fileinput.input(fname):
-            if_match = re.match('^ *# *if(.*)', line)
-            elif_match = re.match('^ *# *elif(.*)', line)
-            else_match = re.match('^ *# *else', line)
-            endif_match = re.match('^ *# *endif', line)
-            if if_match is not None:
-                guard_stack.append([process_guard(if_match.group(1))])
-            elif elif_match is not None:
-                guards = guard_stack[-1]
-                guards[-1] = '!(%s)' % guards[-1].strip()
-                guards.append(process_guard(elif_match.group(1)))
-            elif else_match is not None:
-                guards = guard_stack[-1]
-                guards[-1] = '!(%s)' % guards[-1].strip()
-            elif endif_match is not None:
-                guard_stack.pop()
-
-            lnum = fileinput.filelineno()
-            process_line(fname, lnum, line, guard_stack)
+        for str_ref, guard_list, lnum in refs:
+            str_guards = results.setdefault(str_ref, {})
+            str_guards.setdefault(tuple(guard_list), []).append((fname, lnum))
 
         if guard_stack:
             print('warning: {fname}: unbalanced preprocessor conditional '
@@ -144,12 +233,6 @@ def extract_magic_string_refs(debug=False):
                   'for {guard_stack})'
                   .format(fname=fname, guard_stack=guard_stack))
 
-    for root, _, files in os.walk(os.path.join(PROJECT_DIR, 'jerry-core')):
-        for fname in files:
-            if (fname.endswith('.c') or fname.endswith('.h')) \
-               and fname != 'lit-magic-strings.inc.h':
-                process_file(os.path.join(root, fname))
-
     if debug:
         print('debug: magic string references: {dump}'
               .format(dump=debug_dump(results)))
@@ -192,6 +275,69 @@ def calculate_magic_string_guards(defs, uses, debug=False):
     return extended_defs
 
 
+def magic_string_hash(seed, str_value):
+    # Must be kept in sync with `lit_magic_string_hash_update` and
+    # `lit_magic_string_hash_lookup` in `jerry-core/lit/lit-magic-strings.c`.
+    hash_value = seed
+    for byte in bytearray(str_value.encode('utf-8')):
+        hash_value = ((hash_value ^ byte) * 16777619) & 0xffffffff
+    return hash_value ^ (hash_value >> 15)
+
+
+def place_magic_string_hash_buckets(defs, seed, bucket_count, slot_count):
+    # Try to find a displacement for every bucket of the hash table built with
+    # the given seed. Returns the displacements and the slots of the table, or
+    # None if no collision free placement was found.
+    buckets = [[] for _ in range(bucket_count)]
+    for str_def in defs:
+        hash_value = magic_string_hash(seed, str_def[1])
+        buckets[hash_value & (bucket_count - 1)].append(((hash_value >> 16) & (slot_count - 1), str_def))
+
+    slots = [None] * slot_count
+    displacements = [0] * bucket_count
+
+    # Place the largest buckets first, while there are many free slots
+    for bucket_idx in sorted(range(bucket_count), key=lambda idx: -len(buckets[idx])):
+        bucket = buckets[bucket_idx]
+        for displacement in range(slot_count):
+            bucket_slots = [hash_value ^ displacement for hash_value, _ in bucket]
+            if len(set(bucket_slots)) == len(bucket) and all(slots[slot] is None for slot in bucket_slots):
+                displacements[bucket_idx] = displacement
+                break
+        else:
+            return None
+
+        for slot, (_, str_def) in zip(bucket_slots, bucket):
+            slots[slot] = str_def
+
+    return displacements, slots
+
+
+def calculate_magic_string_hash(defs, debug=False):
+    # Calculate a perfect hash of all the magic strings using the hash and
+    # displace method: the strings are distributed into buckets by their hash
+    # values, and a displacement is searched for every bucket which moves the
+    # strings of the bucket into free slots of the hash table. Since the hash
+    # is perfect for all strings, it remains perfect for any subset selected by
+    # the guards, the slots of the disabled strings simply become empty.
+    slot_count = 1
+    while slot_count < len(defs) * 5 // 4:
+        slot_count *= 2
+    bucket_count = max(slot_count // 4, 1)
+
+    seed = 2166136261 # FNV-1a offset basis
+    placement = place_magic_string_hash_buckets(defs, seed, bucket_count, slot_count)
+    while placement is None:
+        seed += 1
+        placement = place_magic_string_hash_buckets(defs, seed, bucket_count, slot_count)
+
+    if debug:
+        print('debug: magic string hash: seed: {seed}, buckets: {buckets}, slots: {slots}'
+              .format(seed=seed, buckets=bucket_count, slots=slot_count))
+
+    return (seed,) + placement
+
+
 def guards_to_str(guards):
     return ' \\\n|| '.join(' && '.join(g.strip() for g in sorted(guard))
                            for guard in sorted(guards))
@@ -267,13 +413,59 @@ def generate_first_magic_strings(gen_file, defs):
             print('#endif', file=gen_file)
 
 
+def generate_magic_string_hash(gen_file, defs):
+    seed, displacements, slots = calculate_magic_string_hash(defs)
+
+    print(file=gen_file) # empty line separator
+    # The displacements are only valid with this seed, so it cannot be overridden.
+    print('#define LIT_MAGIC_STRING_HASH_SEED {seed:#x}u'.format(seed=seed), file=gen_file)
+
+    print(file=gen_file) # empty line separator
+    for displacement in displacements:
+        print('LIT_MAGIC_STRING_HASH_DISPLACEMENT ({displacement})'.format(displacement=displacement),
+              file=gen_file)
+
+    print(file=gen_file) # empty line separator
+    # Consecutive slots with the same guards are grouped, the slots of the
+    # disabled strings are filled with the LIT_MAGIC_STRING__COUNT marker.
+    groups = []
+    for str_def in slots:
+        guards = str_def[2] if str_def is not None else set([()])
+        if groups and groups[-1][0] == guards:
+            groups[-1][1].append(str_def)
+        else:
+            groups.append((guards, [str_def]))
+
+    for guards, group in groups:
+        if () not in guards:
+            print('#if {guards}'.format(guards=guards_to_str(guards)), file=gen_file)
+
+        for str_def in group:
+            str_ref = str_def[0] if str_def is not None else 'LIT_MAGIC_STRING__COUNT'
+            print('LIT_MAGIC_STRING_HASH_SLOT ({str_ref})'.format(str_ref=str_ref), file=gen_file)
+
+        if () not in guards:
+            print('#else', file=gen_file)
+            for _ in group:
+                print('LIT_MAGIC_STRING_HASH_SLOT (LIT_MAGIC_STRING__COUNT)', file=gen_file)
+            print('#endif', file=gen_file)
+
+
 def main():
     parser = argparse.ArgumentParser(description='lit-magic-strings.inc.h generator')
     parser.add_argument('--debug', action='store_true', help='enable debug output')
+    parser.add_argument('-j', '--jobs', metavar='N', type=int, default=multiprocessing.cpu_count(),
+                        help='number of files scanned in parallel (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='rescan every source file instead of reusing the cached results of unchanged files')
+    parser.add_argument('--cache-file', metavar='FILE', default=MAGIC_STRINGS_SCAN_CACHE,
+                        help='file storing the scan results of the source files (default: %(default)s)')
     args = parser.parse_args()
 
     defs = read_magic_string_defs(debug=args.debug)
-    uses = extract_magic_string_refs(debug=args.debug)
+    uses = extract_magic_string_refs(debug=args.debug,
+                                     cache_file=None if args.no_cache else args.cache_file,
+                                     jobs=args.jobs)
 
     extended_defs = calculate_magic_string_guards(defs, uses, debug=args.debug)
 
@@ -281,6 +473,7 @@ def main():
         generate_header(gen_file)
         generate_magic_string_defs(gen_file, extended_defs)
         generate_first_magic_strings(gen_file, extended_defs)
+        generate_magic_string_hash(gen_file, extended_defs)
 
 
 if __name__ == '__main__':
@@ -19,13 +19,40 @@ from __future__ import print_function
 import argparse
 import collections
 import hashlib
+import multiprocessing
+import multiprocessing.pool
 import os
 import platform
+import shutil
 import subprocess
 import sys
+import threading
 import settings
 
 OUTPUT_DIR = os.path.join(settings.PROJECT_DIR, 'build', 'tests')
+BUILD_CACHE_DIR = os.path.join(settings.PROJECT_DIR, 'build', 'build-cache')
+RESULT_CACHE_DIR = os.path.join(settings.PROJECT_DIR, 'build', 'tests', 'result-cache')
+
+# Inputs of the builds (relative to the project directory) which are covered by the build cache key
+BUILD_CACHE_SOURCES = [
+    'CMakeLists.txt',
+    'cmake',
+    'docs',
+    'jerry-core',
+    'jerry-ext',
+    'jerry-main',
+    'jerry-math',
+    'jerry-port',
+    'tests/unit-core',
+    'tests/unit-doc',
+    'tests/unit-ext',
+    'tests/unit-math',
+    'third-party',
+    'tools/amalgam.py',
+    'tools/build.py',
+    'tools/gen-doctest.py',
+    'tools/settings.py',
+]
 
 Options = collections.namedtuple('Options', ['name', 'build_args', 'test_args', 'skip'])
 Options.__new__.__defaults__ = ([], [], False)
@@ -75,6 +102,9 @@ JERRY_UNITTESTS_OPTIONS = [
     Options('unittests-es5.1-debug-math',
             OPTIONS_COMMON + OPTIONS_UNITTESTS + OPTIONS_PROFILE_ES51 + OPTIONS_DEBUG
             + ['--jerry-math=on']),
+    Options('unittests-es5.1-debug-magic_string_hash',
+            OPTIONS_COMMON + OPTIONS_UNITTESTS + OPTIONS_PROFILE_ES51 + OPTIONS_DEBUG
+            + ['--compile-flag=-DJERRY_LIT_MAGIC_STRING_HASH=1']),
 ]
 
 # Test options for jerry-tests
@@ -186,6 +216,25 @@ def get_arguments():
                         help='Add a comma separated list of patterns of the excluded JS-tests')
     parser.add_argument('--outdir', metavar='DIR', default=OUTPUT_DIR,
                         help='Specify output directory (default: %(default)s)')
+    parser.add_argument('-j', '--jobs', metavar='N', type=int, default=1,
+                        help='Number of parallel test jobs to run (0: cpu count, default: %(default)s)')
+    parser.add_argument('--build-jobs', metavar='N', type=int, default=1,
+                        help='Number of configurations to build concurrently, sharing the CPUs of the machine '
+                        '(default: %(default)s)')
+    parser.add_argument('--build-cache', action='store_true',
+                        help='Restore the binaries of builds with unchanged inputs from the persistent build cache')
+    parser.add_argument('--build-cache-dir', metavar='DIR', default=BUILD_CACHE_DIR,
+                        help='Directory of the build cache (default: %(default)s)')
+    parser.add_argument('--build-cache-size', metavar='MB', type=int, default=4096,
+                        help='Size limit of the build cache in megabytes (default: %(default)s)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only run the tests whose inputs changed since their last successful run')
+    parser.add_argument('--cache-dir', metavar='DIR', default=RESULT_CACHE_DIR,
+                        help='Directory of the test result cache of --incremental (default: %(default)s)')
+    parser.add_argument('--cache-size', metavar='MB', type=int, default=256,
+                        help='Size limit of the test result cache in megabytes (default: %(default)s)')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='Drop all cached test results before running the tests')
     parser.add_argument('--check-signed-off', metavar='TYPE', nargs='?',
                         choices=['strict', 'tolerant', 'gh-actions'], const='strict',
                         help='Run signed-off check (%(choices)s; default type if not given: %(const)s)')
@@ -236,9 +285,160 @@ def get_arguments():
         parser.print_help()
         sys.exit(1)
 
+    # The cache is cleared once here, the test runners of the jobs share it.
+    if script_args.clear_cache:
+        shutil.rmtree(script_args.cache_dir, ignore_errors=True)
+
+    if script_args.build_cache:
+        script_args.build_cache = BuildCache(script_args.build_cache_dir, script_args.build_cache_size)
+    else:
+        script_args.build_cache = None
+
     return script_args
 
+def hash_tree(hasher, base_dir, rel_path):
+    path = os.path.join(base_dir, rel_path)
+    if os.path.isfile(path):
+        hasher.update(rel_path.replace(os.path.sep, '/').encode('utf-8') + b'\0')
+        hasher.update(hash_binary(path).encode('utf-8'))
+        return
+
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            hash_tree(hasher, base_dir, os.path.relpath(os.path.join(root, name), base_dir))
+
+def copy_files(src_dir, dst_dir, file_filter=None):
+    for root, dirs, files in os.walk(src_dir):
+        if 'CMakeFiles' in dirs:
+            dirs.remove('CMakeFiles')
+        rel_root = os.path.relpath(root, src_dir)
+        for name in files:
+            if file_filter and not file_filter(name):
+                continue
+            dst_path = os.path.normpath(os.path.join(dst_dir, rel_root, name))
+            if not os.path.isdir(os.path.dirname(dst_path)):
+                os.makedirs(os.path.dirname(dst_path))
+            shutil.copy2(os.path.join(root, name), dst_path)
+
+def remove_files(root_dir, file_filter=None):
+    if not file_filter:
+        shutil.rmtree(root_dir, ignore_errors=True)
+        return
+
+    for root, dirs, files in os.walk(root_dir):
+        if 'CMakeFiles' in dirs:
+            dirs.remove('CMakeFiles')
+        for name in files:
+            if file_filter(name):
+                os.remove(os.path.join(root, name))
+
+class BuildCache(object):
+    """
+    Persistent, content-addressed cache of the installed outputs of the builds.
+
+    The key of an entry covers the build arguments, the toolchain, the version of the compiler and
+    the content of all the sources of the build. Every entry is a directory which contains a copy
+    of the install directory and the unit test binaries of a build. The least recently used entries
+    are evicted when the total size of the cache exceeds its limit.
+    """
+
+    # Build outputs stored in a cache entry: (sub-directory of the build directory, file filter)
+    OUTPUTS = [
+        ('local', None),
+        ('tests', lambda name: name.startswith('unit-')),
+    ]
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = cache_dir
+        self.max_size = max_size * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._base_hash = None
+
+    def _get_base_hash(self):
+        with self._lock:
+            if self._base_hash is None:
+                hasher = hashlib.sha1()
+                for rel_path in BUILD_CACHE_SOURCES:
+                    hash_tree(hasher, settings.PROJECT_DIR, rel_path)
+
+                try:
+                    compiler = os.environ.get('CC', 'cc')
+                    hasher.update(subprocess.check_output([compiler, '--version'], stderr=subprocess.STDOUT))
+                except (OSError, subprocess.CalledProcessError):
+                    pass
+
+                self._base_hash = hasher.hexdigest()
+        return self._base_hash
+
+    def get_key(self, binary_key, toolchain):
+        hasher = hashlib.sha1(self._get_base_hash().encode('utf-8'))
+        for arg in binary_key:
+            hasher.update(arg.encode('utf-8') + b'\0')
+        if toolchain and os.path.isfile(toolchain):
+            hasher.update(hash_binary(toolchain).encode('utf-8'))
+        return hasher.hexdigest()
+
+    def restore(self, key, build_dir_path):
+        entry_path = os.path.join(self.cache_dir, key)
+        if not os.path.isdir(entry_path):
+            with self._lock:
+                self.misses += 1
+            return False
+
+        # The outputs of an earlier build in the directory (e.g. of a removed unit test) must not remain
+        for (output_dir, file_filter) in self.OUTPUTS:
+            remove_files(os.path.join(build_dir_path, output_dir), file_filter)
+            copy_files(os.path.join(entry_path, output_dir), os.path.join(build_dir_path, output_dir))
+        os.utime(entry_path, None)
+
+        with self._lock:
+            self.hits += 1
+        sys.stderr.write('(restored from build cache: %s)\n' % entry_path)
+        return True
+
+    def store(self, key, build_dir_path):
+        entry_path = os.path.join(self.cache_dir, key)
+        tmp_path = '%s.tmp-%d-%d' % (entry_path, os.getpid(), threading.current_thread().ident)
+        for (output_dir, file_filter) in self.OUTPUTS:
+            copy_files(os.path.join(build_dir_path, output_dir), os.path.join(tmp_path, output_dir), file_filter)
+
+        try:
+            os.rename(tmp_path, entry_path)
+        except OSError:
+            # An equivalent entry has been stored in the meantime
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def evict(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.cache_dir):
+            entry_path = os.path.join(self.cache_dir, name)
+            size = 0
+            for root, _, files in os.walk(entry_path):
+                size += sum(os.path.getsize(os.path.join(root, file_name)) for file_name in files)
+            entries.append((os.path.getmtime(entry_path), size, entry_path))
+            total_size += size
+
+        entries.sort()
+        for (_, size, entry_path) in entries:
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= size
+
+    def report(self):
+        sys.stderr.write('%sBuild cache: %d hits, %d misses%s\n' % (TERM_BLUE, self.hits, self.misses, TERM_NORMAL))
+
 BINARY_CACHE = {}
+PENDING_BUILDS = {}
+# Set when the results of the scheduled builds are no longer needed
+BUILDS_CANCELLED = threading.Event()
 
 TERM_NORMAL = '\033[0m'
 TERM_YELLOW = '\033[1;33m'
@@ -263,7 +463,7 @@ def get_platform_cmd_prefix():
         return ['cmd', '/S', '/C']
     return []
 
-def create_binary(job, options):
+def get_build_command(job, options):
     build_args = job.build_args[:]
     if options.buildoptions:
         for option in options.buildoptions.split(','):
@@ -283,20 +483,82 @@ def create_binary(job, options):
     if options.toolchain:
         build_cmd.append('--toolchain=%s' % options.toolchain)
 
+    if options.build_jobs > 1:
+        # Concurrent builds share the usual job budget of a single build
+        build_cmd.append('--jobs=%d' % max(1, (multiprocessing.cpu_count() + 1) // options.build_jobs))
+
+    return build_cmd, tuple(sorted(build_args)), build_dir_path
+
+def build_binary(build_cmd, binary_key, build_dir_path, options):
+    if BUILDS_CANCELLED.is_set():
+        return 1, 'Build cancelled'
+
+    build_cache = options.build_cache
+    if build_cache:
+        cache_key = build_cache.get_key(binary_key, options.toolchain)
+        if build_cache.restore(cache_key, build_dir_path):
+            return 0, None
+
+    try:
+        subprocess.check_output(build_cmd)
+    except subprocess.CalledProcessError as err:
+        return err.returncode, err.output
+
+    if build_cache:
+        build_cache.store(cache_key, build_dir_path)
+    return 0, None
+
+def schedule_binaries(jobs, options):
+    """
+    Start building the binaries of the jobs in the background, so the builds overlap with each
+    other and with the testing of the binaries which are already built.
+    """
+    if options.build_jobs <= 1:
+        return
+
+    pool = multiprocessing.pool.ThreadPool(options.build_jobs)
+    for job in jobs:
+        if job.skip:
+            continue
+
+        build_cmd, binary_key, build_dir_path = get_build_command(job, options)
+        if binary_key not in BINARY_CACHE and binary_key not in PENDING_BUILDS:
+            build_args = (build_cmd, binary_key, build_dir_path, options)
+            PENDING_BUILDS[binary_key] = (build_dir_path, pool.apply_async(build_binary, build_args))
+
+    # Let the already submitted builds finish
+    pool.close()
+
+def cancel_pending_builds():
+    """
+    Cancel the scheduled builds which have not started yet and wait for the running ones, so no
+    build is left running in the background when the testing stops.
+    """
+    BUILDS_CANCELLED.set()
+    for (_, pending_build) in PENDING_BUILDS.values():
+        pending_build.wait()
+    PENDING_BUILDS.clear()
+
+def create_binary(job, options):
+    build_cmd, binary_key, build_dir_path = get_build_command(job, options)
+
     report_command('Build command:', build_cmd)
 
-    binary_key = tuple(sorted(build_args))
     if binary_key in BINARY_CACHE:
         ret, build_dir_path = BINARY_CACHE[binary_key]
         sys.stderr.write('(skipping: already built at %s with returncode %d)\n' % (build_dir_path, ret))
         return ret, build_dir_path
 
-    try:
-        subprocess.check_output(build_cmd)
-        ret = 0
-    except subprocess.CalledProcessError as err:
-        print(err.output)
-        ret = err.returncode
+    if binary_key in PENDING_BUILDS:
+        build_dir_path, pending_build = PENDING_BUILDS.pop(binary_key)
+        ret, output = pending_build.get()
+    else:
+        ret, output = build_binary(build_cmd, binary_key, build_dir_path, options)
+
+    if ret:
+        print(output)
+        # The testing stops at the first failed build
+        cancel_pending_builds()
 
     BINARY_CACHE[binary_key] = (ret, build_dir_path)
     return ret, build_dir_path
@@ -319,6 +581,7 @@ def iterate_test_runner_jobs(jobs, options):
     tested_paths = set()
     tested_hashes = {}
 
+    schedule_binaries(jobs, options)
     for job in jobs:
         ret_build, build_dir_path = create_binary(job, options)
         if ret_build:
@@ -357,7 +620,14 @@ def run_check(runnable, env=None):
     return proc.returncode
 
 def run_jerry_debugger_tests(options):
-    ret_build = ret_test = 0
+    ret_build = 0
+    schedule_binaries(DEBUGGER_TEST_OPTIONS, options)
+
+    # The unit tests of the debugger tools run against the stand-in server, so they do not need the engine.
+    ret_test = run_check(['python', '-m', 'unittest', 'discover',
+                          '-s', settings.DEBUGGER_UNITTESTS_DIR,
+                          '-t', os.path.dirname(settings.DEBUGGER_UNITTESTS_DIR)])
+
     for job in DEBUGGER_TEST_OPTIONS:
         ret_build, build_dir_path = create_binary(job, options)
         if ret_build:
@@ -384,6 +654,13 @@ def run_jerry_debugger_tests(options):
 
     return ret_build | ret_test
 
+def get_result_cache_args(options):
+    """ Arguments of the test runners which select the test result cache. """
+    if not options.incremental:
+        return []
+
+    return ['--incremental', '--cache-dir', options.cache_dir, '--cache-size', str(options.cache_size)]
+
 def run_jerry_tests(options):
     ret_build = ret_test = 0
     for job, ret_build, test_cmd in iterate_test_runner_jobs(JERRY_TESTS_OPTIONS, options):
@@ -396,6 +673,10 @@ def run_jerry_tests(options):
         if options.quiet:
             test_cmd.append("-q")
 
+        test_cmd.append('--jobs=%d' % options.jobs)
+
+        test_cmd.extend(get_result_cache_args(options))
+
         skip_list = []
 
         if '--profile=es.next' in job.build_args:
@@ -427,6 +708,7 @@ def run_test262_test_suite(options):
     if options.test262_esnext:
         jobs.extend(TEST262_ESNEXT_TEST_SUITE_OPTIONS)
 
+    schedule_binaries(jobs, options)
     for job in jobs:
         ret_build, build_dir_path = create_binary(job, options)
         if ret_build:
@@ -455,12 +737,15 @@ def run_test262_test_suite(options):
             test_cmd.append('--test262-test-list')
             test_cmd.append(options.test262_test_list)
 
+        test_cmd.extend(get_result_cache_args(options))
+
         ret_test |= run_check(test_cmd, env=dict(TZ='America/Los_Angeles'))
 
     return ret_build | ret_test
 
 def run_unittests(options):
     ret_build = ret_test = 0
+    schedule_binaries(JERRY_UNITTESTS_OPTIONS, options)
     for job in JERRY_UNITTESTS_OPTIONS:
         if job.skip:
             report_skip(job)
@@ -483,12 +768,14 @@ def run_unittests(options):
             get_platform_cmd_prefix() +
             [settings.UNITTEST_RUNNER_SCRIPT] +
             [os.path.join(build_dir_path, 'tests', build_config)] +
-            (["-q"] if options.quiet else [])
+            (["-q"] if options.quiet else []) +
+            get_result_cache_args(options)
         )
 
     return ret_build | ret_test
 
 def run_buildoption_test(options):
+    schedule_binaries(JERRY_BUILDOPTIONS, options)
     for job in JERRY_BUILDOPTIONS:
         if job.skip:
             report_skip(job)
@@ -520,11 +807,20 @@ def main(options):
         Check(options.buildoption_test, run_buildoption_test, options),
     ]
 
+    ret = 0
     for check in checks:
         if check.enabled or options.all:
             ret = check.runner(check.arg)
             if ret:
-                sys.exit(ret)
+                break
+
+    cancel_pending_builds()
+
+    if options.build_cache:
+        options.build_cache.evict()
+        options.build_cache.report()
+
+    sys.exit(ret)
 
 if __name__ == "__main__":
     main(get_arguments())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+
+# Copyright JS Foundation and other contributors, http://js.foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+PROJECT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_DIR, 'build', 'tests', 'result-cache')
+DEFAULT_CACHE_SIZE = 256 # in megabytes
+
+
+def add_arguments(parser):
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse cached results of tests whose inputs did not change')
+    parser.add_argument('--cache-dir', metavar='DIR', default=DEFAULT_CACHE_DIR,
+                        help='Directory of the test result cache (default: %(default)s)')
+    parser.add_argument('--cache-size', metavar='MB', type=int, default=DEFAULT_CACHE_SIZE,
+                        help='Size limit of the test result cache in megabytes (default: %(default)s)')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='Drop all cached test results before running the tests')
+
+
+def hash_file(path):
+    blocksize = 65536
+    hasher = hashlib.sha1()
+    with open(path, 'rb') as input_file:
+        buf = input_file.read(blocksize)
+        while buf:
+            hasher.update(buf)
+            buf = input_file.read(blocksize)
+    return hasher.hexdigest()
+
+
+def hash_command(command):
+    """
+    Compute the hash of a command line, including the content of the files it refers to.
+
+    :param command: list of command line arguments
+    :returns string: hex digest of the command
+    """
+    hasher = hashlib.sha1()
+    for arg in command:
+        hasher.update(arg.encode('utf-8') + b'\0')
+        if os.path.isfile(arg):
+            hasher.update(hash_file(arg).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+class ResultCache(object):
+    """
+    Persistent, size-bounded store of test results.
+
+    Every entry is a small JSON file whose name is derived from all the inputs of a test run
+    (engine binary, test content, command line options and environment), so an entry can never
+    be reused for a different input. The access time of the entries is tracked with the file
+    modification time and the least recently used entries are evicted first.
+    """
+
+    def __init__(self, cache_dir, max_size, *key_parts):
+        self.cache_dir = cache_dir
+        self.max_size = max_size * 1024 * 1024
+        self.hits = 0
+        self._base_key = self._hash_parts(key_parts)
+
+    @staticmethod
+    def _hash_parts(parts):
+        hasher = hashlib.sha1()
+        for part in parts:
+            if not isinstance(part, bytes):
+                part = str(part).encode('utf-8')
+            hasher.update(part + b'\0')
+        return hasher.hexdigest()
+
+    def make_key(self, *key_parts):
+        return self._hash_parts((self._base_key,) + key_parts)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + '.json')
+
+    def get(self, key):
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r') as entry_file:
+                result = json.load(entry_file)
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            return None
+
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        try:
+            data = json.dumps(result)
+        except (TypeError, ValueError):
+            # e.g. the output of the test is not valid UTF-8, simply do not cache the result
+            return
+
+        path = self._entry_path(key)
+        entry_dir = os.path.dirname(path)
+        if not os.path.isdir(entry_dir):
+            try:
+                os.makedirs(entry_dir)
+            except OSError:
+                if not os.path.isdir(entry_dir):
+                    raise
+
+        # Write into a temporary file first, so concurrent runners never see partial entries
+        (file_desc, tmp_path) = tempfile.mkstemp(suffix='.tmp', dir=entry_dir)
+        with os.fdopen(file_desc, 'w') as entry_file:
+            entry_file.write(data)
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(tmp_path, path)
+
+    def evict(self):
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+
+        entries.sort()
+        for (_, size, path) in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_size -= size
+
+    def report(self, total):
+        print("Results from cache: %d, fresh runs: %d\n" % (self.hits, total - self.hits))
+
+
+def create_cache(args, *key_parts):
+    """
+    Create the result cache requested by the command line arguments.
+
+    :param args: parsed arguments of the runner (see add_arguments)
+    :param key_parts: inputs shared by all tests of the run
+    :returns ResultCache: the cache or None if incremental testing is disabled
+    """
+    if args.clear_cache:
+        shutil.rmtree(args.cache_dir, ignore_errors=True)
+
+    if not args.incremental:
+        return None
+
+    return ResultCache(args.cache_dir, args.cache_size, *key_parts)
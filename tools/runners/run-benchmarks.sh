@@ -41,6 +41,7 @@ run jerry/empty_loop
 run jerry/function_loop
 run jerry/loop_arithmetics_10kk
 run jerry/loop_arithmetics_1kk
+run jerry/parse_magic_strings
 
 echo "Running UBench:"
 run ubench/function-closure
@@ -35,6 +35,12 @@ else
   START_DEBUG_SERVER="${JERRY} ${TEST_CASE}.js --start-debug-server --debug-channel ${CHANNEL} &"
 fi
 
+if [[ $TEST_CASE == *"replay"* ]]; then
+  # The recorded session is replayed without an engine, followed by the stored recording of the channel.
+  RECORD_TEMP=`mktemp ${TEST_CASE}.rec.XXXXXXXXXX`
+  CLIENT_ARGS="--record ${RECORD_TEMP}"
+fi
+
 echo "$START_DEBUG_SERVER"
 eval "$START_DEBUG_SERVER"
 sleep 1s
@@ -48,6 +54,13 @@ if [[ $TEST_CASE == *"restart"* ]]; then
   (cat "${CONTINUE_CASE}.cmd" | ${DEBUGGER_CLIENT} --channel ${CHANNEL} --non-interactive ${CLIENT_ARGS}) >>${RESULT_TEMP} 2>&1
 fi
 
+if [[ $TEST_CASE == *"replay"* ]]; then
+  for RECORDING in ${RECORD_TEMP} ${TEST_CASE}_${CHANNEL}.rec; do
+    (cat "${TEST_CASE}.cmd" | ${DEBUGGER_CLIENT} --non-interactive --replay ${RECORDING}) >>${RESULT_TEMP} 2>&1
+  done
+  rm -f ${RECORD_TEMP}
+fi
+
 diff -U0 ${TEST_CASE}.expected ${RESULT_TEMP}
 STATUS_CODE=$?
 
@@ -22,6 +22,7 @@ import shutil
 import subprocess
 import sys
 
+import result_cache
 import util
 
 def get_platform_cmd_prefix():
@@ -52,6 +53,12 @@ def get_arguments():
                        'all: all tests, update: all tests and update excludelist')
     parser.add_argument('--test262-test-list', metavar='LIST',
                         help='Add a comma separated list of tests or directories to run in test262 test suite')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse cached results of tests whose inputs did not change (not supported by ES5.1)')
+    parser.add_argument('--cache-dir', metavar='DIR', default=result_cache.DEFAULT_CACHE_DIR,
+                        help='Directory of the test result cache (default: %(default)s)')
+    parser.add_argument('--cache-size', metavar='MB', type=int, default=result_cache.DEFAULT_CACHE_SIZE,
+                        help='Size limit of the test result cache in megabytes (default: %(default)s)')
 
     args = parser.parse_args()
 
@@ -192,6 +199,9 @@ def main(args):
     if 'excludelist_path' in args and args.mode == 'default':
         test262_command.extend(['--exclude-list', args.excludelist_path])
 
+    if args.incremental and not args.es51:
+        test262_command.extend(['--incremental', '--cache-dir', args.cache_dir, '--cache-size', str(args.cache_size)])
+
     if args.test262_test_list:
         test262_command.extend(args.test262_test_list.split(','))
 
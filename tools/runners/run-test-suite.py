@@ -16,10 +16,16 @@
 
 from __future__ import print_function
 import argparse
+import functools
+import multiprocessing
 import os
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
 
+import result_cache
 import util
 
 def get_arguments():
@@ -39,6 +45,10 @@ def get_arguments():
                         help='Directory contains tests to run')
     parser.add_argument('--snapshot', action='store_true',
                         help='Snapshot test')
+    parser.add_argument('-j', '--jobs', metavar='N', type=int, default=1,
+                        help='Number of parallel test jobs to run. In case of \'0\' cpu count is used. '
+                        '(default: %(default)s)')
+    result_cache.add_arguments(parser)
 
     script_args = parser.parse_args()
     if script_args.skip_list:
@@ -91,6 +101,88 @@ def execute_test_command(test_cmd):
     return (process.returncode, stdout)
 
 
+def pool_init():
+    """Ignore CTRL+C in the worker process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def imap_tests(runner, tests, jobs):
+    """Apply runner to every test and yield the results in the order of tests."""
+    if jobs == 1:
+        for test in tests:
+            yield runner(test)
+        return
+
+    if jobs == 0:
+        jobs = None # uses multiprocessing.cpu_count()
+
+    pool = multiprocessing.Pool(processes=jobs, initializer=pool_init)
+    try:
+        for result in pool.imap(runner, tests):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def imap_cached_tests(runner, tests, jobs, cache, keys):
+    """
+    Same as imap_tests, but the results found in the cache are not computed again. Generates
+    (result, key) pairs, where the key is None if the result must not be stored in the cache
+    (e.g. it is already there).
+    """
+    if cache is None:
+        return ((result, None) for result in imap_tests(runner, tests, jobs))
+
+    cached_results = [cache.get(key) if key else None for key in keys]
+    fresh_tests = [test for (test, result) in zip(tests, cached_results) if result is None]
+    fresh_results = imap_tests(runner, fresh_tests, jobs)
+    return ((result, None) if result is not None else (next(fresh_results), key)
+            for (result, key) in zip(cached_results, keys))
+
+
+def get_test_keys(cache, test_cmd, tests):
+    if cache is None:
+        return [None] * len(tests)
+
+    cmd_hash = result_cache.hash_command(test_cmd)
+    # Modules may import other files, so their results are never cached
+    return [None if test.endswith('.mjs') else cache.make_key(cmd_hash, result_cache.hash_file(test))
+            for test in tests]
+
+
+def run_normal_test(test_cmd, test):
+    test_argument = []
+    if test.endswith('.mjs'):
+        test_argument.extend(['-m'])
+
+    return execute_test_command(test_cmd + test_argument + [test])
+
+
+def create_snapshot_scratch_dir():
+    # Snapshot files are short-lived, so prefer a memory backed file system if there is one
+    shm_dir = '/dev/shm'
+    if os.path.isdir(shm_dir) and os.access(shm_dir, os.W_OK):
+        return tempfile.mkdtemp(prefix='jerry-snapshot-', dir=shm_dir)
+    return tempfile.mkdtemp(prefix='jerry-snapshot-')
+
+
+def run_snapshot_test(generate_snapshot_cmd, execute_snapshot_cmd, scratch_dir, test):
+    # Every worker runs one test at a time, so the process id makes the snapshot name unique
+    snapshot_path = os.path.join(scratch_dir, 'js-%d.snapshot' % os.getpid())
+    try:
+        generate_result = execute_test_command(generate_snapshot_cmd + ['-o', snapshot_path, test])
+        if generate_result[0]:
+            return (generate_result, None)
+
+        execute_result = execute_test_command(execute_snapshot_cmd + ['--exec-snapshot', snapshot_path,
+                                                                      '--call-on-exit', '__checkAsync'])
+        return (generate_result, execute_result)
+    finally:
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+
+
 def main(args):
     tests = get_tests(args.test_dir, args.test_list, args.skip_list)
     total = len(tests)
@@ -103,10 +195,12 @@ def main(args):
         util.set_sighdl_to_reset_timezone(original_timezone)
         util.set_timezone('UTC')
 
+    cache = result_cache.create_cache(args, 'TZ=%s' % os.environ.get('TZ'), args.runtime, args.snapshot)
+
     if args.snapshot:
-        passed = run_snapshot_tests(args, tests)
+        passed = run_snapshot_tests(args, tests, cache)
     else:
-        passed = run_normal_tests(args, tests)
+        passed = run_normal_tests(args, tests, cache)
 
     if sys.platform == 'win32':
         util.set_timezone(original_timezone)
@@ -122,10 +216,14 @@ def main(args):
         summary_list.append(os.path.relpath(args.test_list))
     util.print_test_summary(' '.join(summary_list), total, passed, failed)
 
+    if cache:
+        cache.evict()
+        cache.report(total)
+
     return bool(failed)
 
 
-def run_normal_tests(args, tests):
+def run_normal_tests(args, tests, cache):
     test_cmd = get_platform_cmd_prefix()
     if args.runtime:
         test_cmd.append(args.runtime)
@@ -134,19 +232,18 @@ def run_normal_tests(args, tests):
     total = len(tests)
     tested = 0
     passed = 0
+    keys = get_test_keys(cache, test_cmd, tests)
+    results = imap_cached_tests(functools.partial(run_normal_test, test_cmd), tests, args.jobs, cache, keys)
     for test in tests:
+        ((returncode, stdout), key) = next(results)
         tested += 1
         test_path = os.path.relpath(test)
         is_expected_to_fail = os.path.join(os.path.sep, 'fail', '') in test
 
-        test_argument = []
-        if test.endswith('.mjs'):
-            test_argument.extend(['-m'])
-
-        (returncode, stdout) = execute_test_command(test_cmd + test_argument + [test])
-
         if (returncode == 0 and not is_expected_to_fail) or (returncode == 1 and is_expected_to_fail):
             passed += 1
+            if key:
+                cache.put(key, (returncode, stdout))
             if not args.quiet:
                 passed_string = 'PASS' + (' (XFAIL)' if is_expected_to_fail else '')
                 util.print_test_result(tested, total, True, passed_string, test_path)
@@ -160,29 +257,42 @@ def run_normal_tests(args, tests):
     return passed
 
 
-def run_snapshot_tests(args, tests):
+def run_snapshot_tests(args, tests, cache):
     execute_snapshot_cmd = get_platform_cmd_prefix()
     generate_snapshot_cmd = get_platform_cmd_prefix()
     if args.runtime:
         execute_snapshot_cmd.append(args.runtime)
         generate_snapshot_cmd.append(args.runtime)
 
-    execute_snapshot_cmd.extend([args.engine, '--exec-snapshot', 'js.snapshot'])
-    execute_snapshot_cmd.extend(['--call-on-exit', '__checkAsync'])
+    execute_snapshot_cmd.append(args.engine)
 
     # engine: jerry[.exe] -> snapshot generator: jerry-snapshot[.exe]
     engine = os.path.splitext(args.engine)
     generate_snapshot_cmd.append(engine[0] + '-snapshot' + engine[1])
     generate_snapshot_cmd.append('generate')
 
+    scratch_dir = create_snapshot_scratch_dir()
+    try:
+        # The workers of the pool form the pipeline: while one of them executes the snapshot
+        # of a test, the others are already generating the snapshots of the following tests.
+        runner = functools.partial(run_snapshot_test, generate_snapshot_cmd, execute_snapshot_cmd, scratch_dir)
+        keys = get_test_keys(cache, generate_snapshot_cmd + execute_snapshot_cmd, tests)
+        results = imap_cached_tests(runner, tests, args.jobs, cache, keys)
+        return report_snapshot_tests(args, tests, results, cache)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+def report_snapshot_tests(args, tests, results, cache):
     total = len(tests)
     tested = 0
     passed = 0
     for test in tests:
+        (result, key) = next(results)
+        ((returncode, stdout), execute_result) = result
         tested += 1
         test_path = os.path.relpath(test)
         is_expected_to_fail = os.path.join(os.path.sep, 'fail', '') in test
-        (returncode, stdout) = execute_test_command(generate_snapshot_cmd + [test])
 
         if (returncode == 0) or (returncode == 1 and is_expected_to_fail):
             if not args.quiet:
@@ -197,13 +307,16 @@ def run_snapshot_tests(args, tests):
         if returncode:
             if is_expected_to_fail:
                 passed += 1
+                if key:
+                    cache.put(key, result)
             continue
 
-        (returncode, stdout) = execute_test_command(execute_snapshot_cmd)
-        os.remove('js.snapshot')
+        (returncode, stdout) = execute_result
 
         if (returncode == 0 and not is_expected_to_fail) or (returncode == 1 and is_expected_to_fail):
             passed += 1
+            if key:
+                cache.put(key, result)
             if not args.quiet:
                 passed_string = 'PASS' + (' (XFAIL)' if is_expected_to_fail else '')
                 util.print_test_result(tested, total, True, passed_string, test_path, False)
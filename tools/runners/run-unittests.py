@@ -21,6 +21,7 @@ import os
 import subprocess
 import sys
 
+import result_cache
 import util
 
 
@@ -33,6 +34,7 @@ def get_arguments():
                         help='Execution runtime (e.g. qemu)')
     parser.add_argument('path',
                         help='Path of test binaries')
+    result_cache.add_arguments(parser)
 
     script_args = parser.parse_args()
     return script_args
@@ -57,6 +59,7 @@ def main(args):
         return 1
 
     test_cmd = [args.runtime] if args.runtime else []
+    cache = result_cache.create_cache(args, 'TZ=%s' % os.environ.get('TZ'), result_cache.hash_command(test_cmd))
 
     tested = 0
     passed = 0
@@ -64,8 +67,12 @@ def main(args):
     for test in unittests:
         tested += 1
         test_path = os.path.relpath(test)
+        key = cache.make_key(result_cache.hash_file(test)) if cache else None
         try:
-            subprocess.check_output(test_cmd + [test], stderr=subprocess.STDOUT, universal_newlines=True)
+            if not key or cache.get(key) is None:
+                subprocess.check_output(test_cmd + [test], stderr=subprocess.STDOUT, universal_newlines=True)
+                if key:
+                    cache.put(key, 0)
             passed += 1
             if not args.quiet:
                 util.print_test_result(tested, total, True, 'PASS', test_path)
@@ -78,6 +85,10 @@ def main(args):
 
     util.print_test_summary(os.path.join(os.path.relpath(args.path), "unit-*"), total, passed, failed)
 
+    if cache:
+        cache.evict()
+        cache.report(total)
+
     if failed > 0:
         return 1
     return 0
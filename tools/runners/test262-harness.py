@@ -58,6 +58,8 @@ import signal
 import threading
 import multiprocessing
 
+import result_cache
+
 #######################################################################
 # based on _monkeyYaml.py
 #######################################################################
@@ -369,6 +371,14 @@ def build_options():
                       help="List includes required by tests")
     result.add_option("--module-flag", default="-m",
                       help="List includes required by tests")
+    result.add_option("--incremental", default=False, action="store_true",
+                      help="Reuse cached results of tests whose inputs did not change")
+    result.add_option("--cache-dir", default=result_cache.DEFAULT_CACHE_DIR,
+                      help="Directory of the test result cache")
+    result.add_option("--cache-size", default=result_cache.DEFAULT_CACHE_SIZE, action="store", type=int,
+                      help="Size limit of the test result cache in megabytes")
+    result.add_option("--clear-cache", default=False, action="store_true",
+                      help="Drop all cached test results before running the tests")
     return result
 
 
@@ -836,7 +846,30 @@ class TestSuite(object):
             print("")
             result.report_outcome(False)
 
-    def run(self, command_template, tests, print_summary, full_summary, logname, job_count=1):
+    @staticmethod
+    def get_cache_key(cache, case):
+        # Modules may import fixture files, so their results are never cached
+        if case.is_module():
+            return None
+        return cache.make_key(case.get_name(), case.get_mode(), case.get_source())
+
+    def run_cached(self, cases, cache, logname, progress):
+        fresh_cases = []
+        for case in cases:
+            key = TestSuite.get_cache_key(cache, case)
+            cached_result = cache.get(key) if key else None
+            if cached_result is None:
+                fresh_cases.append((case, key))
+                continue
+
+            (exit_code, stdout, stderr) = cached_result
+            result = TestResult(exit_code, stdout, stderr, case)
+            if logname:
+                self.write_log(result)
+            progress.has_run(result)
+        return fresh_cases
+
+    def run(self, command_template, tests, print_summary, full_summary, logname, job_count=1, cache=None):
         if not "{{path}}" in command_template:
             command_template += " {{path}}"
         cases = self.enumerate_tests(tests, command_template)
@@ -846,22 +879,31 @@ class TestSuite(object):
         if logname:
             self.logf = open(logname, "w")
 
+        if cache:
+            fresh_cases = self.run_cached(cases, cache, logname, progress)
+            keys = [key for (_, key) in fresh_cases]
+            cases = [case for (case, _) in fresh_cases]
+        else:
+            keys = [None] * len(cases)
+
+        def case_finished(result, key):
+            if logname:
+                self.write_log(result)
+            progress.has_run(result)
+            if key and not result.has_unexpected_outcome():
+                cache.put(key, (result.exit_code, result.stdout, result.stderr))
+
         if job_count == 1:
-            for case in cases:
-                result = case.run()
-                if logname:
-                    self.write_log(result)
-                progress.has_run(result)
+            for (case, key) in zip(cases, keys):
+                case_finished(case.run(), key)
         else:
             if job_count == 0:
                 job_count = None # uses multiprocessing.cpu_count()
 
             pool = multiprocessing.Pool(processes=job_count, initializer=pool_init)
             try:
-                for result in pool.imap(test_case_run_process, cases):
-                    if logname:
-                        self.write_log(result)
-                    progress.has_run(result)
+                for (index, result) in enumerate(pool.imap(test_case_run_process, cases)):
+                    case_finished(result, keys[index])
             except KeyboardInterrupt:
                 pool.terminate()
                 pool.join()
@@ -874,6 +916,9 @@ class TestSuite(object):
                 print("")
                 print("Use --full-summary to see output from failed tests")
         print("")
+        if cache:
+            cache.evict()
+            cache.report(progress.count)
         return progress.failed
 
     def write_log(self, result):
@@ -934,11 +979,14 @@ def main():
     elif options.list_includes:
         test_suite.list_includes(args)
     else:
+        cache = result_cache.create_cache(options, 'TZ=%s' % os.environ.get('TZ'),
+                                          result_cache.hash_command(options.command.split(" ")))
         code = test_suite.run(options.command, args,
                               options.summary or options.full_summary,
                               options.full_summary,
                               options.logname,
-                              options.job_count)
+                              options.job_count,
+                              cache)
     return code
 
 
@@ -19,6 +19,7 @@ from os import path
 TOOLS_DIR = path.dirname(path.abspath(__file__))
 PROJECT_DIR = path.normpath(path.join(TOOLS_DIR, '..'))
 DEBUGGER_TESTS_DIR = path.join(PROJECT_DIR, 'tests/debugger')
+DEBUGGER_UNITTESTS_DIR = path.join(PROJECT_DIR, 'jerry-debugger/tests')
 JERRY_TESTS_DIR = path.join(PROJECT_DIR, 'tests/jerry')
 TEST262_TEST_SUITE_DIR = path.join(PROJECT_DIR, 'tests/test262')
 